@@ -0,0 +1,239 @@
+"""Offline benchmark harness for the repath pipeline.
+
+    python benchmarks/bench.py                      # run, compare against baseline.json
+    python benchmarks/bench.py --save-baseline      # run and store results as the new baseline
+    python benchmarks/bench.py --scale large --only wad_read bin_read
+
+Every benchmark is timed `--repeat` times on a seeded synthetic corpus and the
+median is compared with benchmarks/baseline.json. A benchmark regresses when its
+median is more than `--threshold` (fraction) slower than the baseline; the exit
+code is 1 if anything regressed so it can gate a commit.
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import corpus
+from corpus import REPO_ROOT
+
+import pyRitoFile
+from pyRitoFile.stream import BytesStream
+
+BENCH_DIR = Path(__file__).resolve().parent
+BASELINE_FILE = BENCH_DIR / 'baseline.json'
+LAST_RUN_FILE = BENCH_DIR / 'last_run.json'
+
+SCALES = {
+    'small': dict(wad_chunks=500, chunk_size=2048, bin_entries=20, bin_depth=2, asset_count=30, tex_size=256),
+    'medium': dict(wad_chunks=3000, chunk_size=4096, bin_entries=100, bin_depth=3, asset_count=150, tex_size=1024),
+    'large': dict(wad_chunks=20000, chunk_size=8192, bin_entries=500, bin_depth=3, asset_count=600, tex_size=2048),
+}
+
+
+def load_app(hashes_root):
+    """A WizardApp without Tk: only the pipeline methods are exercised."""
+    # keep hash files and config away from the real AppData folder
+    os.environ['APPDATA'] = str(hashes_root)
+    sys.path.insert(0, str(REPO_ROOT))
+    import fantome_repath_gui
+    app = fantome_repath_gui.WizardApp.__new__(fantome_repath_gui.WizardApp)
+    app._used_prefix = 'bench'
+    return fantome_repath_gui, app
+
+
+class Bench:
+    def __init__(self, args, work):
+        self.args = args
+        self.work = Path(work)
+        self.gui, self.app = load_app(self.work / 'appdata')
+        self.benchmarks = {}
+
+    def register(self, name, func, setup=None):
+        if self.args.only and name not in self.args.only:
+            return
+        self.benchmarks[name] = (func, setup)
+
+    def run(self):
+        results = {}
+        for name, (func, setup) in self.benchmarks.items():
+            times = []
+            for _ in range(self.args.repeat):
+                state = setup() if setup else None
+                start = time.perf_counter()
+                func(state)
+                times.append(time.perf_counter() - start)
+            results[name] = {
+                'median': statistics.median(times),
+                'min': min(times),
+                'runs': len(times),
+            }
+            print(f'{name:<24} median {results[name]["median"]*1000:10.2f} ms   min {results[name]["min"]*1000:10.2f} ms')
+        return results
+
+    # ---------- corpus ----------
+    def build_corpus(self):
+        a = self.args
+        started = time.perf_counter()
+        self.wad_path = corpus.make_wad(
+            self.work / 'bench.wad.client', a.wad_chunks, a.chunk_size, a.compression, seed=a.seed)
+        self.bin_obj = corpus.make_bin(
+            entry_count=a.bin_entries, depth=a.bin_depth, string_density=a.string_density,
+            asset_count=a.asset_count, seed=a.seed)
+        self.bin_path = self.work / 'bench.bin'
+        self.bin_obj.write(str(self.bin_path))
+        self.mod_dir = self.work / 'mod'
+        self.main_bin = corpus.make_mod_tree(
+            self.mod_dir, entry_count=a.bin_entries, depth=a.bin_depth, string_density=a.string_density,
+            asset_count=a.asset_count, seed=a.seed)
+        self.tex_path = corpus.make_tex(self.work / 'bench.tex', a.tex_size, a.tex_size, 'DXT5', seed=a.seed)
+        self.dds_path = corpus.make_dds(self.work / 'bench.dds', self.tex_path, self.app)
+        print(f'corpus built in {time.perf_counter() - started:.2f}s at {self.work}')
+
+    # ---------- benchmarks ----------
+    def register_all(self):
+        W = pyRitoFile.wad
+        B = pyRitoFile.bin
+
+        self.register('wad_read', lambda _: W.WAD().read(str(self.wad_path)))
+        self.register('wad_read_int', lambda _: W.WAD().read(str(self.wad_path), int_hashes=True))
+
+        def read_data(wad):
+            with BytesStream.reader(str(self.wad_path)) as bs:
+                for chunk in wad.chunks:
+                    chunk.read_data(bs)
+                    chunk.free_data()
+        self.register('wad_read_data', read_data, setup=lambda: W.WAD().read(str(self.wad_path)))
+
+        # every chunk resolvable plus as many unrelated entries, like a full game table
+        hashtables = {'hashes.game.txt': {
+            W.WADHasher.raw_to_hex(path): path
+            for i in range(self.args.wad_chunks)
+            for path in (corpus.asset_path(i), corpus.asset_path(i, 'bin'))
+        }}
+        self.register('wad_un_hash', lambda wad: wad.un_hash(hashtables), setup=lambda: W.WAD().read(str(self.wad_path)))
+        compiled = W.WADHashTable.compile(hashtables)
+        self.register('wad_un_hash_compiled', lambda wad: wad.un_hash(compiled), setup=lambda: W.WAD().read(str(self.wad_path)))
+
+        self.register('bin_read', lambda _: B.BIN().read(str(self.bin_path)))
+        self.register('bin_read_int', lambda _: B.BIN().read(str(self.bin_path), int_hashes=True))
+        self.register('bin_write', lambda _: self.bin_obj.write('', raw=True))
+
+        def new_bum():
+            bum = self.gui.WizardApp._LocalBum(REPO_ROOT, custom_prefix='bench')
+            bum.add_source_dirs([str(self.mod_dir)])
+            bum.source_bins[bum.unify_path(self.main_bin)] = True
+            return bum
+        self.register('bum_scan', lambda bum: bum.scan(), setup=new_bum)
+
+        def scanned_bum():
+            bum = new_bum()
+            bum.scan()
+            return bum
+        repathed = self.work / 'repathed'
+        self.register('bum_bum', lambda bum: bum.bum(str(repathed), ignore_missing=True, combine_linked=True), setup=scanned_bum)
+        workers = os.cpu_count() or 1
+        self.register('bum_bum_pool', lambda bum: bum.bum(str(repathed), ignore_missing=True, combine_linked=True, workers=workers), setup=scanned_bum)
+        self.register('bum_repath', lambda bum: bum.repath(str(repathed), ignore_missing=True, combine_linked=True), setup=new_bum)
+
+        def repathed_tree():
+            if not repathed.exists():
+                scanned_bum().bum(str(repathed), ignore_missing=True, combine_linked=True)
+            # every run starts cold, like the first check after a repath
+            self.app._bin_cache = self.gui.WizardApp._BinCache()
+        self.register('pyntex_check_dir', lambda _: self.app._pyntex_check_dir(repathed), setup=repathed_tree)
+
+        self.register('pack_wad', lambda _: self.app._pack_wad(self.mod_dir, self.work / 'packed.wad.client'))
+        self.register('tex2dds', lambda _: self.app._tex2dds(self.tex_path, self.work / 'out.dds'))
+        self.register('dds2tex', lambda _: self.app._dds2tex(self.dds_path, self.work / 'out.tex'))
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get('results', {}).get(name)
+        if not base:
+            continue
+        ratio = result['median'] / base['median'] if base['median'] > 0 else 1.0
+        mark = ''
+        if ratio > 1 + threshold:
+            mark = '  REGRESSION'
+            regressions.append(name)
+        elif ratio < 1 - threshold:
+            mark = '  faster'
+        print(f'{name:<24} {ratio:6.2f}x of baseline{mark}')
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', choices=SCALES, default='small')
+    parser.add_argument('--wad-chunks', type=int)
+    parser.add_argument('--chunk-size', type=int)
+    parser.add_argument('--compression', choices=corpus.COMPRESSIONS, default='zstd')
+    parser.add_argument('--bin-entries', type=int)
+    parser.add_argument('--bin-depth', type=int)
+    parser.add_argument('--string-density', type=float, default=0.4)
+    parser.add_argument('--asset-count', type=int, help='distinct asset paths mentioned by the BINs')
+    parser.add_argument('--tex-size', type=int)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--threshold', type=float, default=0.2, help='allowed slowdown vs baseline (0.2 = 20%%)')
+    parser.add_argument('--only', nargs='+', help='run only these benchmarks')
+    parser.add_argument('--baseline', type=Path, default=BASELINE_FILE)
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--keep', action='store_true', help='keep the generated corpus')
+    args = parser.parse_args()
+    for key, value in SCALES[args.scale].items():
+        if getattr(args, key) is None:
+            setattr(args, key, value)
+
+    work = tempfile.mkdtemp(prefix='repath_bench_')
+    try:
+        bench = Bench(args, work)
+        bench.build_corpus()
+        bench.register_all()
+        results = bench.run()
+    finally:
+        if not args.keep:
+            shutil.rmtree(work, ignore_errors=True)
+
+    report = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'corpus': {key: getattr(args, key) for key in (
+            'scale', 'wad_chunks', 'chunk_size', 'compression', 'bin_entries',
+            'bin_depth', 'string_density', 'asset_count', 'tex_size', 'seed')},
+        'repeat': args.repeat,
+        'results': results,
+    }
+    with open(LAST_RUN_FILE, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=4)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=4)
+        print(f'baseline saved to {args.baseline}')
+        return 0
+    if not args.baseline.exists():
+        print(f'no baseline at {args.baseline}; run with --save-baseline first')
+        return 0
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    if baseline.get('corpus') != report['corpus']:
+        print('warning: baseline was recorded with a different corpus, ratios are not comparable')
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f'{len(regressions)} regression(s): {", ".join(regressions)}')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,186 @@
+"""Synthetic, seeded WAD/BIN/TEX/DDS corpora for the benchmark harness.
+
+Everything is generated with the pyRitoFile writers so the files go through
+the same code paths as real League data. The same seed and parameters always
+produce byte-identical files.
+"""
+import gzip
+import os
+import random
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import pyzstd
+import pyRitoFile
+from pyRitoFile.bin import BIN, BINEntry, BINField, BINType
+from pyRitoFile.structs import Vector
+from pyRitoFile.tex import TEX, TEXFormat
+from pyRitoFile.wad import WAD, WADChunk, WADCompressionType
+
+CHAMPION = 'benchchamp'
+COMPRESSIONS = {
+    'raw': WADCompressionType.Raw,
+    'gzip': WADCompressionType.Gzip,
+    'zstd': WADCompressionType.Zstd,
+}
+
+
+def _hex8(rng):
+    return f'{rng.getrandbits(32):08x}'
+
+
+def asset_path(index, extension='dds'):
+    return f'assets/characters/{CHAMPION}/skins/base/bench_{index:05d}.{extension}'
+
+
+# ---------- WAD ----------
+def make_wad(path, chunk_count=1000, chunk_size=4096, compression='zstd', seed=0):
+    """Write a WAD 3.3 with chunk_count chunks of ~chunk_size bytes each."""
+    rng = random.Random(seed)
+    compression_type = COMPRESSIONS[compression]
+    wad = WAD()
+    wad.chunks = []
+    datas = []
+    offset = 272 + chunk_count * 32
+    for i in range(chunk_count):
+        # half random, half repeated so compression has something to do
+        half = chunk_size // 2
+        raw = rng.randbytes(half) + bytes([i & 0xFF]) * (chunk_size - half)
+        if compression_type == WADCompressionType.Gzip:
+            data = gzip.compress(raw, mtime=0)
+        elif compression_type == WADCompressionType.Zstd:
+            data = pyzstd.compress(raw)
+        else:
+            data = raw
+        chunk = WADChunk.default(
+            id=i,
+            hash=asset_path(i),
+            offset=offset,
+            compressed_size=len(data),
+            decompressed_size=len(raw),
+            compression_type=compression_type,
+        )
+        wad.chunks.append(chunk)
+        datas.append(data)
+        offset += len(data)
+    wad.write(str(path))
+    with open(path, 'ab') as f:
+        for data in datas:
+            f.write(data)
+    return path
+
+
+# ---------- BIN ----------
+def _leaf_field(rng, string_density, asset_count):
+    field = BINField(hash=_hex8(rng))
+    if rng.random() < string_density:
+        field.type = BINType.STRING
+        field.data = asset_path(rng.randrange(asset_count), rng.choice(('dds', 'tex', 'skn', 'anm')))
+    else:
+        field.type, field.data = rng.choice((
+            (BINType.U32, rng.getrandbits(32)),
+            (BINType.F32, 1.5),
+            (BINType.BOOL, True),
+            (BINType.VEC3, Vector(1.0, 2.0, 3.0)),
+            (BINType.HASH, _hex8(rng)),
+        ))
+    return field
+
+
+def _fields(rng, depth, width, string_density, asset_count):
+    fields = []
+    for _ in range(width):
+        kind = rng.random()
+        if depth > 0 and kind < 0.3:
+            fields.append(BINField(
+                hash=_hex8(rng), type=BINType.EMBED, hash_type=_hex8(rng),
+                data=_fields(rng, depth - 1, width, string_density, asset_count),
+            ))
+        elif depth > 0 and kind < 0.4:
+            fields.append(BINField(
+                hash=_hex8(rng), type=BINType.LIST, value_type=BINType.EMBED,
+                data=[
+                    BINField(type=BINType.EMBED, hash_type=_hex8(rng),
+                             data=_fields(rng, depth - 1, width, string_density, asset_count))
+                    for _ in range(2)
+                ],
+            ))
+        elif kind < 0.5:
+            fields.append(BINField(
+                hash=_hex8(rng), type=BINType.LIST, value_type=BINType.STRING,
+                data=[asset_path(rng.randrange(asset_count)) for _ in range(3)],
+            ))
+        elif kind < 0.55:
+            fields.append(BINField(
+                hash=_hex8(rng), type=BINType.MAP, key_type=BINType.HASH, value_type=BINType.STRING,
+                data={_hex8(rng): asset_path(rng.randrange(asset_count)) for _ in range(3)},
+            ))
+        else:
+            fields.append(_leaf_field(rng, string_density, asset_count))
+    return fields
+
+
+def make_bin(entry_count=200, depth=3, width=6, string_density=0.4, asset_count=500, links=(), seed=0):
+    """Build an in-memory BIN; nesting depth, entry count and string density are configurable."""
+    rng = random.Random(seed)
+    bin = BIN()
+    bin.links = list(links)
+    bin.entries = [
+        BINEntry(hash=_hex8(rng), type=_hex8(rng), data=_fields(rng, depth, width, string_density, asset_count))
+        for _ in range(entry_count)
+    ]
+    return bin
+
+
+def make_mod_tree(root, linked_bins=4, existing_ratio=0.8, seed=0, **bin_kwargs):
+    """Lay out an unpacked champion folder: one main skin BIN, linked BINs and the assets they mention."""
+    rng = random.Random(seed)
+    root = Path(root)
+    asset_count = bin_kwargs.setdefault('asset_count', 500)
+    linked = [f'data/{CHAMPION}_linked_{i}.bin' for i in range(linked_bins)]
+    main_rel = f'data/characters/{CHAMPION}/skins/skin0.bin'
+    for i, rel in enumerate([main_rel] + linked):
+        target = root / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        make_bin(links=linked if i == 0 else (), seed=seed + i, **bin_kwargs).write(str(target))
+    for i in range(asset_count):
+        if rng.random() >= existing_ratio:
+            continue
+        for extension in ('dds', 'tex', 'skn', 'anm'):
+            target = root / asset_path(i, extension)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(rng.randbytes(256))
+    return main_rel
+
+
+# ---------- TEX / DDS ----------
+def make_tex(path, width=512, height=512, format='DXT5', mipmaps=True, seed=0):
+    rng = random.Random(seed)
+    tex = TEX(width=width, height=height, format=TEXFormat[format], mipmaps=mipmaps)
+    if format == 'DXT1':
+        block_size, bytes_per_block = 4, 8
+    elif format == 'DXT5':
+        block_size, bytes_per_block = 4, 16
+    else:
+        block_size, bytes_per_block = 1, 4
+    mipmap_count = max(width, height).bit_length() if mipmaps else 1
+    tex.data = []
+    # TEX stores mipmaps smallest first
+    for i in reversed(range(mipmap_count)):
+        current_width = max(width >> i, 1)
+        current_height = max(height >> i, 1)
+        block_width = (current_width + block_size - 1) // block_size
+        block_height = (current_height + block_size - 1) // block_size
+        tex.data.append(rng.randbytes(bytes_per_block * block_width * block_height))
+    tex.write(str(path))
+    return path
+
+
+def make_dds(path, tex_path, app):
+    """DDS files are produced from a TEX with the tool's own converter."""
+    app._tex2dds(Path(tex_path), Path(path))
+    return path
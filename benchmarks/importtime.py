@@ -0,0 +1,78 @@
+"""Cold-start import profile of fantome_repath_gui (python -X importtime, summarized).
+
+    python benchmarks/importtime.py                 # total, slowest modules, lazy-import check
+    python benchmarks/importtime.py --top 30 --repeat 5
+    python benchmarks/importtime.py --module pyRitoFile.wad
+
+Every run imports the module in a fresh interpreter; the run with the smallest total is
+reported. Modules listed in --lazy (numpy, pyzstd, requests, the pyRitoFile format
+modules, ...) must not be imported at startup; the exit code is 1 if one of them is, so
+it can gate a commit like bench.py.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+from corpus import REPO_ROOT
+
+LAZY_MODULES = [
+    'numpy', 'pyzstd', 'xxhash', 'requests', 'PIL',
+    'pyRitoFile.wad', 'pyRitoFile.bin', 'pyRitoFile.tex', 'pyRitoFile.skn',
+    'pyRitoFile.skl', 'pyRitoFile.anm', 'pyRitoFile.mapgeo',
+]
+
+
+def run_importtime(module):
+    """One fresh interpreter; returns [(self_us, cumulative_us, depth, name)] in import order."""
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=REPO_ROOT, capture_output=True, text=True,
+        env={**os.environ, 'PYTHONDONTWRITEBYTECODE': '1'},
+    )
+    if proc.returncode != 0:
+        sys.stderr.write(proc.stderr)
+        raise SystemExit(f'importing {module} failed')
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip(' '))) // 2
+        rows.append((int(self_us), int(cumulative_us), depth, name.strip()))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--module', default='fantome_repath_gui')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--top', type=int, default=15, help='how many modules to list')
+    parser.add_argument('--lazy', nargs='*', default=LAZY_MODULES, help='modules that must not load at startup')
+    args = parser.parse_args()
+
+    runs = [run_importtime(args.module) for _ in range(args.repeat)]
+    rows = min(runs, key=lambda rows: rows[-1][1])
+    total = rows[-1][1]
+    print(f'import {args.module}: {total / 1000:.1f} ms (best of {args.repeat}), {len(rows)} modules')
+
+    print('\ntop-level imports by cumulative time')
+    top_level = sorted((row for row in rows if row[2] == 1), key=lambda row: row[1], reverse=True)
+    for self_us, cumulative_us, _depth, name in top_level[:args.top]:
+        print(f'  {cumulative_us / 1000:8.1f} ms  {name}')
+
+    print('\nslowest modules by self time')
+    for self_us, cumulative_us, _depth, name in sorted(rows, key=lambda row: row[0], reverse=True)[:args.top]:
+        print(f'  {self_us / 1000:8.1f} ms  {name}')
+
+    loaded = {row[3] for row in rows}
+    eager = [name for name in args.lazy if name in loaded]
+    if eager:
+        print(f'\n{len(eager)} module(s) imported at startup that should be lazy: {", ".join(eager)}')
+        return 1
+    print('\nno lazy module imported at startup')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -8,15 +8,21 @@ REM Clean previous builds
 if exist build rmdir /s /q build
 if exist dist rmdir /s /q dist
 
-REM Build the exe
-echo Building EXE...
-pyinstaller --clean build.spec
+REM Build the exe ("build.bat onedir" for the folder build that starts faster)
+set SPEC=build.spec
+set OUTPUT=dist\LeagueModRepather.exe
+if /i "%~1"=="onedir" (
+    set SPEC=build_onedir.spec
+    set OUTPUT=dist\LeagueModRepather\LeagueModRepather.exe
+)
+echo Building EXE from %SPEC%...
+pyinstaller --clean %SPEC%
 
 if %errorlevel% equ 0 (
     echo.
     echo ========================================
     echo   Build Complete!
-    echo   EXE: dist\LeagueModRepather.exe
+    echo   EXE: %OUTPUT%
     echo ========================================
 ) else (
     echo.
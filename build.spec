@@ -1,4 +1,5 @@
 # -*- mode: python ; coding: utf-8 -*-
+from PyInstaller.utils.hooks import collect_submodules
 
 block_cipher = None
 
@@ -16,6 +17,8 @@ a = Analysis(
     hiddenimports=[
         'ttkbootstrap',
         'requests',  # Needed for downloading hashes
+        # pyRitoFile loads its format modules lazily, so the analysis cannot see them
+        *collect_submodules('pyRitoFile'),
     ],
     hookspath=[],
     hooksconfig={},
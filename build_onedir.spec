@@ -0,0 +1,65 @@
+# -*- mode: python ; coding: utf-8 -*-
+# Onedir variant of build.spec: dist\LeagueModRepather\LeagueModRepather.exe next to its libraries.
+# Nothing is unpacked to a temp folder on launch, so the window opens much faster than the onefile build.
+from PyInstaller.utils.hooks import collect_submodules
+
+block_cipher = None
+
+a = Analysis(
+    ['fantome_repath_gui.py'],
+    pathex=['.'],  # Add current directory to path
+    binaries=[],
+    datas=[
+        # Bundle placeholder texture files
+        ('invis.dds', '.'),
+        ('invis.tex', '.'),
+        # Bundle icon for window
+        ('Untitled.ico', '.'),
+    ],
+    hiddenimports=[
+        'ttkbootstrap',
+        'requests',  # Needed for downloading hashes
+        # pyRitoFile loads its format modules lazily, so the analysis cannot see them
+        *collect_submodules('pyRitoFile'),
+    ],
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=[],
+    win_no_prefer_redirects=False,
+    win_private_assemblies=False,
+    cipher=block_cipher,
+    noarchive=False,
+)
+
+pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,  # binaries and datas go to the folder below
+    name='LeagueModRepather',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=False,  # UPX-packed DLLs are decompressed on every load
+    console=False,  # No console window for release
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+    icon='Untitled.ico',  # Application icon
+)
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=False,
+    upx=False,
+    upx_exclude=[],
+    name='LeagueModRepather',
+)
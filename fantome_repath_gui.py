@@ -4,11 +4,15 @@ import tempfile
 import zipfile
 import shutil
 import threading
+import queue
+import time
+import functools
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Dict
 import json
 import tkinter as tk
-from tkinter import filedialog, messagebox
+from tkinter import filedialog, messagebox, ttk
 import random
 import string
 
@@ -36,8 +40,33 @@ except Exception:
 
 APP_TITLE = "League Mod Repather"
 
+# Set to any non-empty value to capture a cProfile dump per pipeline stage (work folder/profile/)
+PROFILE_ENV_VAR = "FANTOME_REPATH_PROFILE"
+
+# Set to a worker count (or "auto") to rewrite BINs on a process pool; mods with dozens of linked BINs benefit
+REPATH_WORKERS_ENV_VAR = "FANTOME_REPATH_WORKERS"
+
+# Set to another base URL, or a folder / file:// URL holding the same files, to sync hashes from a mirror
+HASH_BASE_URL_ENV_VAR = "FANTOME_REPATH_HASH_URL"
+
+
+def _timed_stage(name: str):
+	"""Record the decorated WizardApp method as pipeline stage `name` on self._timer."""
+	def decorator(func):
+		@functools.wraps(func)
+		def wrapper(self, *args, **kwargs):
+			timer = getattr(self, '_timer', None)
+			if timer is None:
+				return func(self, *args, **kwargs)
+			with timer.stage(name):
+				return func(self, *args, **kwargs)
+		return wrapper
+	return decorator
+
 
 class WizardApp:
+	_wad_hashtable_lock = threading.Lock()
+
 	def __init__(self, root: tk.Tk):
 		self.root = root
 		self.root.title(APP_TITLE)
@@ -51,6 +80,9 @@ class WizardApp:
 		self.main_bin_choice = tk.StringVar(value="Skin0")
 		self.hash_status = tk.StringVar(value="Checking hashes...")
 		self.custom_prefix = tk.StringVar()  # Custom prefix for repathing
+		self.repath_all_wads = tk.BooleanVar(value=False)  # Multi-WAD mode: every champion WAD of the fantome in one run
+		self.progress_value = tk.DoubleVar(value=0.0)
+		self.progress_text = tk.StringVar(value="")
 
 		# internal: store full member path inside .fantome
 		self._fantome_member_path = None
@@ -60,6 +92,19 @@ class WizardApp:
 
 		self.temp_dir = os.path.join(tempfile.gettempdir(), "FrogTools", "fantome_repath")
 		os.makedirs(self.temp_dir, exist_ok=True)
+		
+		# Per-run stage timings and parsed BIN cache, replaced at the start of every run
+		self._timer = WizardApp._StageTimer()
+		self._bin_cache = WizardApp._BinCache()
+		self._wad_hashtable = None
+
+		# Worker threads post status/progress here; only _pump_progress touches Tk
+		self._progress = WizardApp._ProgressBus()
+		# Pipeline jobs (extract, repath) run one at a time and can be cancelled
+		self._jobs = WizardApp._JobRunner(self._on_job_cancelled)
+		self._markers = None
+		# Form values of the running job, read on the UI thread when it starts (_start_job)
+		self._form = None
 
 		# Steps
 		self.steps = []
@@ -75,6 +120,7 @@ class WizardApp:
 		except Exception:
 			pass
 		self._show_step(0)
+		self.root.after(WizardApp._ProgressBus.POLL_MS, self._pump_progress)
 
 	def _frame(self, *args, **kwargs):
 		return (tb.Frame if tb else tk.Frame)(*args, **kwargs)
@@ -88,6 +134,15 @@ class WizardApp:
 	def _button(self, *args, **kwargs):
 		return (tb.Button if tb else tk.Button)(*args, **kwargs)
 
+	def _checkbutton(self, *args, **kwargs):
+		return (tb.Checkbutton if tb else tk.Checkbutton)(*args, **kwargs)
+
+	def _progressbar(self, parent):
+		bar = (tb.Progressbar if tb else ttk.Progressbar)(parent, variable=self.progress_value, maximum=100)
+		bar.pack(fill=tk.X, padx=12, pady=(0, 2))
+		self._label(parent, textvariable=self.progress_text, font=('Arial', 8), foreground='gray').pack(anchor=tk.W, padx=12, pady=(0, 8))
+		return bar
+
 	def _copy_menu(self, widget):
 		menu = tk.Menu(widget, tearoff=0)
 		menu.add_command(label="Copy", command=lambda: widget.event_generate('<<Copy>>'))
@@ -147,6 +202,7 @@ class WizardApp:
 		hash_status_frame.pack(fill=tk.X, pady=4)
 		self._label(hash_status_frame, text="Status:").pack(side=tk.LEFT)
 		self._copyable_entry(hash_status_frame, self.hash_status, width=60).pack(side=tk.LEFT, padx=8, fill=tk.X, expand=True)
+		self._progressbar(hash_section)
 		
 		# Hash buttons
 		hash_btn_frame = self._frame(hash_section)
@@ -192,6 +248,10 @@ class WizardApp:
 		mod_hint = self._label(s1, text="💡 Select a .fantome file OR a pre-extracted mod folder (champion will be auto-detected)", 
 		                       font=('Arial', 8), foreground='gray')
 		mod_hint.pack(anchor=tk.W, padx=12, pady=(0, 6))
+		
+		# Multi-WAD mode (fantome only): champion + companion WADs repathed in parallel, one output fantome
+		self._checkbutton(s1, text="Repath every champion WAD in the .fantome (one output fantome)",
+		                  variable=self.repath_all_wads).pack(anchor=tk.W, padx=12, pady=(0, 6))
 
 		# Prefix Input Section
 		row3 = self._frame(s1)
@@ -215,10 +275,12 @@ class WizardApp:
 		self._label(s2, text="Status:").pack(anchor=tk.W, padx=12, pady=(0, 4))
 		self.s2_status = self._copyable_entry(s2, self.s2_status_text, width=100)
 		self.s2_status.pack(fill=tk.X, padx=12, pady=(0, 8))
+		self._progressbar(s2)
 		# Open work folder button
 		s2_btn_frame = self._frame(s2)
 		s2_btn_frame.pack(pady=8)
-		self._button(s2_btn_frame, text="📁 Open Work Folder", command=self._open_work_folder, width=20).pack()
+		self._button(s2_btn_frame, text="📁 Open Work Folder", command=self._open_work_folder, width=20).pack(side=tk.LEFT, padx=4)
+		self._button(s2_btn_frame, text="⏹ Cancel", command=self._cancel_job, width=20).pack(side=tk.LEFT, padx=4)
 		self.steps.append(s2)
 
 		# Step 3: Overlay + BIN selection
@@ -253,6 +315,7 @@ class WizardApp:
 		self._label(s4, text="Step 4 — Repath, Fix Missing Files & Package").pack(anchor=tk.W, padx=12, pady=(12, 6))
 		self._label(s4, text="Status:").pack(anchor=tk.W, padx=12, pady=(0, 4))
 		self._copyable_entry(s4, self.s2_status_text, width=100).pack(fill=tk.X, padx=12, pady=(0, 8))
+		self._progressbar(s4)
 		# Buttons for Step 4
 		s4_btn_frame = self._frame(s4)
 		s4_btn_frame.pack(pady=8)
@@ -260,6 +323,7 @@ class WizardApp:
 		self.retry_btn = self._button(s4_btn_frame, text="🔄 Refresh / Retry", command=self._retry_step4, width=20)
 		self.retry_btn.pack(side=tk.LEFT, padx=4)
 		self.retry_btn.configure(state=tk.DISABLED)  # Disabled until process completes
+		self._button(s4_btn_frame, text="⏹ Cancel", command=self._cancel_job, width=20).pack(side=tk.LEFT, padx=4)
 		self.steps.append(s4)
 
 	def _show_step(self, idx: int):
@@ -301,8 +365,7 @@ class WizardApp:
 			self.step_completed[0] = True
 			# start detection/extraction in a background thread
 			self._show_step(1)
-			t = threading.Thread(target=self._detect_and_extract, daemon=True)
-			t.start()
+			self._start_job(self._detect_and_extract)
 		elif self.current_step == 1:
 			# Can't proceed from step 1 if extraction isn't complete
 			if not self.step_completed[1]:
@@ -314,8 +377,7 @@ class WizardApp:
 		elif self.current_step == 2:
 			# Step 3 -> Step 4: run repath now using selected main_bin_choice
 			self._show_step(3)
-			t = threading.Thread(target=self._run_repath_current, daemon=True)
-			t.start()
+			self._start_job(self._run_repath_current)
 		elif self.current_step < len(self.steps) - 1:
 			self._show_step(self.current_step + 1)
 		else:
@@ -433,12 +495,132 @@ class WizardApp:
 		except Exception:
 			pass
 
+	def _new_stage_timer(self):
+		"""Start a fresh timing record for this run; cProfile capture is enabled via PROFILE_ENV_VAR."""
+		profile_dir = self._work_root() / 'profile' if os.getenv(PROFILE_ENV_VAR) else None
+		return WizardApp._StageTimer(profile_dir)
+
+	def _repath_workers(self, default: int = 1) -> int:
+		"""BIN rewrite process count from REPATH_WORKERS_ENV_VAR (default when unset); 1 keeps the fused single-process repath."""
+		value = (os.getenv(REPATH_WORKERS_ENV_VAR) or '').strip().lower()
+		if not value:
+			return default
+		if value == 'auto':
+			return os.cpu_count() or 1
+		try:
+			return max(1, int(value))
+		except ValueError:
+			return 1
+
+	def _timing_report_path(self) -> Path:
+		# Written next to missing_files_report.json
+		return self._work_root() / 'timing_report.json'
+
+	def _snapshot_form(self) -> Dict:
+		"""The form as plain values; Tk variables are only read here, on the UI thread."""
+		return {
+			'champions_dir': self.champions_dir.get().strip(),
+			'fantome': self.fantome_path.get().strip(),
+			'mod_folder': self.mod_folder_path.get().strip(),
+			'all_wads': bool(self.repath_all_wads.get()),
+			'main_bin': (self.main_bin_choice.get() or '').strip(),
+			'prefix': self.custom_prefix.get().strip(),
+		}
+
+	def _start_job(self, target):
+		"""Start target as the pipeline job with the form as it is now; the job reads self._form, never the Tk variables."""
+		form = self._snapshot_form()
+
+		@functools.wraps(target)
+		def job():
+			# set on the job's thread, once a previous job has finished with its own form
+			self._form = form
+			target()
+		self._jobs.start(job)
+
+	def _run_inputs(self) -> Dict:
+		"""What a run's stages depend on; completion markers only resume a run with the same inputs."""
+		inputs = {key: self._form[key] for key in ('champions_dir', 'fantome', 'mod_folder', 'all_wads')}
+		try:
+			st = os.stat(inputs['fantome']) if inputs['fantome'] else None
+		except OSError:
+			st = None
+		inputs['fantome_stamp'] = [st.st_size, st.st_mtime_ns] if st else None
+		inputs['mod_folder_stamp'] = self._folder_stamp(inputs['mod_folder']) if inputs['mod_folder'] else None
+		return inputs
+
+	@staticmethod
+	def _folder_stamp(folder: str):
+		"""[file count, total size, newest mtime_ns] over the whole tree: a directory's own stat misses edits in nested folders."""
+		count = total = newest = 0
+		for root, _dirs, files in os.walk(folder):
+			for f in files:
+				try:
+					st = os.stat(os.path.join(root, f))
+				except OSError:
+					continue
+				count += 1
+				total += st.st_size
+				newest = max(newest, st.st_mtime_ns)
+		return [count, total, newest] if count else None
+
+	def _cancel_job(self):
+		if not self._jobs.running():
+			return
+		self._jobs.cancel()
+		self._set_status("Cancelling... (stops after the current file)")
+
+	def _on_job_cancelled(self):
+		# runs on the cancelled job's thread
+		self._set_status("Cancelled. Click Refresh / Retry to resume from the last completed stage.")
+		self._progress.set(self.progress_value, 0.0)
+		self._progress.set(self.progress_text, "Cancelled")
+		self._ui_call(lambda: self.retry_btn.configure(state=tk.NORMAL))
+
 	def _set_status(self, text: str):
 		try:
-			self.s2_status_text.set(text)
+			self._progress.set(self.s2_status_text, text)
 		except Exception:
 			pass
 
+	def _ui_call(self, func, *args):
+		"""Run func(*args) on the Tk thread; safe to call from workers."""
+		self._progress.call(func, *args)
+
+	def _report_progress(self, stage: str, done: int, total: int, nbytes: int = 0):
+		"""Progress of the current stage for the progress bar (no-op without a bus, e.g. in benchmarks)."""
+		bus = getattr(self, '_progress', None)
+		if bus is not None:
+			bus.progress(stage, done, total, nbytes)
+
+	def _pump_progress(self):
+		"""Apply everything workers posted since the last tick, then re-arm the timer."""
+		try:
+			values, progress, calls = self._progress.drain()
+			for var, value in values:
+				var.set(value)
+			if progress is not None:
+				self._show_progress(*progress)
+			for func, args in calls:
+				try:
+					func(*args)
+				except Exception as e:
+					print(f"[DEBUG] UI call {getattr(func, '__name__', func)} failed: {e}")
+		finally:
+			self.root.after(WizardApp._ProgressBus.POLL_MS, self._pump_progress)
+
+	def _show_progress(self, stage: str, done: int, total: int, nbytes: int, elapsed: float):
+		self.progress_value.set(100.0 * done / total if total else 100.0)
+		parts = [f"{stage}: {done}/{total}"]
+		if nbytes and elapsed > 0:
+			parts.append(f"{nbytes / elapsed / (1024 * 1024):.1f} MB/s")
+		if done >= total:
+			parts.append(f"done in {elapsed:.1f}s")
+		elif done > 0:
+			eta = int(elapsed * (total - done) / done)
+			parts.append(f"ETA {eta // 60}:{eta % 60:02d}")
+		self.progress_text.set(" · ".join(parts))
+
 	def _detect_wad_member_in_fantome(self, fantome_path: Path, champions_dir: Path) -> str:
 		"""
 		Detect the champion WAD file inside the fantome by matching against Champions folder.
@@ -491,6 +673,9 @@ class WizardApp:
 				# Found a champion WAD!
 				matched_wads.append((wad_member, wad_filename))
 		
+		# Kept for the multi-WAD mode, which repaths every matched champion WAD in one run
+		self._matched_fantome_wads = [wad_member for wad_member, _wad_filename in matched_wads]
+		
 		# If we found champion WADs, return the first one
 		if matched_wads:
 			return matched_wads[0][0]
@@ -504,6 +689,19 @@ class WizardApp:
 			with zf.open(member) as src, open(dest_path, 'wb') as dst:
 				shutil.copyfileobj(src, dst, length=1024 * 1024)
 
+	def _champions_files(self, champions_dir: Path) -> Dict[str, Path]:
+		"""file name (lowercase) -> path under champions_dir, walked once per run and shared by every WAD lookup."""
+		cached = getattr(self, '_champions_index', None)
+		if cached and cached[0] == str(champions_dir):
+			return cached[1]
+		files = {}
+		for root, _dirs, names in os.walk(champions_dir):
+			for f in names:
+				# first match in walk order wins, like the per-lookup walk did
+				files.setdefault(f.lower(), Path(root) / f)
+		self._champions_index = (str(champions_dir), files)
+		return files
+
 	def _find_fresh_wad(self, champions_dir: Path, wad_name: str) -> Path | None:
 		"""
 		Find the champion WAD file, excluding language-specific WADs.
@@ -514,39 +712,15 @@ class WizardApp:
 		print(f"[DEBUG _find_fresh_wad] Looking for: {wad_name} (lowercase: {wad_lower})")
 		print(f"[DEBUG _find_fresh_wad] Champions dir: {champions_dir}")
 		
-		# Extract champion name from the wad filename (e.g., "sivir" from "sivir.wad.client")
-		# Pattern: championname.wad.client
-		if not wad_lower.endswith('.wad.client'):
-			# If it doesn't end with .wad.client, just do exact match
-			for root, _dirs, files in os.walk(champions_dir):
-				for f in files:
-					if f.lower() == wad_lower:
-						found = Path(root) / f
-						print(f"[DEBUG _find_fresh_wad] FOUND (exact): {found}")
-						return found
-			print(f"[DEBUG _find_fresh_wad] NOT FOUND (exact match)")
-			return None
-		
-		# Get the champion name (everything before .wad.client)
-		champ_name = wad_lower.replace('.wad.client', '')
-		
-		# Look for exact match: championname.wad.client (no language code)
-		target_name = f"{champ_name}.wad.client"
-		print(f"[DEBUG _find_fresh_wad] Target name: {target_name}")
-		
-		for root, _dirs, files in os.walk(champions_dir):
-			for f in files:
-				f_lower = f.lower()
-				# Must match exactly: championname.wad.client
-				# Reject: championname.en_us.wad.client, championname.ja_jp.wad.client, etc.
-				if f_lower == target_name:
-					found = Path(root) / f
-					print(f"[DEBUG _find_fresh_wad] FOUND: {found}")
-					return found
-		
-		print(f"[DEBUG _find_fresh_wad] NOT FOUND after walking directory")
-		return None
+		# Exact file name match: championname.wad.client never matches championname.en_us.wad.client
+		found = self._champions_files(champions_dir).get(wad_lower)
+		if found is not None:
+			print(f"[DEBUG _find_fresh_wad] FOUND: {found}")
+		else:
+			print(f"[DEBUG _find_fresh_wad] NOT FOUND in Champions index")
+		return found
 
+	@_timed_stage('extract')
 	def _try_extract_wad(self, wad_path: Path, out_dir: Path, hashes_dir: Path) -> bool:
 		out_dir.mkdir(parents=True, exist_ok=True)
 		# Primary: pyRitoFile.wad with local hashes (mirrors LtMAO wad_tool.unpack)
@@ -554,7 +728,7 @@ class WizardApp:
 			sys.path.insert(0, str(self._project_root()))
 			import pyRitoFile
 			from pyRitoFile import wad as pywad
-			hashtables = self._load_wad_hashtables(hashes_dir)
+			hashtables = self._load_compiled_wad_hashtables(hashes_dir)
 			# Read wad and extract chunks
 			w = pywad.WAD().read(str(wad_path))
 			# Un-hash to filenames if tables available
@@ -569,6 +743,7 @@ class WizardApp:
 			from pyRitoFile.stream import BytesStream
 			with BytesStream.reader(str(wad_path)) as bs:
 				for chunk in w.chunks:
+					WizardApp._CancelToken.check()
 					file_path = str(out_dir / chunk.hash.replace('\\', '/'))
 					dir_path = os.path.dirname(file_path)
 					try:
@@ -577,10 +752,17 @@ class WizardApp:
 						pass  # Continue anyway, file creation will handle it
 			
 			# Actual extract
+			stage = f"Unpacking {wad_path.name}"
+			written = 0
 			with BytesStream.reader(str(wad_path)) as bs:
-				for chunk in w.chunks:
+				for index, chunk in enumerate(w.chunks):
+					# reported before the chunk: the body below skips ahead with continue
+					self._report_progress(stage, index, len(w.chunks), written)
+					WizardApp._CancelToken.check()
 					try:
 						chunk.read_data(bs)
+						if chunk.data is not None:
+							written += len(chunk.data)
 						
 						# Output file path of this chunk
 						file_path = str(out_dir / chunk.hash.replace('\\', '/'))
@@ -614,6 +796,7 @@ class WizardApp:
 							if chunk.data is not None:
 								with open(file_path, 'wb') as f:
 									f.write(chunk.data)
+								WizardApp._StageTimer.count(read=chunk.compressed_size, written=len(chunk.data), files=1)
 						except (FileNotFoundError, OSError) as e:
 							# Handle path length issues - try fallback with hashed name
 							if len(file_path) > 200:  # Windows path limit safety
@@ -627,6 +810,7 @@ class WizardApp:
 									if chunk.data is not None:
 										with open(short_file_path, 'wb') as f:
 											f.write(chunk.data)
+										WizardApp._StageTimer.count(read=chunk.compressed_size, written=len(chunk.data), files=1)
 								except Exception:
 									continue  # Skip this file if we can't write it
 							else:
@@ -636,6 +820,7 @@ class WizardApp:
 					except Exception:
 						# continue on per-chunk errors
 						continue
+			self._report_progress(stage, len(w.chunks), len(w.chunks), written)
 			
 			# Remove empty dirs (like LtMAO does)
 			for root, dirs, files in os.walk(out_dir, topdown=False):
@@ -658,6 +843,35 @@ class WizardApp:
 			traceback.print_exc()
 			return False
 
+	def _load_compiled_wad_hashtables(self, hashes_dir: Path):
+		"""_load_wad_hashtables compiled for WAD.un_hash batch lookups.
+
+		The compiled table is kept until the hash files change, so the mod and fresh
+		WADs of one run share a single parse and compile. It is also saved next to the
+		hash files, so later runs skip the text parse until the tables are updated.
+		"""
+		if not hashes_dir:
+			return self._load_wad_hashtables(hashes_dir)
+		# the WADs of a multi-WAD run unpack concurrently: one of them loads, the others wait for it
+		with WizardApp._wad_hashtable_lock:
+			file_stamp = WizardApp._HashSync.wad_stamp(hashes_dir)
+			stamp = (str(hashes_dir), file_stamp)
+			cached = getattr(self, '_wad_hashtable', None)
+			if cached and cached[0] == stamp:
+				return cached[1]
+			hashtables = WizardApp._HashSync.load_wad_cache(hashes_dir)
+			if hashtables is None:
+				hashtables = self._load_wad_hashtables(hashes_dir)
+				try:
+					from pyRitoFile.wad import WADHashTable
+					hashtables = WADHashTable.compile(hashtables)
+					WizardApp._HashSync.save_wad_cache(hashes_dir, hashtables, file_stamp)
+				except Exception as e:
+					# without numpy the dict tables still work, one lookup per chunk
+					print(f"[DEBUG] WAD hashtable compile skipped: {e}")
+			self._wad_hashtable = (stamp, hashtables)
+			return hashtables
+
 	def _load_wad_hashtables(self, hashes_dir: Path) -> Dict[str, Dict[str, str]]:
 		tables: Dict[str, Dict[str, str]] = {
 			'hashes.game.txt': {},
@@ -668,27 +882,56 @@ class WizardApp:
 				return tables
 			for name in list(tables.keys()):
 				file_path = hashes_dir / name
-				if not file_path.exists():
-					continue
-				with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-					for line in f:
-						line = line.strip()
-						if not line or line.startswith('#'):
-							continue
-						# expected format: "hex<space>raw"
-						# split once at first space
-						parts = line.split(' ', 1)
-						if len(parts) != 2:
-							continue
-						hex_key, raw_val = parts[0].strip(), parts[1].strip()
-						if hex_key and raw_val:
-							tables[name][hex_key] = raw_val
+				if file_path.exists():
+					with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+						WizardApp._HashSync.read_wad_lines(f, tables[name])
+				# user-discovered hashes win over the downloaded table
+				tables[name].update(WizardApp._HashDelta.read_user(hashes_dir, name))
 		except Exception:
 			pass
 		return tables
 
+	@_timed_stage('hash_extraction')
 	def _extract_hashes_from_folder(self, folder: Path, hashes_dir: Path):
 		"""Extract hashes from BIN files in the mod folder and update user's hash files"""
+		def folder_bins():
+			for root, _dirs, files in os.walk(folder):
+				for file in files:
+					if file.lower().endswith('.bin'):
+						bin_path = Path(root) / file
+						try:
+							bin_obj = self._bin_cache.get(bin_path)
+						except Exception:
+							continue  # Skip problematic BINs
+						WizardApp._StageTimer.count(read=os.path.getsize(bin_path), files=1)
+						yield bin_obj
+		self._extract_hashes_from_bins(folder_bins(), hashes_dir)
+	
+	@_timed_stage('hash_extraction')
+	def _extract_hashes_from_wad(self, wad_path: Path, hashes_dir: Path):
+		"""Extract hashes from the BIN chunks of a WAD in memory (no unpack) and update user's hash files"""
+		from pyRitoFile.stream import BytesStream
+		def wad_bins():
+			# only the strings are harvested, so no hash is ever formatted to hex
+			w = pyRitoFile.wad.WAD().read(str(wad_path), int_hashes=True)
+			with BytesStream.reader(str(wad_path)) as bs:
+				for chunk in w.chunks:
+					bin_obj = None
+					try:
+						# read_data guesses the extension from the chunk signature (PROP/PTCH -> bin)
+						chunk.read_data(bs)
+						if chunk.extension == 'bin':
+							bin_obj = pyRitoFile.bin.BIN().read(chunk.data, raw=True, int_hashes=True)
+							WizardApp._StageTimer.count(read=chunk.compressed_size, files=1)
+					except Exception:
+						pass  # Skip problematic chunks
+					chunk.free_data()
+					if bin_obj is not None:
+						yield bin_obj
+		self._extract_hashes_from_bins(wad_bins(), hashes_dir)
+	
+	def _extract_hashes_from_bins(self, bin_objs, hashes_dir: Path):
+		"""Collect game paths mentioned by bin_objs into the user's hash delta files"""
 		try:
 			# Prepare hash tables
 			wad_hash = pyRitoFile.wad.WADHasher.raw_to_hex
@@ -742,57 +985,31 @@ class WizardApp:
 				else:
 					extract_file_value(field.data, field.type)
 			
-			# Scan all BIN files in the folder
+			# Scan all BINs
 			bin_count = 0
-			for root, _dirs, files in os.walk(folder):
-				for file in files:
-					if file.lower().endswith('.bin'):
-						bin_path = Path(root) / file
-						try:
-							bin_obj = pyRitoFile.bin.BIN().read(str(bin_path))
-							# Extract file references from BIN
-							for entry in bin_obj.entries:
-								for field in entry.data:
-									extract_file_field(field)
-							# Extract from links
-							for link in bin_obj.links:
-								extract_file_value(link, pyRitoFile.bin.BINType.STRING)
-							bin_count += 1
-						except Exception:
-							pass  # Skip problematic BINs
+			for bin_obj in bin_objs:
+				try:
+					# Extract file references from BIN
+					for entry in bin_obj.entries:
+						for field in entry.data:
+							extract_file_field(field)
+					# Extract from links
+					for link in bin_obj.links:
+						extract_file_value(link, pyRitoFile.bin.BINType.STRING)
+					bin_count += 1
+				except Exception:
+					pass  # Skip problematic BINs
 			
-			# Update user's hash files
+			# Update user's hash files: new hashes go to the delta files, merged over the tables at lookup
 			if bin_count > 0:
 				for filename, new_hashes in hashtables.items():
 					if len(new_hashes) == 0:
 						continue
-					
-					hash_file = hashes_dir / filename
-					existing_hashes = {}
-					
-					# Read existing hashes
-					if hash_file.exists():
-						try:
-							with open(hash_file, 'r', encoding='utf-8') as f:
-								sep = 16 if filename in ['hashes.game.txt', 'hashes.lcu.txt'] else 8
-								for line in f:
-									if len(line) > sep:
-										key = line[:sep]
-										val = line[sep+1:-1]
-										existing_hashes[key] = val
-						except Exception:
-							pass
-					
-					# Merge new hashes
-					existing_hashes.update(new_hashes)
-					
-					# Write back sorted
 					try:
-						with open(hash_file, 'w', encoding='utf-8') as f:
-							for key, value in sorted(existing_hashes.items(), key=lambda item: item[1]):
-								f.write(f'{key} {value}\n')
+						WizardApp._HashDelta.append(hashes_dir, filename, new_hashes)
 					except Exception:
 						pass
+				WizardApp._HashDelta.compact_in_background(hashes_dir, list(hashtables.keys()))
 				
 				self._set_status(f"✓ Extracted hashes from {bin_count} BIN files")
 			else:
@@ -802,124 +1019,1226 @@ class WizardApp:
 			print(f"[DEBUG] Hash extraction error: {e}")
 			raise
 	
-	def _overlay_copy(self, src_dir: Path, dst_dir: Path) -> tuple[int, int]:
-		"""Copy all files from src_dir into dst_dir, overwriting. Returns (copied, skipped)."""
-		copied = 0
-		skipped = 0
-		src = Path(src_dir)
-		dst = Path(dst_dir)
-		if not src.exists():
-			return (0, 0)
-		for root, _dirs, files in os.walk(src):
-			root_p = Path(root)
-			rel = root_p.relative_to(src)
-			target_root = dst / rel
-			target_root.mkdir(parents=True, exist_ok=True)
-			for f in files:
-				src_file = root_p / f
-				dst_file = target_root / f
-				try:
-					shutil.copy2(src_file, dst_file)
-					copied += 1
-				except Exception:
-					skipped += 1
-		return (copied, skipped)
+	def _overlay_tree(self) -> '_OverlayTree':
+		"""The mod extract laid over the fresh extract of the current work folder."""
+		work_root = self._work_root()
+		return WizardApp._OverlayTree(work_root / 'mod_extract' / 'unpacked', work_root / 'fresh_extract' / 'unpacked')
 	
-	def _copy_vo_files_original(self, src_dir: Path, dst_dir: Path) -> int:
-		"""Copy VO files from src_dir to dst_dir with original paths (no prefix, no hashing)."""
+	def _copy_vo_files_original(self, tree: '_OverlayTree', dst_dir: Path) -> int:
+		"""Copy VO files from the overlay tree to dst_dir with original paths (no prefix, no hashing)."""
 		vo_count = 0
-		src = Path(src_dir)
 		dst = Path(dst_dir)
-		if not src.exists():
-			return 0
-		for root, _dirs, files in os.walk(src):
-			root_p = Path(root)
-			rel = root_p.relative_to(src).as_posix()
+		for full, rel_file in tree.walk():
+			rel, _sep, f = rel_file.rpartition('/')
 			rel_lower = rel.lower()
 			# Only process VO directory
 			if 'assets/sounds/wwise2016/vo/' not in rel_lower:
 				continue
-			for f in files:
-				# Copy all VO-related files (.bnk, .wem, .wpk, and any other files in VO directory)
-				# Common VO file extensions
-				if not f.lower().endswith(('.bnk', '.wem', '.wpk', '.bnk.client', '.wem.client')):
-					# Skip non-VO files (but be permissive - copy most files in VO directory)
-					continue
-				src_file = root_p / f
-				# Keep original path structure
-				dst_file = dst / rel / f
-				try:
-					dst_file.parent.mkdir(parents=True, exist_ok=True)
-					shutil.copy2(src_file, dst_file)
-					vo_count += 1
-				except Exception as e:
-					print(f"[DEBUG] Failed to copy VO file {src_file}: {e}")
+			# Copy all VO-related files (.bnk, .wem, .wpk, and any other files in VO directory)
+			# Common VO file extensions
+			if not f.lower().endswith(('.bnk', '.wem', '.wpk', '.bnk.client', '.wem.client')):
+				# Skip non-VO files (but be permissive - copy most files in VO directory)
+				continue
+			src_file = Path(full)
+			# Keep original path structure
+			dst_file = dst / rel_file
+			try:
+				dst_file.parent.mkdir(parents=True, exist_ok=True)
+				WizardApp._FileMaterializer.materialize(src_file, dst_file)
+				vo_count += 1
+			except Exception as e:
+				print(f"[DEBUG] Failed to copy VO file {src_file}: {e}")
 		return vo_count
 
+	# Stage timing (wall/CPU time, bytes and file counts per pipeline stage)
+	class _StageTimer:
+		_local = threading.local()
+		
+		def __init__(self, profile_dir: Path | None = None):
+			self.profile_dir = profile_dir
+			self.records = []
+			self.started = time.time()
+			self._lock = threading.Lock()
+		
+		@contextmanager
+		def stage(self, name: str):
+			"""Time a block as one stage record; counters from count() on this thread land in it."""
+			local = WizardApp._StageTimer._local
+			record = {
+				'stage': name,
+				'wall': 0.0,
+				'cpu': 0.0,
+				'bytes_read': 0,
+				'bytes_written': 0,
+				'files': 0,
+			}
+			parent = getattr(local, 'record', None)
+			local.record = record
+			profiler = None
+			if self.profile_dir is not None and not getattr(local, 'profiling', False):
+				import cProfile
+				profiler = cProfile.Profile()
+				try:
+					profiler.enable()
+					local.profiling = True
+				except ValueError:
+					profiler = None  # another profiler is already active
+			wall_start = time.perf_counter()
+			cpu_start = time.process_time()
+			try:
+				yield record
+			finally:
+				record['wall'] = round(time.perf_counter() - wall_start, 4)
+				record['cpu'] = round(time.process_time() - cpu_start, 4)
+				local.record = parent
+				if profiler is not None:
+					profiler.disable()
+					local.profiling = False
+					try:
+						self.profile_dir.mkdir(parents=True, exist_ok=True)
+						prof_file = self.profile_dir / f"{len(self.records):02d}_{name}.prof"
+						profiler.dump_stats(str(prof_file))
+						record['profile'] = str(prof_file)
+					except Exception as e:
+						print(f"[DEBUG] Could not write profile for {name}: {e}")
+				with self._lock:
+					self.records.append(record)
+				print(f"[TIMING] {name}: wall {record['wall']:.2f}s, cpu {record['cpu']:.2f}s, "
+				      f"read {record['bytes_read']} B, written {record['bytes_written']} B, files {record['files']}")
+		
+		@staticmethod
+		def count(read: int = 0, written: int = 0, files: int = 0):
+			"""Add I/O counters to the stage currently running on this thread (no-op outside a stage)."""
+			record = getattr(WizardApp._StageTimer._local, 'record', None)
+			if record is None:
+				return
+			record['bytes_read'] += read
+			record['bytes_written'] += written
+			record['files'] += files
+		
+		def report(self) -> Dict:
+			with self._lock:
+				records = list(self.records)
+			summary = {}
+			for record in records:
+				total = summary.setdefault(record['stage'], {
+					'runs': 0, 'wall': 0.0, 'cpu': 0.0, 'bytes_read': 0, 'bytes_written': 0, 'files': 0,
+				})
+				total['runs'] += 1
+				for key in ('wall', 'cpu', 'bytes_read', 'bytes_written', 'files'):
+					total[key] += record[key]
+			summary = dict(sorted(summary.items(), key=lambda item: item[1]['wall'], reverse=True))
+			for total in summary.values():
+				total['wall'] = round(total['wall'], 4)
+				total['cpu'] = round(total['cpu'], 4)
+			return {
+				'started': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.started)),
+				'profiling': self.profile_dir is not None,
+				'dominant_stage': next(iter(summary), None),
+				'summary': summary,
+				'stages': records,
+			}
+		
+		def write_report(self, json_file: Path):
+			try:
+				with open(json_file, 'w', encoding='utf-8') as f:
+					json.dump(self.report(), f, indent=4, ensure_ascii=False)
+			except Exception as e:
+				print(f"[DEBUG] Could not write timing report: {e}")
+	
+	# Worker -> UI channel: workers never touch Tk, the UI thread drains the queue on a timer
+	class _ProgressBus:
+		POLL_MS = 100
+		# progress events of a stage closer than this are dropped; the first and last always go through
+		MIN_INTERVAL = 0.05
+		
+		def __init__(self):
+			self._queue = queue.Queue()
+			self._started = {}
+			self._posted = {}
+		
+		def set(self, var: tk.Variable, value):
+			"""Variable.set from any thread; only the latest value per variable is applied."""
+			self._queue.put(('set', var, value))
+		
+		def call(self, func, *args):
+			"""Run func(*args) on the UI thread (dialogs, widget state, navigation)."""
+			self._queue.put(('call', func, args))
+		
+		def progress(self, stage: str, done: int, total: int, nbytes: int = 0):
+			"""done/total items of stage (nbytes so far for throughput); done == 0 starts the stage clock."""
+			now = time.perf_counter()
+			if done == 0 or stage not in self._started:
+				self._started[stage] = now
+			elif done < total and now - self._posted.get(stage, 0.0) < WizardApp._ProgressBus.MIN_INTERVAL:
+				return
+			self._posted[stage] = now
+			self._queue.put(('progress', stage, (done, total, nbytes, now - self._started[stage])))
+		
+		def drain(self):
+			"""Pop everything queued: (latest value per variable, latest progress, calls in order)."""
+			values = {}
+			progress = None
+			calls = []
+			while True:
+				try:
+					kind, target, payload = self._queue.get_nowait()
+				except queue.Empty:
+					break
+				if kind == 'set':
+					# tk variables are keyed by their Tcl name
+					values[str(target)] = (target, payload)
+				elif kind == 'progress':
+					progress = (target, *payload)
+				else:
+					calls.append((target, payload))
+			return list(values.values()), progress, calls
+	
+	# Raised at the next checkpoint of a cancelled job. BaseException on purpose:
+	# the pipeline is full of best-effort `except Exception` blocks that must not swallow it.
+	class _Cancelled(BaseException):
+		pass
+	
+	# Cooperative cancellation: jobs call check() between chunks/files
+	class _CancelToken:
+		_local = threading.local()
+		
+		def __init__(self):
+			self._event = threading.Event()
+		
+		def cancel(self):
+			self._event.set()
+		
+		@property
+		def cancelled(self) -> bool:
+			return self._event.is_set()
+		
+		@staticmethod
+		def check():
+			"""Raise _Cancelled if the job running on this thread was cancelled (no-op outside a job)."""
+			token = getattr(WizardApp._CancelToken._local, 'token', None)
+			if token is not None and token.cancelled:
+				raise WizardApp._Cancelled()
+	
+	# One pipeline job at a time on a daemon thread
+	class _JobRunner:
+		def __init__(self, on_cancelled=None):
+			self.on_cancelled = on_cancelled
+			self._lock = threading.Lock()
+			self._thread = None
+			self._token = None
+		
+		def start(self, target):
+			"""Run target on a new thread; a job still running is cancelled and waited out first, so two never share the work folder."""
+			with self._lock:
+				previous = self._thread
+				if self._token is not None:
+					self._token.cancel()
+				token = WizardApp._CancelToken()
+				
+				def run():
+					if previous is not None:
+						previous.join()
+					WizardApp._CancelToken._local.token = token
+					try:
+						target()
+					except WizardApp._Cancelled:
+						print(f"[DEBUG] Job {getattr(target, '__name__', target)} cancelled")
+						if self.on_cancelled is not None:
+							self.on_cancelled()
+					finally:
+						WizardApp._CancelToken._local.token = None
+				
+				self._token = token
+				self._thread = threading.Thread(target=run, daemon=True)
+				self._thread.start()
+		
+		def cancel(self):
+			with self._lock:
+				if self._token is not None:
+					self._token.cancel()
+		
+		def running(self) -> bool:
+			thread = self._thread
+			return thread is not None and thread.is_alive()
+	
+	# Completed pipeline stages under <work root>/stages, so a retry resumes instead of starting over
+	class _StageMarkers:
+		def __init__(self, work_root: Path, inputs: Dict, scope: str = ''):
+			self.dir = Path(work_root) / 'stages'
+			self.inputs = inputs
+			self.scope = scope
+		
+		def _path(self, name: str) -> Path:
+			return self.dir / f'{self.scope}{name}.json'
+		
+		def scoped(self, scope: str) -> '_StageMarkers':
+			"""Markers of one part of the run (one WAD of a multi-WAD run), kept with the others under a name prefix."""
+			return WizardApp._StageMarkers(self.dir.parent, self.inputs, f'{self.scope}{scope}.')
+		
+		def get(self, name: str, **inputs) -> Dict | None:
+			"""Data saved by mark() if stage `name` finished for these inputs, None otherwise."""
+			try:
+				with open(self._path(name), 'r', encoding='utf-8') as f:
+					marker = json.load(f)
+			except (OSError, ValueError):
+				return None
+			if marker.get('inputs') != {**self.inputs, **inputs}:
+				return None
+			return marker.get('data') or {}
+		
+		def mark(self, name: str, data: Dict | None = None, **inputs):
+			self.dir.mkdir(parents=True, exist_ok=True)
+			marker = {
+				'stage': name,
+				'finished': time.strftime('%Y-%m-%d %H:%M:%S'),
+				'inputs': {**self.inputs, **inputs},
+				'data': data or {},
+			}
+			# written aside and renamed: a crash never leaves a half-written marker behind
+			tmp = self._path(name).with_suffix('.tmp')
+			with open(tmp, 'w', encoding='utf-8') as f:
+				json.dump(marker, f, indent=4, ensure_ascii=False)
+			os.replace(tmp, self._path(name))
+		
+		def resumable(self) -> bool:
+			"""True when some stage of a run with the same inputs already finished."""
+			if not self.dir.exists():
+				return False
+			return any(self.get(path.stem) is not None for path in self.dir.glob('*.json'))
+		
+		def clear(self):
+			shutil.rmtree(self.dir, ignore_errors=True)
+	
+	# One champion WAD of a multi-WAD run, extracted and repathed in its own folder under <work root>/multi
+	class _WadJob:
+		def __init__(self, work_root: Path, member: str, markers: '_StageMarkers'):
+			self.member = member
+			self.wad_name = Path(member).name
+			self.champion = self.wad_name.split('.')[0].lower()
+			self.root = Path(work_root) / 'multi' / self.champion
+			self.mod_wad = self.root / 'mod_extract' / self.wad_name
+			self.mod_unpack = self.root / 'mod_extract' / 'unpacked'
+			self.fresh_wad_copy = self.root / 'fresh_extract' / self.wad_name
+			self.fresh_unpack = self.root / 'fresh_extract' / 'unpacked'
+			self.markers = markers.scoped(self.champion)
+			self.fresh_wad = None
+			self.repathed_dir = None
+			self.missing_count = 0
+			self.writer = None
+			self.error = None  # set when a stage failed; later stages skip the job
+		
+		def tree(self) -> '_OverlayTree':
+			return WizardApp._OverlayTree(self.mod_unpack, self.fresh_unpack)
+	
+	# Mod extract laid over the fresh extract without copying anything
+	class _OverlayTree:
+		"""
+		Read view of several unpacked folders, top layer first: a relative path resolves to the file
+		in the highest layer that has it (mod over fresh). Paths compare case-insensitively, like the
+		Windows copy the physical overlay used to do. In-place writes go to the resolved file.
+		"""
+		def __init__(self, *layers):
+			self.layers = [Path(layer) for layer in layers]
+			self._files = None  # rel.lower() -> (full, rel)
+			self._hashes = None  # unified hash -> (full, rel)
+		
+		def listing(self) -> dict:
+			"""rel.lower() -> (full path, rel), walked once and kept for the life of the tree."""
+			if self._files is None:
+				files = {}
+				# bottom layer first, higher layers shadow it; the first spelling of a path is kept
+				for layer in reversed(self.layers):
+					if not layer.exists():
+						continue
+					for root, _dirs, names in os.walk(layer):
+						for f in names:
+							full = str(Path(root)/f)
+							rel = Path(os.path.relpath(full, layer)).as_posix()
+							key = rel.lower()
+							files[key] = (full, files[key][1] if key in files else rel)
+				self._files = files
+			return self._files
+		
+		def resolve(self, rel) -> Path | None:
+			found = self.listing().get(Path(rel).as_posix().lower())
+			return Path(found[0]) if found else None
+		
+		def exists(self, rel) -> bool:
+			return Path(rel).as_posix().lower() in self.listing()
+		
+		def walk(self, rel_dir: str = ''):
+			"""(full, rel) for every file under rel_dir ('' for everything)."""
+			prefix = rel_dir.strip('/').lower()
+			prefix = prefix + '/' if prefix else ''
+			for key, (full, rel) in self.listing().items():
+				if key.startswith(prefix):
+					yield full, rel
+		
+		def lookup_hash(self, unify_file):
+			"""(full, rel) of the file whose unified path hash is unify_file, or None."""
+			if self._hashes is None:
+				entries = list(self.listing().values())
+				unified = WizardApp._PathHasher.unify_many(rel for _full, rel in entries)
+				hashes = {}
+				for entry, u in zip(entries, unified):
+					hashes.setdefault(u, entry)
+				self._hashes = hashes
+			return self._hashes.get(unify_file)
+	
+	# Cheapest way to put a file's content at a second path (work folder copies)
+	class _FileMaterializer:
+		# ioctl request number of Linux FICLONE (reflink the whole file)
+		FICLONE = 0x40049409
+		
+		@staticmethod
+		def materialize(src, dst):
+			"""
+			Make dst hold the content of src: hardlink first, then reflink / copy_file_range, then a plain copy.
+			A file at dst is removed first, so nothing is ever written through an inode shared with src.
+			Returns dst, like shutil.copy2, so it can be used as copytree's copy_function.
+			"""
+			FM = WizardApp._FileMaterializer
+			try:
+				os.unlink(dst)
+			except FileNotFoundError:
+				pass
+			try:
+				os.link(src, dst)
+				return dst
+			except OSError:
+				pass
+			try:
+				if FM._clone(src, dst):
+					shutil.copystat(src, dst)
+					return dst
+			except OSError:
+				pass
+			return shutil.copy2(src, dst)
+		
+		@staticmethod
+		def _clone(src, dst) -> bool:
+			"""Reflink, else in-kernel copy_file_range (Linux); False when neither is available here."""
+			if not hasattr(os, 'copy_file_range'):
+				return False
+			with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+				try:
+					import fcntl
+					fcntl.ioctl(fdst.fileno(), WizardApp._FileMaterializer.FICLONE, fsrc.fileno())
+					return True
+				except (ImportError, OSError):
+					pass
+				size = os.fstat(fsrc.fileno()).st_size
+				copied = 0
+				while copied < size:
+					n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), size - copied)
+					if n == 0:
+						break
+					copied += n
+				return copied == size
+		
+		@staticmethod
+		def detach(path):
+			"""Give a hardlinked file its own copy before it is rewritten in place, so its other links stay intact."""
+			try:
+				if os.stat(path).st_nlink <= 1:
+					return
+			except FileNotFoundError:
+				return
+			tmp = f'{path}.detach'
+			shutil.copy2(path, tmp)
+			os.replace(tmp, path)
+	
+	# Parsed BIN cache shared by every stage of one run
+	class _BinCache:
+		# A parsed tree takes roughly 10-20x its file size in memory (one object per field)
+		PARSED_RATIO = 15
+		# Budget in estimated parsed bytes for the whole process: the threads of a multi-WAD run
+		# share this cache and the BIN process pool workers keep none
+		DEFAULT_MAX_MEMORY = 256 * 1024 * 1024
+		
+		def __init__(self, max_memory: int = DEFAULT_MAX_MEMORY):
+			from collections import OrderedDict
+			self.max_memory = max_memory
+			self.total_memory = 0
+			self.hits = 0
+			self.misses = 0
+			self._entries = OrderedDict()  # path -> ((mtime_ns, size), bin)
+			self._lock = threading.Lock()
+		
+		@staticmethod
+		def _key(path) -> str:
+			return os.path.normcase(os.path.abspath(str(path)))
+		
+		@staticmethod
+		def _stamp(path):
+			st = os.stat(path)
+			return (st.st_mtime_ns, st.st_size)
+		
+		@staticmethod
+		def _memory(stamp) -> int:
+			"""Estimated in-memory size of the tree parsed from a file with this stamp."""
+			return stamp[1] * WizardApp._BinCache.PARSED_RATIO
+		
+		def get(self, path, writable: bool = False):
+			"""
+			Return the parsed BIN at path, decoding it only if the file changed since it was cached.
+			The cached tree is shared: callers that modify it must pass writable=True to get their own clone.
+			"""
+			key = self._key(path)
+			stamp = self._stamp(path)
+			with self._lock:
+				cached = self._entries.get(key)
+				if cached is not None and cached[0] == stamp:
+					self._entries.move_to_end(key)
+					self.hits += 1
+					bin_obj = cached[1]
+					return bin_obj.copy() if writable else bin_obj
+				self.misses += 1
+			bin_obj = pyRitoFile.bin.BIN().read(str(path))
+			if not self._store(key, stamp, bin_obj):
+				# over budget, nobody else holds this tree
+				return bin_obj
+			return bin_obj.copy() if writable else bin_obj
+		
+		def write(self, bin_obj, path):
+			"""Write bin_obj to path and cache it; the cache takes ownership, so don't modify bin_obj afterwards."""
+			WizardApp._FileMaterializer.detach(path)
+			bin_obj.write(str(path))
+			self._store(self._key(path), self._stamp(path), bin_obj)
+		
+		def alias(self, src, dst):
+			"""dst was just copied from src: reuse src's parsed tree for it if src is cached and unchanged."""
+			with self._lock:
+				cached = self._entries.get(self._key(src))
+			try:
+				if cached is not None and cached[0] == self._stamp(src):
+					self._store(self._key(dst), self._stamp(dst), cached[1])
+				else:
+					self.invalidate(dst)
+			except OSError:
+				self.invalidate(dst)
+		
+		def invalidate(self, path):
+			with self._lock:
+				cached = self._entries.pop(self._key(path), None)
+				if cached is not None:
+					self.total_memory -= self._memory(cached[0])
+		
+		def clear(self):
+			with self._lock:
+				if self.hits or self.misses:
+					print(f"[DEBUG] BIN cache: {self.hits} hits, {self.misses} parses")
+				self._entries.clear()
+				self.total_memory = 0
+				self.hits = 0
+				self.misses = 0
+		
+		def _store(self, key, stamp, bin_obj):
+			memory = self._memory(stamp)
+			with self._lock:
+				old = self._entries.pop(key, None)
+				if old is not None:
+					self.total_memory -= self._memory(old[0])
+				if memory > self.max_memory:
+					return False
+				self._entries[key] = (stamp, bin_obj)
+				self.total_memory += memory
+				# evict least recently used BINs until we are back under budget
+				while self.total_memory > self.max_memory:
+					_key, (old_stamp, _bin) = self._entries.popitem(last=False)
+					self.total_memory -= self._memory(old_stamp)
+				return True
+	
+	# User-discovered hashes: small append-only delta files next to the downloaded tables, folded
+	# into a sorted user table of their own; a hash sync only ever replaces the downloaded tables
+	class _HashDelta:
+		SUFFIX = '.delta'
+		USER_SUFFIX = '.user'
+		# fold a delta into the user table once it grows past this size
+		COMPACT_BYTES = 1024 * 1024
+		_lock = threading.Lock()
+		
+		@staticmethod
+		def path(hashes_dir: Path, fname: str) -> Path:
+			return hashes_dir / (fname + WizardApp._HashDelta.SUFFIX)
+		
+		@staticmethod
+		def user_path(hashes_dir: Path, fname: str) -> Path:
+			return hashes_dir / (fname + WizardApp._HashDelta.USER_SUFFIX)
+		
+		@staticmethod
+		def read_table(fpath: Path, sep: int) -> dict:
+			table = {}
+			if fpath.is_file():
+				with open(fpath, 'r', encoding='utf-8') as f:
+					for line in f:
+						if len(line) > sep:
+							table[line[:sep]] = line[sep+1:-1]
+			return table
+		
+		@staticmethod
+		def append(hashes_dir: Path, fname: str, new_hashes: dict) -> int:
+			"""Append hashes the delta doesn't have yet; costs only the new entries, the main table is not touched."""
+			HD = WizardApp._HashDelta
+			sep = 16 if fname in ('hashes.game.txt', 'hashes.lcu.txt') else 8
+			with HD._lock:
+				delta_path = HD.path(hashes_dir, fname)
+				known = HD.read_table(delta_path, sep)
+				lines = [f'{key} {value}\n' for key, value in new_hashes.items() if known.get(key) != value]
+				if lines:
+					with open(delta_path, 'a', encoding='utf-8') as f:
+						f.writelines(lines)
+				return len(lines)
+		
+		@staticmethod
+		def read_user(hashes_dir: Path, fname: str) -> dict:
+			"""Every user-discovered hash of fname (user table and delta), to merge over the downloaded table."""
+			HD = WizardApp._HashDelta
+			sep = 16 if fname in ('hashes.game.txt', 'hashes.lcu.txt') else 8
+			# under the lock, so a compaction moving the delta into the user table meanwhile cannot lose entries
+			with HD._lock:
+				table = HD.read_table(HD.user_path(hashes_dir, fname), sep)
+				table.update(HD.read_table(HD.path(hashes_dir, fname), sep))
+			return table
+		
+		@staticmethod
+		def compact(hashes_dir: Path, fname: str):
+			"""Fold the delta into the user table (one sorted rewrite) and start a new delta."""
+			HD = WizardApp._HashDelta
+			sep = 16 if fname in ('hashes.game.txt', 'hashes.lcu.txt') else 8
+			# never while a hash sync is replacing files in the same folder
+			with WizardApp._HashSync._dir_lock, HD._lock:
+				delta_path = HD.path(hashes_dir, fname)
+				if not delta_path.is_file():
+					return
+				user_file = HD.user_path(hashes_dir, fname)
+				table = HD.read_table(user_file, sep)
+				table.update(HD.read_table(delta_path, sep))
+				tmp_file = hashes_dir / (fname + HD.USER_SUFFIX + '.tmp')
+				with open(tmp_file, 'w', encoding='utf-8') as f:
+					for key, value in sorted(table.items(), key=lambda item: item[1]):
+						f.write(f'{key} {value}\n')
+				# readers see either the old or the new table, never a partial one
+				os.replace(tmp_file, user_file)
+				# appends hold the lock too, so the delta has nothing newer than what was folded
+				os.remove(delta_path)
+		
+		@staticmethod
+		def compact_in_background(hashes_dir: Path, fnames):
+			"""Compact the deltas that grew past COMPACT_BYTES on a background thread."""
+			HD = WizardApp._HashDelta
+			due = [fname for fname in fnames
+				if HD.path(hashes_dir, fname).is_file() and HD.path(hashes_dir, fname).stat().st_size > HD.COMPACT_BYTES]
+			if not due:
+				return
+			def compact_all():
+				for fname in due:
+					try:
+						HD.compact(hashes_dir, fname)
+					except Exception as e:
+						# e.g. the table is open elsewhere on Windows: the delta stays and is retried next run
+						print(f"[DEBUG] Hash delta compaction of {fname} skipped: {e}")
+			threading.Thread(target=compact_all).start()
+	
+	# Incremental hash download: pooled concurrent streams, range resume, conditional requests,
+	# WAD tables compiled into the binary cache as they arrive
+	class _HashSync:
+		DEFAULT_BASE_URL = 'https://raw.githubusercontent.com/CommunityDragon/Data/master/hashes/lol/'
+		# local file -> server parts, concatenated in order
+		FILES = {
+			'hashes.binentries.txt': ['hashes.binentries.txt'],
+			'hashes.binfields.txt': ['hashes.binfields.txt'],
+			'hashes.binhashes.txt': ['hashes.binhashes.txt'],
+			'hashes.bintypes.txt': ['hashes.bintypes.txt'],
+			'hashes.game.txt': ['hashes.game.txt.0', 'hashes.game.txt.1'],
+			'hashes.lcu.txt': ['hashes.lcu.txt'],
+		}
+		WAD_FILES = ('hashes.game.txt', 'hashes.lcu.txt')
+		META_FILE = 'hashes.sync.json'
+		WAD_CACHE = 'hashes.wad.npz'
+		CHUNK_SIZE = 1024 * 1024
+		TIMEOUT = 30
+		# one sync or delta compaction at a time in the hashes folder
+		_dir_lock = threading.Lock()
+		
+		def __init__(self, hashes_dir: Path, base_url: str = None, workers: int = 4, progress=None):
+			self.hashes_dir = hashes_dir
+			self.base_url = WizardApp._HashSync.normalize_url(base_url or WizardApp._HashSync.DEFAULT_BASE_URL)
+			self.workers = max(1, workers)
+			self.progress = progress
+			self.session = None
+			self._lock = threading.Lock()
+			self._received = 0
+			self._done = 0
+			self._total = 0
+			self.meta = self._read_meta()
+		
+		@staticmethod
+		def normalize_url(url: str) -> str:
+			"""Base URL with a trailing slash; a plain folder path becomes a file:// mirror."""
+			url = url.strip()
+			if '://' not in url:
+				url = Path(url).resolve().as_uri()
+			return url if url.endswith('/') else url + '/'
+		
+		@staticmethod
+		def read_wad_lines(lines, table: dict):
+			"""Add "hex raw" lines to table; comments, blanks and malformed lines are skipped."""
+			for line in lines:
+				line = line.strip()
+				if not line or line.startswith('#'):
+					continue
+				# expected format: "hex<space>raw"
+				# split once at first space
+				parts = line.split(' ', 1)
+				if len(parts) != 2:
+					continue
+				hex_key, raw_val = parts[0].strip(), parts[1].strip()
+				if hex_key and raw_val:
+					table[hex_key] = raw_val
+		
+		# ---------- compiled WAD table cache ----------
+		@staticmethod
+		def wad_stamp(hashes_dir: Path) -> tuple:
+			"""(mtime_ns, size) of the WAD tables and their user hashes; any change invalidates the compiled table."""
+			HD = WizardApp._HashDelta
+			stamp = []
+			for name in WizardApp._HashSync.WAD_FILES:
+				for file_path in (hashes_dir / name, HD.user_path(hashes_dir, name), HD.path(hashes_dir, name)):
+					try:
+						st = file_path.stat()
+						stamp.append((st.st_mtime_ns, st.st_size))
+					except OSError:
+						stamp.append(None)
+			return tuple(stamp)
+		
+		@staticmethod
+		def load_wad_cache(hashes_dir: Path):
+			"""The compiled WAD table saved for the current hash files, or None."""
+			cache_path = hashes_dir / WizardApp._HashSync.WAD_CACHE
+			if not cache_path.is_file():
+				return None
+			try:
+				from pyRitoFile.wad import WADHashTable
+				return WADHashTable.load(str(cache_path), tag=repr(WizardApp._HashSync.wad_stamp(hashes_dir)))
+			except Exception as e:
+				print(f"[DEBUG] WAD hashtable cache not loaded: {e}")
+				return None
+		
+		@staticmethod
+		def save_wad_cache(hashes_dir: Path, hashtable, stamp: tuple):
+			cache_path = hashes_dir / WizardApp._HashSync.WAD_CACHE
+			tmp_path = hashes_dir / (WizardApp._HashSync.WAD_CACHE + '.tmp')
+			try:
+				hashtable.save(str(tmp_path), tag=repr(stamp))
+				os.replace(tmp_path, cache_path)
+			except Exception as e:
+				print(f"[DEBUG] WAD hashtable cache not saved: {e}")
+		
+		# ---------- sync state ----------
+		def _read_meta(self) -> dict:
+			"""{'parts': validators and size per server part, 'files': part layout and stamp per local file}"""
+			meta = {}
+			try:
+				with open(self.hashes_dir / WizardApp._HashSync.META_FILE, 'r', encoding='utf-8') as f:
+					meta = json.load(f)
+			except Exception:
+				pass
+			meta.setdefault('parts', {})
+			meta.setdefault('files', {})
+			return meta
+		
+		def _write_meta(self):
+			with self._lock:
+				meta_path = self.hashes_dir / WizardApp._HashSync.META_FILE
+				tmp_path = self.hashes_dir / (WizardApp._HashSync.META_FILE + '.tmp')
+				with open(tmp_path, 'w', encoding='utf-8') as f:
+					json.dump(self.meta, f, indent=4)
+				os.replace(tmp_path, meta_path)
+		
+		@staticmethod
+		def _file_stamp(file_path: Path):
+			try:
+				st = file_path.stat()
+				return [st.st_mtime_ns, st.st_size]
+			except OSError:
+				return None
+		
+		def _validators(self, fname: str) -> bool:
+			"""Whether the stored validators still describe the local file: a 304 then means keep it as is."""
+			target = self.hashes_dir / fname
+			if not target.is_file():
+				return False
+			if len(WizardApp._HashSync.FILES[fname]) == 1:
+				# user hashes live beside the table, so it still is what the server sent
+				return True
+			# multi-part files reuse unchanged parts by offset, only valid for the file sync wrote
+			return self.meta['files'].get(fname, {}).get('stamp') == WizardApp._HashSync._file_stamp(target)
+		
+		# ---------- transport ----------
+		def _open(self, url: str, headers: dict):
+			"""(status, response headers, chunk iterator, close) for an http(s) or file:// URL."""
+			if url.startswith('file://'):
+				return WizardApp._HashSync._open_file(url, headers)
+			if self.session is None:
+				import requests
+				from requests.adapters import HTTPAdapter
+				self.session = requests.Session()
+				adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.workers)
+				self.session.mount('https://', adapter)
+				self.session.mount('http://', adapter)
+			response = self.session.get(url, headers=headers, stream=True, timeout=WizardApp._HashSync.TIMEOUT)
+			if response.status_code not in (200, 206, 304, 416):
+				response.close()
+				response.raise_for_status()
+				raise IOError(f"{url}: HTTP {response.status_code}")
+			return (response.status_code, response.headers,
+				response.iter_content(WizardApp._HashSync.CHUNK_SIZE), response.close)
+		
+		@staticmethod
+		def _open_file(url: str, headers: dict):
+			"""file:// mirror with the same ETag/304/Range behaviour as a web server."""
+			from urllib.request import url2pathname
+			from urllib.parse import urlparse
+			from email.utils import formatdate
+			file_path = Path(url2pathname(urlparse(url).path))
+			st = file_path.stat()
+			etag = f'"{st.st_size:x}-{st.st_mtime_ns:x}"'
+			info = {
+				'ETag': etag,
+				'Last-Modified': formatdate(st.st_mtime, usegmt=True),
+				'Content-Length': str(st.st_size),
+			}
+			if headers.get('If-None-Match') == etag:
+				return 304, info, iter(()), lambda: None
+			offset = 0
+			if headers.get('Range') and headers.get('If-Range') in (etag, info['Last-Modified']):
+				offset = int(headers['Range'][len('bytes='):].rstrip('-'))
+				if offset >= st.st_size:
+					info['Content-Range'] = f'bytes */{st.st_size}'
+					return 416, info, iter(()), lambda: None
+				info['Content-Length'] = str(st.st_size - offset)
+				info['Content-Range'] = f'bytes {offset}-{st.st_size - 1}/{st.st_size}'
+			f = open(file_path, 'rb')
+			f.seek(offset)
+			chunks = iter(lambda: f.read(WizardApp._HashSync.CHUNK_SIZE), b'')
+			return (206 if offset else 200), info, chunks, f.close
+		
+		# ---------- download ----------
+		def _count(self, nbytes: int = 0, done: int = 0):
+			with self._lock:
+				self._received += nbytes
+				self._done += done
+				received, finished = self._received, self._done
+			if self.progress:
+				self.progress("Hash files", finished, self._total, received)
+		
+		def _fetch(self, fname: str, part: str, conditional: bool):
+			"""Stream one part to part.download, resuming a previous partial download.
+
+			Returns ('unchanged', None) on 304, otherwise ('downloaded', parsed table or None). The new
+			validators wait in meta 'pending' until _assemble has put the part in place, so a sync that
+			fails on a sibling part never records them for content that is not on disk yet.
+			"""
+			HS = WizardApp._HashSync
+			temp = self.hashes_dir / (part + '.download')
+			meta = self.meta['parts'].setdefault(part, {})
+			is_wad = fname in HS.WAD_FILES
+			headers = {}
+			offset = temp.stat().st_size if temp.is_file() else 0
+			if offset and meta.get('partial'):
+				headers['Range'] = f'bytes={offset}-'
+				headers['If-Range'] = meta['partial']
+			elif conditional:
+				if meta.get('etag'):
+					headers['If-None-Match'] = meta['etag']
+				if meta.get('last_modified'):
+					headers['If-Modified-Since'] = meta['last_modified']
+			status, info, chunks, close = self._open(self.base_url + part, headers)
+			try:
+				if status == 304:
+					return 'unchanged', None
+				if status == 416 and offset and meta.get('pending', {}).get('size') == offset:
+					# If-Range matched and nothing is past the end: finished by an earlier sync that failed elsewhere
+					table = None
+					if is_wad:
+						table = {}
+						with open(temp, 'r', encoding='utf-8', errors='ignore') as f:
+							HS.read_wad_lines(f, table)
+					return 'downloaded', table
+				if status == 416:
+					# the partial download is stale: start over
+					close()
+					temp.unlink(missing_ok=True)
+					meta.pop('partial', None)
+					return self._fetch(fname, part, conditional=False)
+				validator = info.get('ETag') or info.get('Last-Modified')
+				if status != 206:
+					offset = 0
+				meta.pop('pending', None)
+				meta['partial'] = validator
+				self._write_meta()
+				expected = info.get('Content-Length')
+				expected = offset + int(expected) if expected else None
+				
+				table = {} if is_wad else None
+				rest = ''
+				if table is not None and offset:
+					# resumed: the part already on disk is parsed before the rest streams in
+					with open(temp, 'r', encoding='utf-8', errors='ignore') as f:
+						data = f.read()
+					lines = data.split('\n')
+					rest = lines.pop()
+					HS.read_wad_lines(lines, table)
+				size = offset
+				with open(temp, 'ab' if offset else 'wb') as f:
+					for chunk in chunks:
+						f.write(chunk)
+						size += len(chunk)
+						self._count(len(chunk))
+						if table is not None:
+							# WAD tables are parsed while they stream; a line split across chunks is carried over
+							lines = (rest + chunk.decode('utf-8', errors='ignore')).split('\n')
+							rest = lines.pop()
+							HS.read_wad_lines(lines, table)
+				if expected is not None and size != expected:
+					raise IOError(f"{part}: received {size} of {expected} bytes, will resume on the next sync")
+				if table is not None:
+					HS.read_wad_lines([rest], table)
+				meta['pending'] = {
+					'etag': info.get('ETag'),
+					'last_modified': info.get('Last-Modified'),
+					'size': size,
+				}
+				return 'downloaded', table
+			finally:
+				close()
+		
+		def _assemble(self, fname: str, fetched: dict):
+			"""Write fname from the new part downloads plus the unchanged parts of the current file."""
+			HS = WizardApp._HashSync
+			target = self.hashes_dir / fname
+			parts = HS.FILES[fname]
+			tmp_path = self.hashes_dir / (fname + '.tmp')
+			old_parts = self.meta['files'].get(fname, {}).get('parts', [])
+			with open(tmp_path, 'wb') as out:
+				old = None
+				try:
+					for part in parts:
+						if fetched[part][0] == 'downloaded':
+							with open(self.hashes_dir / (part + '.download'), 'rb') as src:
+								shutil.copyfileobj(src, out, HS.CHUNK_SIZE)
+							continue
+						# unchanged part: copy its slice of the current file
+						offset, size = next((p[1], p[2]) for p in old_parts if p[0] == part)
+						if old is None:
+							old = open(target, 'rb')
+						old.seek(offset)
+						while size > 0:
+							data = old.read(min(size, HS.CHUNK_SIZE))
+							if not data:
+								raise IOError(f"{fname} is shorter than its recorded parts")
+							out.write(data)
+							size -= len(data)
+				finally:
+					if old is not None:
+						old.close()
+			os.replace(tmp_path, target)
+			for part in parts:
+				meta = self.meta['parts'][part]
+				if fetched[part][0] == 'downloaded':
+					# the part is in place now: its validators describe the local file
+					meta.update(meta.pop('pending'))
+					meta.pop('partial', None)
+				(self.hashes_dir / (part + '.download')).unlink(missing_ok=True)
+			offset = 0
+			layout = []
+			for part in parts:
+				size = self.meta['parts'][part]['size']
+				layout.append([part, offset, size])
+				offset += size
+			self.meta['files'][fname] = {'parts': layout, 'stamp': HS._file_stamp(target)}
+		
+		def _compile_wad(self, fetched: dict):
+			"""Compile the WAD tables from the streamed parts (unchanged files are read from disk) into the cache."""
+			HS = WizardApp._HashSync
+			stale = any(fetched[part][0] == 'downloaded' for name in HS.WAD_FILES for part in HS.FILES[name])
+			if not stale and HS.load_wad_cache(self.hashes_dir) is not None:
+				return
+			try:
+				from pyRitoFile.wad import WADHashTable
+			except Exception as e:
+				print(f"[DEBUG] WAD hashtable cache skipped: {e}")
+				return
+			# stamped before reading, so a delta appended meanwhile invalidates the cache
+			stamp = HS.wad_stamp(self.hashes_dir)
+			tables = {}
+			for name in HS.WAD_FILES:
+				parsed = [fetched[part][1] for part in HS.FILES[name]]
+				table = {}
+				if all(part_table is not None for part_table in parsed):
+					for part_table in parsed:
+						table.update(part_table)
+				elif (self.hashes_dir / name).is_file():
+					with open(self.hashes_dir / name, 'r', encoding='utf-8', errors='ignore') as f:
+						HS.read_wad_lines(f, table)
+				table.update(WizardApp._HashDelta.read_user(self.hashes_dir, name))
+				tables[name] = table
+			HS.save_wad_cache(self.hashes_dir, WADHashTable.compile(tables), stamp)
+		
+		def sync(self) -> dict:
+			"""Bring every hash file up to date; returns {'downloaded': [...], 'unchanged': [...], 'failed': {fname: error}}."""
+			HS = WizardApp._HashSync
+			with HS._dir_lock:
+				return self._sync()
+		
+		def _sync(self) -> dict:
+			HS = WizardApp._HashSync
+			from concurrent.futures import ThreadPoolExecutor
+			jobs = [(fname, part, self._validators(fname)) for fname, parts in HS.FILES.items() for part in parts]
+			self._total = len(jobs)
+			self._count()
+			fetched = {}
+			errors = {}
+			try:
+				with ThreadPoolExecutor(max_workers=self.workers) as pool:
+					futures = {pool.submit(self._fetch, *job): job for job in jobs}
+					for future, (fname, part, _conditional) in futures.items():
+						try:
+							fetched[part] = future.result()
+						except Exception as e:
+							errors[fname] = e
+						self._count(done=1)
+				summary = {'downloaded': [], 'unchanged': [], 'failed': errors}
+				for fname, parts in HS.FILES.items():
+					if fname in errors:
+						continue
+					if all(fetched[part][0] == 'unchanged' for part in parts):
+						summary['unchanged'].append(fname)
+						continue
+					self._assemble(fname, fetched)
+					summary['downloaded'].append(fname)
+				if not any(name in errors for name in HS.WAD_FILES):
+					self._compile_wad(fetched)
+				return summary
+			finally:
+				self._write_meta()
+				if self.session is not None:
+					self.session.close()
+	
 	# Hash storage (minimal version of LtMAO hash_helper.Storage)
 	class _HashStorage:
+		"""
+		Reference counted: read_all_hashes() loads the tables only for the first user and every
+		free_all_hashes() releases one use, so nested and concurrent users (repath -> repair, the
+		WADs of a multi-WAD run) share a single load instead of freeing each other's tables.
+		"""
 		hashtables = {}
+		_users = 0
+		_lock = threading.Lock()
 		
 		@staticmethod
 		def read_all_hashes(hashes_dir: Path):
 			"""Read all hashes from hashes/ directory."""
 			_HashStorage = WizardApp._HashStorage
-			_HashStorage.hashtables = {}
-			bin_files = ['hashes.binentries.txt', 'hashes.binhashes.txt', 'hashes.bintypes.txt', 'hashes.binfields.txt']
-			wad_files = ['hashes.game.txt', 'hashes.lcu.txt']
-			for fname in bin_files + wad_files:
-				_HashStorage.hashtables[fname] = {}
-				fpath = hashes_dir / fname
-				if not fpath.is_file():
-					continue
-				sep = 16 if fname in wad_files else 8
-				with open(fpath, 'r', encoding='utf-8') as f:
-					for line in f:
-						if len(line) <= sep:
-							continue
-						key = line[:sep]
-						val = line[sep+1:-1]
-						_HashStorage.hashtables[fname][key] = val
+			with _HashStorage._lock:
+				_HashStorage._users += 1
+				if _HashStorage._users > 1 and _HashStorage.hashtables:
+					return
+				hashtables = {}
+				bin_files = ['hashes.binentries.txt', 'hashes.binhashes.txt', 'hashes.bintypes.txt', 'hashes.binfields.txt']
+				wad_files = ['hashes.game.txt', 'hashes.lcu.txt']
+				for fname in bin_files + wad_files:
+					hashtables[fname] = {}
+					fpath = hashes_dir / fname
+					sep = 16 if fname in wad_files else 8
+					if fpath.is_file():
+						with open(fpath, 'r', encoding='utf-8') as f:
+							for line in f:
+								if len(line) <= sep:
+									continue
+								key = line[:sep]
+								val = line[sep+1:-1]
+								hashtables[fname][key] = val
+					# user-discovered hashes win over the downloaded table
+					hashtables[fname].update(WizardApp._HashDelta.read_user(hashes_dir, fname))
+				_HashStorage.hashtables = hashtables
 		
 		@staticmethod
 		def free_all_hashes():
-			WizardApp._HashStorage.hashtables = {}
+			_HashStorage = WizardApp._HashStorage
+			with _HashStorage._lock:
+				_HashStorage._users = max(0, _HashStorage._users - 1)
+				if _HashStorage._users == 0:
+					_HashStorage.hashtables = {}
+		
+		@staticmethod
+		def reset():
+			"""Drop the tables whatever the count, so uses leaked by a failed run cannot keep stale ones."""
+			_HashStorage = WizardApp._HashStorage
+			with _HashStorage._lock:
+				_HashStorage._users = 0
+				_HashStorage.hashtables = {}
+	
+	class _PathHasher:
+		"""
+		Shared path -> unified hash service for bum and pyntex. Results are memoized in a bounded LRU,
+		so a path mentioned by many BINs is normalized and hashed once per run.
+		"""
+		MAX_ENTRIES = 1 << 16
+		
+		@staticmethod
+		@functools.lru_cache(maxsize=MAX_ENTRIES)
+		def unify(path: str) -> str:
+			"""bumpath rules: slashes and case normalized, hex names and hashed file names kept as is."""
+			W = pyRitoFile.wad.WADHasher
+			p = path.replace('\\','/').lower()
+			if W.is_hash(p):
+				return p
+			basename = p.split('.')[0]
+			if W.is_hash(basename):
+				return basename
+			return W.raw_to_hex(p)
+		
+		@staticmethod
+		@functools.lru_cache(maxsize=MAX_ENTRIES)
+		def unify_raw(path: str) -> str:
+			"""pyntex rules: same as unify() but the path is not normalized first."""
+			W = pyRitoFile.wad.WADHasher
+			# if the path is straight up hex
+			if W.is_hash(path):
+				return path
+			# if the path is hashed file
+			basename = path.split('.')[0]
+			if W.is_hash(basename):
+				return basename
+			# if the path is pure raw
+			return W.raw_to_hex(path)
+		
+		@staticmethod
+		def unify_many(paths, raw: bool = False) -> list:
+			"""Batch form of unify()/unify_raw(): duplicates in paths are resolved once."""
+			unify = WizardApp._PathHasher.unify_raw if raw else WizardApp._PathHasher.unify
+			memo = {}
+			res = []
+			for path in paths:
+				if path not in memo:
+					memo[path] = unify(path)
+				res.append(memo[path])
+			return res
+		
+		@staticmethod
+		def clear():
+			WizardApp._PathHasher.unify.cache_clear()
+			WizardApp._PathHasher.unify_raw.cache_clear()
+			pyRitoFile.wad.WADHasher.raw_to_hex.cache_clear()
+	
+	class _BINLinkGraph:
+		"""
+		Links between BINs, keyed by unified path. Adjacency keeps link order; the closure of a
+		BIN (everything it links, directly or not) is computed once with sets and then reused.
+		"""
+		def __init__(self):
+			self.links = {}  # unify_file -> [unify_link, ...] in link order
+			self.names = {}  # raw link string -> unify_link, so callers never re-hash a link
+			self.cycles = []  # (unify_file, unify_link) back edges found by closure()
+			self._closures = {}
+		
+		def __contains__(self, unify_file):
+			return unify_file in self.links
+		
+		def add_bin(self, unify_file):
+			self.links.setdefault(unify_file, [])
+			self._closures = {}
+		
+		def add_link(self, unify_file, link, unify_link):
+			self.names[link] = unify_link
+			adjacent = self.links.setdefault(unify_file, [])
+			if unify_link not in adjacent:
+				adjacent.append(unify_link)
+			self._closures = {}
+		
+		def closure(self, unify_file) -> list:
+			"""BINs reachable from unify_file, depth first in link order, unify_file itself excluded."""
+			if unify_file not in self._closures:
+				order = []
+				seen = {unify_file}
+				on_stack = {unify_file}
+				stack = [(unify_file, iter(self.links.get(unify_file, ())))]
+				while stack:
+					current, children = stack[-1]
+					for child in children:
+						if child in on_stack:
+							self.cycles.append((current, child))
+							print(f"[DEBUG] BIN link cycle: {current} -> {child}")
+						if child in seen:
+							continue
+						seen.add(child)
+						on_stack.add(child)
+						order.append(child)
+						stack.append((child, iter(self.links.get(child, ()))))
+						break
+					else:
+						stack.pop()
+						on_stack.discard(current)
+				self._closures[unify_file] = (order, frozenset(order))
+			return list(self._closures[unify_file][0])
+		
+		def closure_set(self, unify_file) -> frozenset:
+			self.closure(unify_file)
+			return self._closures[unify_file][1]
+		
+		def unlinked(self, unify_file, links) -> list:
+			"""links of unify_file that do not point into its closure (what is left after combining)."""
+			closure = self.closure_set(unify_file)
+			return [link for link in links if self.names.get(link) not in closure]
 	
 	class _LocalBum:
-		def __init__(self, project_root: Path, custom_prefix: str = 'bum'):
+		def __init__(self, project_root: Path, custom_prefix: str = 'bum', bin_cache=None, progress=None):
 			self._py = pyRitoFile
 			self.custom_prefix = custom_prefix  # Store custom prefix
+			self.bin_cache = bin_cache if bin_cache is not None else WizardApp._BinCache()
+			self.progress = progress  # progress(stage, done, total, nbytes), e.g. WizardApp._report_progress
 			self.source_dirs = []
 			self.source_files = {}
 			self.source_bins = {}
 			self.scanned_tree = {}
 			self.entry_prefix = {}
 			self.entry_name = {}
-			self.linked_bins = {}
+			self.linked_bins = WizardApp._BINLinkGraph()
 		
 		def unify_path(self, path: str) -> str:
-			W = self._py.wad.WADHasher
-			p = path.replace('\\','/').lower()
-			if W.is_hash(p):
-				return p
-			basename = p.split('.')[0]
-			if W.is_hash(basename):
-				return basename
-			return W.raw_to_hex(p)
+			return WizardApp._PathHasher.unify(path)
+		
+		def _report(self, done, total, nbytes=0):
+			# called per file, so it doubles as the cancellation checkpoint
+			WizardApp._CancelToken.check()
+			if self.progress is not None:
+				self.progress("Writing repathed files", done, total, nbytes)
 		
 		def add_source_dirs(self, dirs: list[str]):
 			self.source_dirs += dirs
 			for sd in dirs:
+				walked = []
 				for root, _dirs, files in os.walk(sd):
 					for f in files:
 						full = str(Path(root)/f)
-						rel = Path(os.path.relpath(full, sd)).as_posix()
-						rel_lower = rel.lower()
-						u = self.unify_path(rel)
-						if u not in self.source_files:
-							self.source_files[u] = (full, rel)
-							if rel.lower().endswith('.bin'):
-								self.source_bins[u] = False
+						walked.append((full, Path(os.path.relpath(full, sd)).as_posix()))
+				self._add_source_files(walked)
+		
+		def add_overlay(self, tree):
+			"""Like add_source_dirs for a WizardApp._OverlayTree: mod files shadow fresh files, nothing is copied."""
+			self.source_dirs += [str(layer) for layer in tree.layers]
+			self._add_source_files(list(tree.walk()))
+		
+		def _add_source_files(self, walked):
+			unified = WizardApp._PathHasher.unify_many(rel for _full, rel in walked)
+			for (full, rel), u in zip(walked, unified):
+				if u not in self.source_files:
+					self.source_files[u] = (full, rel)
+					if rel.lower().endswith('.bin'):
+						self.source_bins[u] = False
 		
 		def _is_character_bin(self, path):
 			path = path.lower()
@@ -974,16 +2293,19 @@ class WizardApp:
 					scan_value(field.data, field.type, entry_hash)
 			
 			def scan_bin(bin_path, unify_file):
-				bin = self._py.bin.BIN().read(bin_path)
-				self.linked_bins[unify_file] = []
+				bin = self.bin_cache.get(bin_path)
+				WizardApp._StageTimer.count(read=os.path.getsize(bin_path), files=1)
+				self.linked_bins.add_bin(unify_file)
 				for link in bin.links:
 					if self._is_character_bin(link):
 						continue
 					unify_link = self.unify_path(link)
 					if unify_link in self.source_files:
 						self.scanned_tree['All_BINs'][unify_link] = (True, link)
-						scan_bin(self.source_files[unify_link][0], unify_link)
-						self.linked_bins[unify_file].append(unify_link)
+						# each BIN is scanned once, which also stops link cycles
+						if unify_link not in self.linked_bins:
+							scan_bin(self.source_files[unify_link][0], unify_link)
+						self.linked_bins.add_link(unify_file, link, unify_link)
 					else:
 						self.scanned_tree['All_BINs'][unify_link] = (False, link)
 				for entry in bin.entries:
@@ -999,22 +2321,19 @@ class WizardApp:
 				if self.source_bins[unify_file]:
 					full, rel = self.source_files[unify_file]
 					self.scanned_tree['All_BINs'][unify_file] = (True, rel)
-					scan_bin(full, unify_file)
+					if unify_file not in self.linked_bins:
+						scan_bin(full, unify_file)
 			
 			self.scanned_tree = dict(sorted(self.scanned_tree.items(), key=lambda item: self.entry_name[item[0]]))
 		
-		def _flat_list_linked_bins(self, source_unify_file, linked_bins):
-			res = []
-			def list_linked_bins(unify_file):
-				for linked_unify_file in linked_bins[unify_file]:
-					if linked_unify_file not in res and linked_unify_file != source_unify_file:
-						res.append(linked_unify_file)
-						list_linked_bins(linked_unify_file)
-			list_linked_bins(source_unify_file)
-			return res
+		def _existing_files(self):
+			"""Compact form of scanned_tree that bum needs: entry hash -> unified files found in the source folders."""
+			return {
+				entry_hash: {unify_file for unify_file, (existed, _short_file) in files.items() if existed}
+				for entry_hash, files in self.scanned_tree.items()
+			}
 		
-		def bum(self, output_dir, ignore_missing=False, combine_linked=False):
-			"""Exact bum logic from LtMAO-hai/bumpath.py"""
+		def _bum_bin_file(self, source_path, output_path, existing, ignore_missing):
 			def bum_value(value, value_type, entry_hash):
 				if value_type == self._py.bin.BINType.STRING:
 					value_lower = value.lower()
@@ -1025,9 +2344,7 @@ class WizardApp:
 						
 						unify_file = self.unify_path(value_lower)
 						# Check if file exists in scanned tree
-						existed = False
-						if entry_hash in self.scanned_tree and unify_file in self.scanned_tree[entry_hash]:
-							existed, path = self.scanned_tree[entry_hash][unify_file]
+						existed = entry_hash in existing and unify_file in existing[entry_hash]
 						
 						# Repath if file exists OR if we're ignoring missing files (repath missing files too)
 						if existed or ignore_missing:
@@ -1063,14 +2380,93 @@ class WizardApp:
 				else:
 					field.data = bum_value(field.data, field.type, entry_hash)
 			
-			def bum_bin(bin_path):
-				bin = self._py.bin.BIN().read(bin_path)
-				for entry in bin.entries:
-					entry_hash = entry.hash
-					for field in entry.data:
-						bum_field(field, entry_hash)
-				bin.write(bin_path)
-			
+			# parsed from source, written straight to output
+			bin = self.bin_cache.get(source_path, writable=True)
+			for entry in bin.entries:
+				entry_hash = entry.hash
+				for field in entry.data:
+					bum_field(field, entry_hash)
+			self.bin_cache.write(bin, output_path)
+		
+		# Per worker process state for the BIN process pool, set once by _pool_init
+		_pool_state = None
+		
+		@staticmethod
+		def _pool_init(custom_prefix, entry_prefix, existing, ignore_missing):
+			# worker processes keep no parsed trees around: every BIN is rewritten exactly once
+			bum = WizardApp._LocalBum(PROJECT_ROOT, custom_prefix, bin_cache=WizardApp._BinCache(max_memory=0))
+			bum.entry_prefix = entry_prefix
+			WizardApp._LocalBum._pool_state = (bum, existing, ignore_missing)
+		
+		@staticmethod
+		def _pool_bum_bins(jobs):
+			bum, existing, ignore_missing = WizardApp._LocalBum._pool_state
+			for source_file, output_file in jobs:
+				bum._bum_bin_file(source_file, output_file, existing, ignore_missing)
+			return len(jobs)
+		
+		@staticmethod
+		def _pool_bum_group(state, jobs):
+			# shared pool task: the scan results of the WAD the group belongs to travel with it
+			WizardApp._LocalBum._pool_init(*state)
+			return WizardApp._LocalBum._pool_bum_bins(jobs)
+		
+		def _bum_bins_in_pool(self, jobs, existing, ignore_missing, workers, pool=None):
+			"""
+			Rewrite BINs on a process pool. On a pool of its own the compact scan results are shipped
+			once per worker (pool initializer) and every BIN is its own task, biggest first so the pool
+			stays balanced. On a shared pool (the WADs of a multi-WAD run) the BINs go as one
+			size-balanced group per worker, each carrying the scan results.
+			Cancel is checked between results; pending tasks are dropped, running ones finish.
+			"""
+			from concurrent.futures import ProcessPoolExecutor, as_completed
+			from concurrent.futures.process import BrokenProcessPool
+			state = (self.custom_prefix, self.entry_prefix, existing, ignore_missing)
+			ordered = sorted(jobs, key=lambda job: os.path.getsize(job[0]), reverse=True)
+			own_pool = pool is None
+			try:
+				if own_pool:
+					pool = ProcessPoolExecutor(
+						max_workers=min(workers, len(jobs)),
+						initializer=WizardApp._LocalBum._pool_init,
+						initargs=state
+					)
+					futures = [pool.submit(WizardApp._LocalBum._pool_bum_bins, [job]) for job in ordered]
+				else:
+					groups = [[] for _ in range(min(workers, len(jobs)))]
+					loads = [0] * len(groups)
+					# biggest BINs first, each to the least loaded group
+					for job in ordered:
+						i = loads.index(min(loads))
+						groups[i].append(job)
+						loads[i] += os.path.getsize(job[0])
+					futures = [pool.submit(WizardApp._LocalBum._pool_bum_group, state, group) for group in groups]
+				try:
+					for future in as_completed(futures):
+						future.result()
+						WizardApp._CancelToken.check()
+				except WizardApp._Cancelled:
+					for future in futures:
+						future.cancel()
+					raise
+				finally:
+					if own_pool:
+						pool.shutdown(cancel_futures=True)
+			except (BrokenProcessPool, OSError) as e:
+				print(f"[DEBUG] BIN process pool unavailable ({e}), rewriting BINs in this process")
+				for source_file, output_file in jobs:
+					self._bum_bin_file(source_file, output_file, existing, ignore_missing)
+			for source_file, output_file in jobs:
+				# written by another process: drop anything this process cached for the path
+				self.bin_cache.invalidate(output_file)
+				WizardApp._StageTimer.count(read=os.path.getsize(source_file), written=os.path.getsize(output_file), files=1)
+		
+		def bum(self, output_dir, ignore_missing=False, combine_linked=False, workers=1, pool=None):
+			"""
+			Exact bum logic from LtMAO-hai/bumpath.py.
+			With workers > 1 the BINs are rewritten on a process pool (pool if given, else one of
+			their own), the combine step still runs here.
+			"""
 			# error checks
 			if len(self.scanned_tree) == 0:
 				raise Exception('bumpath: Error: No entry scanned, make sure you select at least one source BIN.')
@@ -1083,10 +2479,16 @@ class WizardApp:
 			# clean up output
 			shutil.rmtree(output_dir, ignore_errors=True)
 			# actual bum
+			existing = self._existing_files()
+			bin_jobs = {}  # output file -> source file, each BIN rewritten once
 			bum_files = {}
+			total = sum(len(files) for files in self.scanned_tree.values())
+			done = 0
 			for entry_hash in self.scanned_tree:
 				prefix = self.entry_prefix[entry_hash]
 				for unify_file in self.scanned_tree[entry_hash]:
+					self._report(done, total)
+					done += 1
 					existed, short_file = self.scanned_tree[entry_hash][unify_file]
 					# bum outside
 					if not short_file.endswith('.bin'):
@@ -1106,25 +2508,30 @@ class WizardApp:
 						if extension != '':
 							basename += extension
 						output_file = os.path.join(output_dir, basename)
-					# copy
 					os.makedirs(os.path.dirname(output_file), exist_ok=True)
-					shutil.copy(source_file, output_file)
-					# bum inside bins
-					if output_file.endswith('.bin'):
-						bum_bin(output_file)
 					bum_files[unify_file] = output_file
+					if output_file.endswith('.bin'):
+						# bum inside bins
+						if workers > 1:
+							bin_jobs[output_file] = source_file
+							continue
+						self._bum_bin_file(source_file, output_file, existing, ignore_missing)
+					else:
+						# copy (hardlink where possible, assets are never modified afterwards)
+						WizardApp._FileMaterializer.materialize(source_file, output_file)
+					WizardApp._StageTimer.count(read=os.path.getsize(source_file), written=os.path.getsize(output_file), files=1)
 					# Removed per-file logging to reduce console spam
+			if bin_jobs:
+				jobs = [(source_file, output_file) for output_file, source_file in bin_jobs.items()]
+				self._bum_bins_in_pool(jobs, existing, ignore_missing, workers, pool)
+			self._report(total, total)
 			# combine bin
 			if combine_linked:
 				for unify_file in self.source_bins:
 					if self.source_bins[unify_file]:
-						source_bin = self._py.bin.BIN().read(bum_files[unify_file])
-						linked_unify_files = self._flat_list_linked_bins(unify_file, self.linked_bins)
-						new_links = []
-						for link in source_bin.links:
-							if not self.unify_path(link) in linked_unify_files:
-								new_links.append(link)
-						source_bin.links = new_links
+						source_bin = self.bin_cache.get(bum_files[unify_file], writable=True)
+						linked_unify_files = self.linked_bins.closure(unify_file)
+						source_bin.links = self.linked_bins.unlinked(unify_file, source_bin.links)
 						
 						# Track existing entry hashes to avoid duplicates
 						existing_entry_hashes = set()
@@ -1139,7 +2546,7 @@ class WizardApp:
 							if not os.path.exists(bum_file):
 								continue
 							try:
-								linked_bin = self._py.bin.BIN().read(bum_file)
+								linked_bin = self.bin_cache.get(bum_file)
 								# Only add entries that don't already exist (by hash)
 								new_entries = []
 								for entry in linked_bin.entries:
@@ -1151,182 +2558,356 @@ class WizardApp:
 									if hasattr(entry, 'hash'):
 										existing_entry_hashes.add(entry.hash)
 								os.remove(bum_file)
+								self.bin_cache.invalidate(bum_file)
 							except Exception as e:
 								print(f"[DEBUG] Error combining linked BIN {linked_unify_file}: {e}")
 								continue
-						source_bin.write(bum_files[unify_file])
+						self.bin_cache.write(source_bin, bum_files[unify_file])
 						print(f'bumpath: Finish: Combine all linked BINs to {bum_files[unify_file]}.')
 			# remove empty dirs
 			for root, dirs, files in os.walk(output_dir, topdown=False):
 				if len(os.listdir(root)) == 0:
 					os.rmdir(root)
 			print(f'bumpath: Finish: Bum {output_dir}.')
+		
+		def _bum_path(self, path: str) -> str:
+			if '/' in path:
+				first_slash = path.index('/')
+				return path[:first_slash] + f'/{self.custom_prefix}' + path[first_slash:]
+			return f'{self.custom_prefix}/' + path
+		
+		def repath(self, output_dir, ignore_missing=False, combine_linked=False):
+			"""
+			Fused scan + bum: every BIN is decoded once, existence is decided from source_files
+			during the same walk, and linked BINs are combined from the trees already in memory.
+			Produces the same output as scan() followed by bum().
+			"""
+			BINType = self._py.bin.BINType
+			
+			def output_path(short_file):
+				output_file = os.path.join(output_dir, short_file.lower())
+				if len(os.path.basename(output_file)) > 255:
+					extension = os.path.splitext(short_file)[1]
+					basename = self._py.wad.WADHasher.raw_to_hex(short_file)
+					if extension != '':
+						basename += extension
+					output_file = os.path.join(output_dir, basename)
+				return output_file
+			
+			bins = {}  # unify_file -> [rewritten BIN, output file]
+			mentioned_bins = {}  # BINs only mentioned by a string: unify_file -> output file
+			copies = {}  # output file -> source file
+			missing = []  # (owner, short_file)
+			
+			def bum_value(value, value_type, owner):
+				if value_type == BINType.STRING:
+					value_lower = value.lower()
+					if 'assets/' in value_lower or 'data/' in value_lower:
+						# NEVER repath VO paths (voice-over files)
+						if 'assets/sounds/wwise2016/vo/' in value_lower:
+							return value
+						unify_file = self.unify_path(value_lower)
+						# strings in BINs that were never scanned count as missing, as in bum()
+						existed = owner is not None and unify_file in self.source_files
+						if owner is not None:
+							if existed:
+								short_file = value if value.endswith('.bin') else self._bum_path(value)
+								output_file = output_path(short_file)
+								if output_file.endswith('.bin'):
+									mentioned_bins.setdefault(unify_file, output_file)
+								else:
+									copies[output_file] = self.source_files[unify_file][0]
+							else:
+								missing.append((owner, value))
+						# Repath if file exists OR if we're ignoring missing files (repath missing files too)
+						if existed or ignore_missing:
+							return self._bum_path(value)
+				elif value_type in (BINType.LIST, BINType.LIST2):
+					value.data = [bum_value(v, value_type, owner) for v in value.data]
+				elif value_type in (BINType.EMBED, BINType.POINTER):
+					if value.data != None:
+						for f in value.data:
+							bum_field(f, owner)
+				return value
+			
+			def bum_field(field, owner):
+				if field.type in (BINType.LIST, BINType.LIST2):
+					field.data = [bum_value(value, field.value_type, owner) for value in field.data]
+				elif field.type in (BINType.EMBED, BINType.POINTER):
+					if field.data != None:
+						for f in field.data:
+							bum_field(f, owner)
+				elif field.type == BINType.MAP:
+					field.data = {
+						bum_value(key, field.key_type, owner): bum_value(value, field.value_type, owner)
+						for key, value in field.data.items()
+					}
+				elif field.type == BINType.OPTION and field.value_type == BINType.STRING:
+					if field.data != None:
+						field.data = bum_value(field.data, field.value_type, owner)
+				else:
+					field.data = bum_value(field.data, field.type, owner)
+			
+			def bum_bin(bin, collect):
+				for entry in bin.entries:
+					# owner None: rewrite strings only, nothing is collected
+					owner = entry.hash if collect else None
+					for field in entry.data:
+						bum_field(field, owner)
+			
+			def visit_bin(bin_path, unify_file, short_file):
+				if unify_file in bins:
+					return
+				WizardApp._CancelToken.check()
+				bin = self.bin_cache.get(bin_path, writable=True)
+				WizardApp._StageTimer.count(read=os.path.getsize(bin_path), files=1)
+				bins[unify_file] = [bin, output_path(short_file)]
+				self.linked_bins.add_bin(unify_file)
+				for link in bin.links:
+					if self._is_character_bin(link):
+						continue
+					unify_link = self.unify_path(link)
+					if unify_link in self.source_files:
+						visit_bin(self.source_files[unify_link][0], unify_link, link)
+						self.linked_bins.add_link(unify_file, link, unify_link)
+					else:
+						missing.append(('All_BINs', link))
+				bum_bin(bin, collect=True)
+			
+			# walk: source BINs and everything they link, once each
+			for unify_file in self.source_bins:
+				if self.source_bins[unify_file]:
+					full, rel = self.source_files[unify_file]
+					visit_bin(full, unify_file, rel)
+			if len(bins) == 0:
+				raise Exception('bumpath: Error: No entry scanned, make sure you select at least one source BIN.')
+			if not ignore_missing and missing:
+				owner, short_file = missing[0]
+				raise Exception(f'bumpath: Error: {owner}/{short_file} is missing/not found in Source Folders.')
+			# BINs that are only mentioned in strings are repathed too, but not scanned
+			for unify_file, output_file in mentioned_bins.items():
+				if unify_file not in bins:
+					bin = self.bin_cache.get(self.source_files[unify_file][0], writable=True)
+					bum_bin(bin, collect=False)
+					bins[unify_file] = [bin, output_file]
+			# combine linked BINs in memory
+			merged = set()
+			if combine_linked:
+				for unify_file in self.source_bins:
+					if not self.source_bins[unify_file] or unify_file in merged:
+						continue
+					source_bin = bins[unify_file][0]
+					linked_unify_files = self.linked_bins.closure(unify_file)
+					source_bin.links = self.linked_bins.unlinked(unify_file, source_bin.links)
+					existing_entry_hashes = set(entry.hash for entry in source_bin.entries)
+					for linked_unify_file in linked_unify_files:
+						if linked_unify_file not in bins or linked_unify_file in merged:
+							continue
+						new_entries = [entry for entry in bins[linked_unify_file][0].entries if entry.hash not in existing_entry_hashes]
+						source_bin.entries += new_entries
+						existing_entry_hashes.update(entry.hash for entry in new_entries)
+						merged.add(linked_unify_file)
+					print(f'bumpath: Finish: Combine all linked BINs to {bins[unify_file][1]}.')
+			# write output
+			shutil.rmtree(output_dir, ignore_errors=True)
+			total = len(copies) + len(bins) - len(merged)
+			done = 0
+			written = 0
+			self._report(done, total)
+			for output_file, source_file in copies.items():
+				os.makedirs(os.path.dirname(output_file), exist_ok=True)
+				WizardApp._FileMaterializer.materialize(source_file, output_file)
+				size = os.path.getsize(output_file)
+				WizardApp._StageTimer.count(read=size, written=size, files=1)
+				done += 1
+				written += size
+				self._report(done, total, written)
+			for unify_file, (bin, output_file) in bins.items():
+				if unify_file in merged:
+					continue
+				os.makedirs(os.path.dirname(output_file), exist_ok=True)
+				self.bin_cache.write(bin, output_file)
+				size = os.path.getsize(output_file)
+				WizardApp._StageTimer.count(written=size, files=1)
+				done += 1
+				written += size
+				self._report(done, total, written)
+			print(f'bumpath: Finish: Bum {output_dir}.')
 
-	def _repath_fresh(self, fresh_unpack: Path) -> bool:
-		# Load hashes before starting (from AppData, not bundled)
-		hashes_dir = self._hash_dir()
-		self._set_status("Loading hash tables...")
-		WizardApp._HashStorage.read_all_hashes(hashes_dir)
-		
-		# Get custom prefix or generate random one
-		prefix = self.custom_prefix.get().strip()
+	def _resolve_prefix(self) -> str:
+		"""Custom prefix, or a random one; stored for later use (e.g., placeholder creation, pyntex)."""
+		prefix = self._form['prefix']
 		if not prefix:
 			prefix = self._generate_random_prefix()
 			self._set_status(f"Using randomly generated prefix: {prefix}")
 		else:
 			self._set_status(f"Using custom prefix: {prefix}")
-		
-		# Store prefix for later use (e.g., placeholder creation)
 		self._used_prefix = prefix
+		return prefix
+
+	def _repath_fresh(self, tree: '_OverlayTree', champ: str = None, prefix: str = None, bin_pool: tuple = None) -> bool:
+		"""Repath the mod laid over the fresh extract (tree: WizardApp._OverlayTree, mod layer first).
+
+		champ and prefix default to the detected champion and the prefix chosen here; the
+		multi-WAD mode passes its own per WAD, output goes to repathed_<champ> either way.
+		bin_pool is (executor, workers) of a BIN process pool shared with other WADs.
+		"""
+		# Load hashes before starting (from AppData, not bundled)
+		hashes_dir = self._hash_dir()
+		self._set_status("Loading hash tables...")
+		WizardApp._HashStorage.read_all_hashes(hashes_dir)
+		try:
+			if prefix is None:
+				prefix = self._resolve_prefix()
 		
-		# Local repath engine with custom prefix
-		bum = self._LocalBum(self._project_root(), custom_prefix=prefix)
+			# Local repath engine with custom prefix
+			bum = self._LocalBum(self._project_root(), custom_prefix=prefix, bin_cache=self._bin_cache, progress=self._report_progress)
 		
-		bum.add_source_dirs([str(fresh_unpack)])
-		# Determine champion and desired skin index
-		champ = getattr(self, '_champion', '').lower()
-		desired_raw = (self.main_bin_choice.get() or '').strip()
-		desired = desired_raw.lower()
-		if not champ:
-			self._set_status("Champion not detected from wad; cannot repath.")
-			WizardApp._HashStorage.free_all_hashes()
-			return False
-		if not desired:
-			self._set_status("Please enter a main BIN name (e.g., Skin0) before repath.")
-			WizardApp._HashStorage.free_all_hashes()
-			return False
-		# Extract index from desired (e.g., 'skin5' -> 5), treat 'base' as 0
-		import re
-		if desired == 'base':
-			skin_idx = '0'
-		else:
-			m = re.search(r"(skin)?\s*(\d+)", desired)
-			skin_idx = m.group(2) if m else None
-		# Search within ALL character subfolders for the selected skin
-		# e.g., for annie: check annie/skins and annietibbers/skins
-		# e.g., for thresh: check thresh/skins and lantern/skins
-		characters_dir = fresh_unpack / 'data' / 'characters'
-		selected_unifys = []
-		available = []
-		
-		# Find all character subfolders
-		if not characters_dir.exists():
-			self._set_status(f"Characters folder not found: {characters_dir}")
-			WizardApp._HashStorage.free_all_hashes()
-			return False
+			bum.add_overlay(tree)
+			# Determine champion and desired skin index
+			single = champ is None
+			champ = (getattr(self, '_champion', '') if single else champ).lower()
+			desired_raw = self._form['main_bin']
+			desired = desired_raw.lower()
+			if not champ:
+				self._set_status("Champion not detected from wad; cannot repath.")
+				return False
+			if not desired:
+				self._set_status("Please enter a main BIN name (e.g., Skin0) before repath.")
+				return False
+			# Extract index from desired (e.g., 'skin5' -> 5), treat 'base' as 0
+			import re
+			if desired == 'base':
+				skin_idx = '0'
+			else:
+				m = re.search(r"(skin)?\s*(\d+)", desired)
+				skin_idx = m.group(2) if m else None
+			# Search within ALL character subfolders for the selected skin
+			# e.g., for annie: check annie/skins and annietibbers/skins
+			# e.g., for thresh: check thresh/skins and lantern/skins
+			character_bins = [rel for _full, rel in tree.walk('data/characters')]
+			selected_unifys = []
+			available = []
 		
-		# Scan ALL character subfolders for the selected skin
-		for char_folder in characters_dir.iterdir():
-			if not char_folder.is_dir():
-				continue
+			# Find all character subfolders
+			if not character_bins:
+				self._set_status(f"Characters folder not found: {tree.layers[-1] / 'data' / 'characters'}")
+				return False
+		
+			# Scan ALL character subfolders for the selected skin
+			for rel in character_bins:
+				# data/characters/<char>/skins/...
+				parts = rel.split('/')
+				if len(parts) < 5 or parts[3].lower() != 'skins':
+					continue
+				char_name = parts[2]
+				f = parts[-1]
 			
-			skins_dir = char_folder / 'skins'
-			if not skins_dir.exists():
-				continue
+				# Look for BINs matching the selected skin
+				if not f.lower().endswith('.bin'):
+					continue
+				available.append(rel)
 			
-			# Look for BINs matching the selected skin
-			for root, _dirs, files in os.walk(skins_dir):
-				for f in files:
-					if not f.lower().endswith('.bin'):
-						continue
-					p = Path(root) / f
-					rel = Path(os.path.relpath(p, fresh_unpack)).as_posix()
-					available.append(rel)
-					
-					# Check if this BIN matches the selected skin
-					# Match by filename or path containing the skin identifier
-					if skin_idx is not None:
-						# Check if in correct skin folder (e.g., /skins/skin0/)
-						if f"/skins/skin{skin_idx}/" in rel.lower():
-							selected_unifys.append(bum.unify_path(rel))
-						# Check if filename matches (e.g., skin0.bin)
-						elif f.lower() == f"skin{skin_idx}.bin":
-							selected_unifys.append(bum.unify_path(rel))
-						# Check if expected main BIN (e.g., annie_skins_skin0.bin)
-						expected = f"{char_folder.name.lower()}_skins_skin{skin_idx}.bin"
-						if f.lower() == expected:
-							selected_unifys.append(bum.unify_path(rel))
-					# Also match by name contains (for manual input)
-					if desired in rel.lower() and desired not in ['skin', 'base']:
+				# Check if this BIN matches the selected skin
+				# Match by filename or path containing the skin identifier
+				if skin_idx is not None:
+					# Check if in correct skin folder (e.g., /skins/skin0/)
+					if f"/skins/skin{skin_idx}/" in rel.lower():
+						selected_unifys.append(bum.unify_path(rel))
+					# Check if filename matches (e.g., skin0.bin)
+					elif f.lower() == f"skin{skin_idx}.bin":
+						selected_unifys.append(bum.unify_path(rel))
+					# Check if expected main BIN (e.g., annie_skins_skin0.bin)
+					expected = f"{char_name.lower()}_skins_skin{skin_idx}.bin"
+					if f.lower() == expected:
 						selected_unifys.append(bum.unify_path(rel))
+				# Also match by name contains (for manual input)
+				if desired in rel.lower() and desired not in ['skin', 'base']:
+					selected_unifys.append(bum.unify_path(rel))
 		
-		if not selected_unifys:
-			preview = ', '.join(available[:8]) + (', ...' if len(available) > 8 else '')
-			self._set_status(f"Main BIN not found for '{desired_raw}'. Found examples: {preview}")
-			WizardApp._HashStorage.free_all_hashes()
-			return False
-		if not selected_unifys:
-			self._set_status("Could not resolve selected BIN(s) to source set.")
-			WizardApp._HashStorage.free_all_hashes()
-			return False
+			if not selected_unifys:
+				preview = ', '.join(available[:8]) + (', ...' if len(available) > 8 else '')
+				self._set_status(f"Main BIN not found for '{desired_raw}'. Found examples: {preview}")
+				return False
+			if not selected_unifys:
+				self._set_status("Could not resolve selected BIN(s) to source set.")
+				return False
+		
+			for u in selected_unifys:
+				bum.source_bins[u] = True
+				if u not in bum.source_files:
+					found = tree.lookup_hash(u)
+					if found is not None:
+						bum.source_files[u] = found
+			# Repair, scan, and bum
+			# Only repair BINs from the main champion folder (not subfolders like annietibbers, lantern)
+			fixed = 0
+			main_champ_path = f"data/characters/{champ}/"
+			for u in selected_unifys:
+				try:
+					bin_path = bum.source_files.get(u, (None, None))[0]
+					if not bin_path:
+						found = tree.lookup_hash(u)
+						bin_path = found[0] if found is not None else None
+					if bin_path and str(bin_path).lower().endswith('.bin'):
+						# Only repair if BIN is in the main champion folder
+						bin_path_normalized = str(bin_path).replace('\\', '/')
+						if main_champ_path in bin_path_normalized:
+							self._set_status(f"Repairing BIN before repath: {os.path.basename(bin_path)}")
+							self._repair_bin_file(Path(bin_path))
+							fixed += 1
+						else:
+							print(f"[DEBUG] Skipping repair for subfolder BIN: {bin_path}")
+				except Exception:
+					pass
+			self._set_status(f"Repaired {fixed} BIN(s); merging CAC entries...")
+			# Merge CAC entries from fresh folder into main skin bin
+			for u in selected_unifys:
+				try:
+					bin_path = bum.source_files.get(u, (None, None))[0]
+					if not bin_path:
+						found = tree.lookup_hash(u)
+						bin_path = found[0] if found is not None else None
+					if bin_path and str(bin_path).lower().endswith('.bin'):
+						bin_path_normalized = str(bin_path).replace('\\', '/')
+						if main_champ_path in bin_path_normalized:
+							self._merge_cac_entries_from_fresh(Path(bin_path), tree)
+				except Exception as e:
+					print(f"[DEBUG] Error merging CAC entries: {e}")
+					pass
 		
-		for u in selected_unifys:
-			bum.source_bins[u] = True
-			if u not in bum.source_files:
-				cand = fresh_unpack / Path(u)
-				if cand.exists():
-					bum.source_files[u] = (str(cand), u)
-		# Repair, scan, and bum
-		# Only repair BINs from the main champion folder (not subfolders like annietibbers, lantern)
-		fixed = 0
-		main_champ_path = f"data/characters/{champ}/"
-		for u in selected_unifys:
+			self._set_status(f"Repaired {fixed} BIN(s); preparing repath (champ={champ})...")
+			# Use champion name in the repathed folder name
+			output_dir = self._work_root() / f'repathed_{champ}'
+			if single:
+				# Store the repathed folder path for later use
+				self._repathed_dir = output_dir
+			self._set_status("Repathing (ignore missing, combine linked)...")
 			try:
-				bin_path = bum.source_files.get(u, (None, None))[0]
-				if not bin_path:
-					cand = fresh_unpack / Path(u)
-					bin_path = str(cand) if cand.exists() else None
-				if bin_path and str(bin_path).lower().endswith('.bin'):
-					# Only repair if BIN is in the main champion folder
-					bin_path_normalized = str(bin_path).replace('\\', '/')
-					if main_champ_path in bin_path_normalized:
-						self._set_status(f"Repairing BIN before repath: {os.path.basename(bin_path)}")
-						self._repair_bin_file(Path(bin_path))
-						fixed += 1
+				pool, workers = bin_pool if bin_pool is not None else (None, self._repath_workers())
+				with self._timer.stage('repath'):
+					if workers > 1:
+						# BINs rewritten on a process pool, scan and combine stay in this process
+						bum.scan()
+						bum.bum(str(output_dir), ignore_missing=True, combine_linked=True, workers=workers, pool=pool)
 					else:
-						print(f"[DEBUG] Skipping repair for subfolder BIN: {bin_path}")
-			except Exception:
-				pass
-		self._set_status(f"Repaired {fixed} BIN(s); merging CAC entries...")
-		# Merge CAC entries from fresh folder into main skin bin
-		for u in selected_unifys:
-			try:
-				bin_path = bum.source_files.get(u, (None, None))[0]
-				if not bin_path:
-					cand = fresh_unpack / Path(u)
-					bin_path = str(cand) if cand.exists() else None
-				if bin_path and str(bin_path).lower().endswith('.bin'):
-					bin_path_normalized = str(bin_path).replace('\\', '/')
-					if main_champ_path in bin_path_normalized:
-						self._merge_cac_entries_from_fresh(Path(bin_path), fresh_unpack)
-			except Exception as e:
-				print(f"[DEBUG] Error merging CAC entries: {e}")
-				pass
-		
-		self._set_status(f"Repaired {fixed} BIN(s); scanning for repath (champ={champ})...")
-		bum.scan()
-		# Use champion name in the repathed folder name
-		output_dir = self._work_root() / f'repathed_{champ}'
-		# Store the repathed folder path for later use
-		self._repathed_dir = output_dir
-		self._set_status("Repathing (ignore missing, combine linked)...")
-		try:
-			bum.bum(str(output_dir), ignore_missing=True, combine_linked=True)
+						# Single pass: scan and bum fused, each BIN decoded once
+						bum.repath(str(output_dir), ignore_missing=True, combine_linked=True)
 			
-			# Copy VO files separately with their original paths (no prefix, no hashing)
-			self._set_status("Copying VO files with original paths...")
-			vo_count = self._copy_vo_files_original(fresh_unpack, output_dir)
-			if vo_count > 0:
-				self._set_status(f"Repath done: {output_dir} ({vo_count} VO files copied)")
-			else:
-				self._set_status(f"Repath done: {output_dir}")
+				# Copy VO files separately with their original paths (no prefix, no hashing)
+				self._set_status("Copying VO files with original paths...")
+				vo_count = self._copy_vo_files_original(tree, output_dir)
+				if vo_count > 0:
+					self._set_status(f"Repath done: {output_dir} ({vo_count} VO files copied)")
+				else:
+					self._set_status(f"Repath done: {output_dir}")
 			
+				return True
+			except Exception as e:
+				self._set_status(f"Repath failed: {e}")
+				return False
+		finally:
 			WizardApp._HashStorage.free_all_hashes()
-			return True
-		except Exception as e:
-			self._set_status(f"Repath failed: {e}")
-			WizardApp._HashStorage.free_all_hashes()
-			return False
 
 	def _package_repathed(self) -> bool:
 		try:
@@ -1335,30 +2916,25 @@ class WizardApp:
 			if not repathed_dir.exists():
 				self._set_status("No repathed output to package.")
 				return False
-			fantome = Path(self.fantome_path.get().strip())
+			fantome = Path(self._form['fantome'])
 			member = getattr(self, '_fantome_member_path', None)
 			if not member:
 				self._set_status("Original wad member path unknown; cannot build new fantome.")
 				return False
-			wad_name = Path(member).name
-			# pack repathed_dir -> new wad
-			new_wad_path = work_root / f"{wad_name}"
+			# pack repathed_dir -> new wad (kept in memory, streamed into the zip below)
 			self._set_status("Packing WAD from repathed_test...")
-			self._pack_wad(repathed_dir, new_wad_path)
+			wad_writer = self._build_wad_writer(repathed_dir)
 			# build new fantome with same structure, replacing member
 			new_fantome = fantome.with_name(f"{fantome.stem}_repathed{fantome.suffix}")
 			self._set_status(f"Creating new fantome: {new_fantome.name}")
 			import zipfile as _zip
 			with _zip.ZipFile(fantome, 'r') as zin, _zip.ZipFile(new_fantome, 'w', compression=_zip.ZIP_DEFLATED) as zout:
 				for item in zin.infolist():
-					data = zin.read(item.filename)
 					if item.filename.replace('\\', '/') == member.replace('\\', '/'):
 						# replace with new wad
-						with open(new_wad_path, 'rb') as f:
-							data = f.read()
-						zout.writestr(item.filename, data)
+						self._write_wad_member(zout, item.filename, wad_writer)
 					else:
-						zout.writestr(item, data)
+						zout.writestr(item, zin.read(item.filename))
 			self._set_status(f"New fantome written: {new_fantome}")
 			
 			# Clean up temporary folders (keep repathed_test for user inspection and missing files check)
@@ -1371,18 +2947,16 @@ class WizardApp:
 				# DON'T delete repathed_test - user may want to check missing files
 				# if (work_root / 'repathed_test').exists():
 				#     shutil.rmtree(work_root / 'repathed_test', ignore_errors=True)
-				if new_wad_path.exists():
-					os.remove(new_wad_path)
 				self._set_status(f"Done! Output: {new_fantome}. Click 'Check Missing Files' to verify.")
 			except Exception as cleanup_err:
 				self._set_status(f"Cleanup warning: {cleanup_err} | Output: {new_fantome}")
 			
 			# Mark step 3 as complete and automatically check for missing files
 			self.step_completed[3] = True
-			self.root.after(0, self._update_nav)
+			self._ui_call(self._update_nav)
 			
 			# Automatically check for missing textures and move to step 5
-			self.root.after(100, lambda: threading.Thread(target=self._auto_check_and_fix_missing, daemon=True).start())
+			threading.Thread(target=self._auto_check_and_fix_missing, daemon=True).start()
 			
 			return True
 		except Exception as e:
@@ -1437,7 +3011,8 @@ class WizardApp:
 			# Only remove specific known folders/files to avoid nuking everything
 			safe_to_remove = [
 				'mod_extract',
-				'fresh_extract'
+				'fresh_extract',
+				'multi'
 			]
 			
 			for item_name in safe_to_remove:
@@ -1462,13 +3037,22 @@ class WizardApp:
 				except Exception:
 					pass
 			
-			missing_json = work_root / 'missing_files_report.json'
-			if missing_json.exists():
+			# missing_files_report.json, plus one per WAD of a multi-WAD run
+			for missing_json in work_root.glob('missing_files_report*.json'):
 				try:
 					missing_json.unlink()
 				except Exception:
 					pass
 			
+			timing_json = work_root / 'timing_report.json'
+			if timing_json.exists():
+				try:
+					timing_json.unlink()
+				except Exception:
+					pass
+			shutil.rmtree(work_root / 'profile', ignore_errors=True)
+			shutil.rmtree(work_root / 'stages', ignore_errors=True)
+			
 			# Remove any loose .wad.client files in the root (from previous runs)
 			if work_root.exists():
 				for item in work_root.iterdir():
@@ -1485,14 +3069,27 @@ class WizardApp:
 	
 	def _detect_and_extract(self):
 		try:
-			champs_dir = Path(self.champions_dir.get().strip())
-			fantome_path = self.fantome_path.get().strip()
-			mod_folder_path = self.mod_folder_path.get().strip()
+			champs_dir = Path(self._form['champions_dir'])
+			fantome_path = self._form['fantome']
+			mod_folder_path = self._form['mod_folder']
 			work_root = self._work_root()
 			
-			# Safe cleanup of previous run leftovers
-			self._set_status("Cleaning up previous run files...")
-			self._safe_cleanup_work_folder(work_root)
+			# A run with the same inputs that crashed or was cancelled resumes after its last completed stage
+			markers = WizardApp._StageMarkers(work_root, self._run_inputs())
+			self._markers = markers
+			if markers.resumable():
+				self._set_status("Resuming previous run from its last completed stage...")
+			else:
+				# Safe cleanup of previous run leftovers
+				self._set_status("Cleaning up previous run files...")
+				self._safe_cleanup_work_folder(work_root)
+			self._timer = self._new_stage_timer()
+			self._bin_cache.clear()
+			WizardApp._PathHasher.clear()
+			WizardApp._HashStorage.reset()
+			self._wad_hashtable = None
+			self._champions_index = None
+			self._wad_jobs = []
 			
 			mod_dir = work_root / 'mod_extract'
 			fresh_dir = work_root / 'fresh_extract'
@@ -1513,18 +3110,24 @@ class WizardApp:
 				champ_name = self._detect_champion_from_folder(mod_folder, champs_dir)
 				if not champ_name:
 					self._set_status("Aborted: Could not auto-detect champion from mod folder.")
-					messagebox.showerror(APP_TITLE, "Could not detect champion from mod folder structure.\nPlease ensure the folder contains data/characters/{champion}/ structure.")
+					self._ui_call(messagebox.showerror, APP_TITLE, "Could not detect champion from mod folder structure.\nPlease ensure the folder contains data/characters/{champion}/ structure.")
 					return
 				
 				self._champion = champ_name
 				wad_name = f"{champ_name}.wad.client"
-				self.detected_wad_name.set(f"Auto-detected: {champ_name}")
+				self._progress.set(self.detected_wad_name, f"Auto-detected: {champ_name}")
 				
 				# Copy mod folder to mod_extract/unpacked
-				self._set_status("Copying mod folder to work directory...")
 				mod_unpack = mod_dir / 'unpacked'
-				shutil.copytree(mod_folder, mod_unpack, dirs_exist_ok=True)
-				ok_mod = True  # Mod folder copy succeeded
+				done = markers.get('extract_mod')
+				if done is not None:
+					ok_mod = done['ok']
+				else:
+					self._set_status("Copying mod folder to work directory...")
+					# hardlinked where possible: BINs rewritten later are detached first, the user's folder stays intact
+					shutil.copytree(mod_folder, mod_unpack, dirs_exist_ok=True, copy_function=WizardApp._FileMaterializer.materialize)
+					ok_mod = True  # Mod folder copy succeeded
+					markers.mark('extract_mod', {'ok': ok_mod})
 				
 				# Find fresh wad in champions folder
 				self._set_status("Locating fresh .wad.client in Champions folder...")
@@ -1533,14 +3136,9 @@ class WizardApp:
 					self._set_status(f"Aborted: could not find {wad_name} under Champions folder.")
 					return
 				
-				# Copy fresh wad to work dir
-				fresh_wad_copy = fresh_dir / wad_name
-				shutil.copy2(fresh_wad_file, fresh_wad_copy)
-				
-				# Extract fresh wad
-				self._set_status("Unpacking fresh .wad.client (best-effort)...")
+				# Copy fresh wad to work dir and extract it
 				fresh_unpack = fresh_dir / 'unpacked'
-				ok_fresh = self._try_extract_wad(fresh_wad_copy, fresh_unpack, hashes_dir)
+				ok_fresh = self._extract_fresh_stage(markers, fresh_wad_file, fresh_dir / wad_name, fresh_unpack, hashes_dir)
 				
 			else:
 				# FANTOME MODE: Original extraction logic
@@ -1549,36 +3147,34 @@ class WizardApp:
 				self._set_status("Detecting champion .wad.client inside .fantome...")
 				member = self._detect_wad_member_in_fantome(fantome, champs_dir)
 				if not member:
-					self.detected_wad_name.set("No champion wad found in .fantome")
+					self._progress.set(self.detected_wad_name, "No champion wad found in .fantome")
 					self._set_status("Aborted: .fantome does not contain a champion wad client.")
 					return
+				members = getattr(self, '_matched_fantome_wads', [member])
+				if self._form['all_wads'] and len(members) > 1:
+					self._extract_all_wads(fantome, champs_dir, hashes_dir, members, markers)
+					return
 				self._fantome_member_path = member
 				wad_name = Path(member).name
 				# store champion from wad basename (e.g., Sivir.wad.client -> sivir)
 				self._champion = wad_name.split('.')[0].lower()
-				self.detected_wad_name.set(f"Detected: {wad_name}")
+				self._progress.set(self.detected_wad_name, f"Detected: {wad_name}")
 
 				# extract mod wad file (using exact member path)
-				self._set_status("Extracting mod .wad.client from .fantome...")
 				mod_wad_path = mod_dir / wad_name
-				self._extract_file_from_fantome(fantome, member, mod_wad_path)
+				if markers.get('mod_wad') is None:
+					self._set_status("Extracting mod .wad.client from .fantome...")
+					self._extract_file_from_fantome(fantome, member, mod_wad_path)
 
-				# FIRST: Extract hashes from the fantome before unpacking the wad
-				# This improves the quality of wad unpacking by having more hash data available
-				try:
-					self._set_status("Extracting hashes from fantome files...")
-					# First do a quick unpack to get BIN files for hash extraction
-					temp_unpack = mod_dir / 'temp_for_hashes'
-					temp_unpack.mkdir(parents=True, exist_ok=True)
-					temp_ok = self._try_extract_wad(mod_wad_path, temp_unpack, hashes_dir)
-					if temp_ok:
-						self._extract_hashes_from_folder(temp_unpack, hashes_dir)
-						# Clean up temp folder
-						shutil.rmtree(temp_unpack, ignore_errors=True)
-					else:
-						self._set_status("Hash extraction skipped: could not unpack wad for hash extraction")
-				except Exception as e:
-					self._set_status(f"Hash extraction skipped: {e}")
+					# FIRST: Extract hashes from the fantome before unpacking the wad
+					# This improves the quality of wad unpacking by having more hash data available
+					try:
+						self._set_status("Extracting hashes from fantome files...")
+						# BIN chunks are parsed straight from the wad, so it is only unpacked once (below)
+						self._extract_hashes_from_wad(mod_wad_path, hashes_dir)
+					except Exception as e:
+						self._set_status(f"Hash extraction skipped: {e}")
+					markers.mark('mod_wad')
 
 				# find fresh wad in champions, with '.clien' → '.client' fallback
 				self._set_status("Locating fresh .wad.client in Champions folder...")
@@ -1591,57 +3187,67 @@ class WizardApp:
 				if not fresh_wad_file.exists():
 					self._set_status(f"Aborted: could not find {wad_name} under Champions folder.")
 					return
-				# copy fresh wad to work dir for transparency
-				fresh_wad_copy = fresh_dir / wad_name
-				shutil.copy2(fresh_wad_file, fresh_wad_copy)
-
 				# NOW unpack with improved hashes
-				self._set_status("Unpacking mod .wad.client with extracted hashes...")
 				mod_unpack = mod_dir / 'unpacked'
-				ok_mod = self._try_extract_wad(mod_wad_path, mod_unpack, hashes_dir)
+				done = markers.get('extract_mod')
+				if done is not None:
+					ok_mod = done['ok']
+				else:
+					self._set_status("Unpacking mod .wad.client with extracted hashes...")
+					ok_mod = self._try_extract_wad(mod_wad_path, mod_unpack, hashes_dir)
+					markers.mark('extract_mod', {'ok': ok_mod})
 
-				self._set_status("Unpacking fresh .wad.client (best-effort)...")
+				# copy fresh wad to work dir for transparency, then unpack it
 				fresh_unpack = fresh_dir / 'unpacked'
-				ok_fresh = self._try_extract_wad(fresh_wad_copy, fresh_unpack, hashes_dir)
+				ok_fresh = self._extract_fresh_stage(markers, fresh_wad_file, fresh_dir / wad_name, fresh_unpack, hashes_dir)
 
 			# After fresh extract, run TEX→DDS conversion using LtMAO.Ritoddstex if available
-			try:
-				self._set_status("Converting TEX → DDS in fresh_extract...")
-				self._convert_all_tex_to_dds(fresh_unpack)
-			except Exception as e:
-				self._set_status(f"TEX→DDS conversion skipped: {e}")
+			if markers.get('tex2dds') is None:
+				try:
+					self._set_status("Converting TEX → DDS in fresh_extract...")
+					self._convert_all_tex_to_dds(fresh_unpack)
+					markers.mark('tex2dds')
+				except Exception as e:
+					self._set_status(f"TEX→DDS conversion skipped: {e}")
 
 			# Hash extraction already done earlier for fantome mode
 			# For mod folder mode, extract hashes now since we have the unpacked files
-			if mod_folder_path:
+			if mod_folder_path and markers.get('mod_hashes') is None:
 				try:
 					self._set_status("Extracting hashes from mod files...")
 					self._extract_hashes_from_folder(mod_unpack, hashes_dir)
+					markers.mark('mod_hashes')
 				except Exception as e:
 					self._set_status(f"Hash extraction skipped: {e}")
 
 			# Convert DDS↔TEX in mod subfolders BEFORE overlay
 			# This ensures mod's edited textures match what BINs reference
 			champ = getattr(self, '_champion', '').lower()
-			try:
-				self._set_status("Converting textures in character subfolders (before overlay)...")
-				self._convert_dds_tex_in_subfolders(fresh_unpack, mod_unpack, champ)
-			except Exception as e:
-				self._set_status(f"Texture conversion skipped: {e}")
-				print(f"[DEBUG] Texture conversion error: {e}")
+			if markers.get('convert_textures') is None:
+				try:
+					self._set_status("Converting textures in character subfolders (before overlay)...")
+					self._convert_dds_tex_in_subfolders(fresh_unpack, mod_unpack, champ)
+					markers.mark('convert_textures')
+				except Exception as e:
+					self._set_status(f"Texture conversion skipped: {e}")
+					print(f"[DEBUG] Texture conversion error: {e}")
 			
-			# Overlay: copy mod extracted content over fresh extracted content (overwrite)
-			self._set_status("Overlaying mod over fresh (overwrite)...")
-			copied, skipped = self._overlay_copy(mod_unpack, fresh_unpack)
+			# Overlay: mod extracted content shadows fresh extracted content, resolved on lookup (nothing is copied)
+			self._set_status("Overlaying mod over fresh...")
+			with self._timer.stage('overlay'):
+				tree = WizardApp._OverlayTree(mod_unpack, fresh_unpack)
+				merged = len(tree.listing())
+				from_mod = sum(1 for full, _rel in tree.walk() if Path(full).is_relative_to(mod_unpack))
 			
 			# Populate BIN dropdown with available skins from the mod
 			self._populate_bin_dropdown(mod_unpack)
 			
-			self._set_status(f"Overlay complete: copied {copied}, skipped {skipped}. Proceed to Step 3 to choose main BIN and Next to repath.")
+			self._set_status(f"Overlay complete: {merged} files, {from_mod} from the mod. Proceed to Step 3 to choose main BIN and Next to repath.")
+			self._timer.write_report(self._timing_report_path())
 
 			# Mark step 1 as complete and enable Next button
 			self.step_completed[1] = True
-			self.root.after(0, self._update_nav)
+			self._ui_call(self._update_nav)
 
 			# Do not repath here; wait for user to proceed to Step 3/4
 
@@ -1657,6 +3263,121 @@ class WizardApp:
 		except Exception as e:
 			self._set_status(f"Error: {e}")
 
+	def _extract_fresh_stage(self, markers: '_StageMarkers', fresh_wad_file: Path, fresh_wad_copy: Path, fresh_unpack: Path, hashes_dir: Path) -> bool:
+		"""Copy the fresh wad into the work folder and unpack it, unless a resumed run already did."""
+		done = markers.get('extract_fresh')
+		if done is not None:
+			return done['ok']
+		WizardApp._FileMaterializer.materialize(fresh_wad_file, fresh_wad_copy)
+		self._set_status("Unpacking fresh .wad.client (best-effort)...")
+		ok_fresh = self._try_extract_wad(fresh_wad_copy, fresh_unpack, hashes_dir)
+		markers.mark('extract_fresh', {'ok': ok_fresh})
+		return ok_fresh
+
+	def _run_wad_jobs(self, stage: str, func, jobs: list) -> None:
+		"""Run func(job) for every WAD job still without an error, each on its own worker thread.
+
+		A job that raises keeps the message in job.error and the others go on; the cancel token
+		of the calling job is handed to the workers, so Cancel reaches all of them.
+		"""
+		from concurrent.futures import ThreadPoolExecutor, as_completed
+		token = getattr(WizardApp._CancelToken._local, 'token', None)
+		
+		def run(job):
+			WizardApp._CancelToken._local.token = token
+			try:
+				func(job)
+			except WizardApp._Cancelled:
+				raise
+			except Exception as e:
+				job.error = str(e) or type(e).__name__
+				print(f"[DEBUG] {stage} failed for {job.wad_name}: {e}")
+				import traceback
+				traceback.print_exc()
+			finally:
+				WizardApp._CancelToken._local.token = None
+		
+		pending = [job for job in jobs if job.error is None]
+		if not pending:
+			return
+		with ThreadPoolExecutor(max_workers=len(pending), thread_name_prefix='wad') as pool:
+			futures = [pool.submit(run, job) for job in pending]
+			for done, future in enumerate(as_completed(futures), 1):
+				future.result()
+				self._set_status(f"{stage}: {done}/{len(pending)} WADs done")
+	
+	def _extract_all_wads(self, fantome: Path, champs_dir: Path, hashes_dir: Path, members: list, markers: '_StageMarkers'):
+		"""Multi-WAD mode of _detect_and_extract: every matched champion WAD is extracted and prepared on its own worker."""
+		work_root = self._work_root()
+		jobs = []
+		for member in members:
+			job = WizardApp._WadJob(work_root, member, markers)
+			if any(other.champion == job.champion for other in jobs):
+				continue
+			# Champions folder is walked once for the whole run (_champions_files)
+			job.fresh_wad = self._find_fresh_wad(champs_dir, job.wad_name)
+			jobs.append(job)
+		self._progress.set(self.detected_wad_name, f"Detected {len(jobs)} WADs: {', '.join(job.wad_name for job in jobs)}")
+		# The first WAD drives the BIN dropdown and info.json, as in single-WAD mode
+		self._champion = jobs[0].champion
+		self._fantome_member_path = jobs[0].member
+		
+		def extract_mod_wad(job):
+			if job.markers.get('mod_wad') is not None:
+				return
+			self._extract_file_from_fantome(fantome, job.member, job.mod_wad)
+			try:
+				self._extract_hashes_from_wad(job.mod_wad, hashes_dir)
+			except Exception as e:
+				print(f"[DEBUG] Hash extraction skipped for {job.wad_name}: {e}")
+			job.markers.mark('mod_wad')
+		
+		self._set_status(f"Extracting {len(jobs)} WADs from .fantome and extracting their hashes...")
+		self._run_wad_jobs("Extracting WADs", extract_mod_wad, jobs)
+		
+		# All WADs unpack with one compiled table, loaded once every WAD's hashes are in
+		self._set_status("Loading WAD hash tables...")
+		self._load_compiled_wad_hashtables(hashes_dir)
+		
+		def unpack(job):
+			done = job.markers.get('extract_mod')
+			if done is None:
+				done = {'ok': self._try_extract_wad(job.mod_wad, job.mod_unpack, hashes_dir)}
+				job.markers.mark('extract_mod', done)
+			if not done['ok']:
+				raise RuntimeError("mod WAD could not be unpacked")
+			if job.fresh_wad is None:
+				raise RuntimeError(f"{job.wad_name} not found under Champions folder")
+			job.fresh_wad_copy.parent.mkdir(parents=True, exist_ok=True)
+			if not self._extract_fresh_stage(job.markers, job.fresh_wad, job.fresh_wad_copy, job.fresh_unpack, hashes_dir):
+				raise RuntimeError("fresh WAD could not be unpacked")
+			if job.markers.get('tex2dds') is None:
+				self._convert_all_tex_to_dds(job.fresh_unpack)
+				job.markers.mark('tex2dds')
+			if job.markers.get('convert_textures') is None:
+				self._convert_dds_tex_in_subfolders(job.fresh_unpack, job.mod_unpack, job.champion)
+				job.markers.mark('convert_textures')
+		
+		self._set_status(f"Unpacking {len(jobs)} mod and fresh WADs in parallel...")
+		self._run_wad_jobs("Unpacking WADs", unpack, jobs)
+		
+		self._wad_jobs = jobs
+		self._populate_bin_dropdown(jobs[0].mod_unpack)
+		self._timer.write_report(self._timing_report_path())
+		
+		failed = [f"{job.wad_name}: {job.error}" for job in jobs if job.error is not None]
+		if len(failed) == len(jobs):
+			self._set_status(f"Aborted: no WAD could be extracted ({'; '.join(failed)})")
+			return
+		if failed:
+			self._set_status(f"Extracted {len(jobs) - len(failed)}/{len(jobs)} WADs, skipped {'; '.join(failed)}. Proceed to Step 3.")
+		else:
+			self._set_status(f"Extracted {len(jobs)} WADs. Proceed to Step 3 to choose the main BIN used for every WAD, and Next to repath.")
+		
+		# Mark step 1 as complete and enable Next button
+		self.step_completed[1] = True
+		self._ui_call(self._update_nav)
+
 	def _tex2dds(self, tex_path: Path, dds_path: Path) -> None:
 		# Minimal port of LtMAO.Ritoddstex.tex2dds using pyRitoFile
 		sys.path.insert(0, str(self._project_root()))
@@ -1721,25 +3442,31 @@ class WizardApp:
 					bs.write(block_data)
 			else:
 				bs.write(tex.data[0])
+			WizardApp._StageTimer.count(read=os.path.getsize(tex_path), written=bs.tell(), files=1)
 
 	# ---------- TEX → DDS conversion ----------
+	@_timed_stage('tex_conversion')
 	def _convert_all_tex_to_dds(self, root_dir: Path) -> None:
 		root = Path(root_dir)
 		if not root.exists():
 			return
 		converted = 0
 		failed = 0
-		for dirpath, _dirnames, filenames in os.walk(root):
-			for name in filenames:
-				if not name.lower().endswith('.tex'):
-					continue
-				tex_path = Path(dirpath) / name
-				dds_path = tex_path.with_suffix('.dds')
-				try:
-					self._tex2dds(tex_path, dds_path)
-					converted += 1
-				except Exception:
-					failed += 1
+		tex_paths = [
+			Path(dirpath) / name
+			for dirpath, _dirnames, filenames in os.walk(root)
+			for name in filenames if name.lower().endswith('.tex')
+		]
+		self._report_progress("TEX→DDS", 0, len(tex_paths))
+		for index, tex_path in enumerate(tex_paths, 1):
+			WizardApp._CancelToken.check()
+			dds_path = tex_path.with_suffix('.dds')
+			try:
+				self._tex2dds(tex_path, dds_path)
+				converted += 1
+			except Exception:
+				failed += 1
+			self._report_progress("TEX→DDS", index, len(tex_paths))
 		self._set_status(f"TEX→DDS: converted {converted}, failed {failed}")
 	
 	# ---------- DDS → TEX conversion ----------
@@ -1887,7 +3614,9 @@ class WizardApp:
 		
 		# Write TEX file
 		tex.write(str(tex_path))
+		WizardApp._StageTimer.count(read=os.path.getsize(dds_path), written=os.path.getsize(tex_path), files=1)
 	
+	@_timed_stage('tex_conversion')
 	def _convert_dds_tex_in_subfolders(self, fresh_unpack: Path, mod_unpack: Path, main_champion: str) -> None:
 		"""
 		Convert DDS↔TEX in mod's asset subfolders based on fresh unpack structure.
@@ -1948,6 +3677,7 @@ class WizardApp:
 				current_path = Path(dirpath)
 				
 				for name in filenames:
+					WizardApp._CancelToken.check()
 					name_lower = name.lower()
 					files_found += 1
 					
@@ -2066,7 +3796,7 @@ class WizardApp:
 					if not self.main_bin_choice.get():
 						print(f"[DEBUG populate_bin_dropdown] Setting default to: {sorted_bins[0]}")
 						self.main_bin_choice.set(sorted_bins[0])
-				self.root.after(0, update_dropdown)
+				self._ui_call(update_dropdown)
 			else:
 				print("[DEBUG populate_bin_dropdown] No bins found!")
 		except Exception as e:
@@ -2077,129 +3807,213 @@ class WizardApp:
 			self._set_status(f"Warning: Could not populate BIN dropdown: {e}")
 
 	def _run_repath_current(self):
+		if getattr(self, '_wad_jobs', None):
+			self._repath_all_wads()
+			return
 		try:
 			work_root = self._work_root()
 			fresh_unpack = work_root / 'fresh_extract' / 'unpacked'
 			if not fresh_unpack.exists():
 				self._set_status("Nothing to repath. Please run extraction first.")
 				return
-			self._set_status("Repathing merged content...")
-			repath_ok = self._repath_fresh(fresh_unpack)
+			markers = self._markers or WizardApp._StageMarkers(work_root, self._run_inputs())
+			# the repathed output depends on the chosen BIN and prefix too
+			repath_inputs = {
+				'main_bin': self._form['main_bin'],
+				'prefix': self._form['prefix'],
+			}
+			done = markers.get('repath', **repath_inputs)
+			if done is not None and Path(done['output']).exists():
+				self._set_status("Resuming: repath already completed for this BIN and prefix.")
+				self._repathed_dir = Path(done['output'])
+				self._used_prefix = done['prefix']
+				repath_ok = True
+			else:
+				self._set_status("Repathing merged content...")
+				repath_ok = self._repath_fresh(self._overlay_tree())
+				if repath_ok:
+					markers.mark('repath', {'output': str(self._repathed_dir), 'prefix': self._used_prefix}, **repath_inputs)
 			if repath_ok:
-				self._set_status("Repath complete. Cleaning up temporary files...")
-				# Clean up temporary extraction folders
-				try:
-					if (work_root / 'mod_extract').exists():
-						shutil.rmtree(work_root / 'mod_extract', ignore_errors=True)
-					if (work_root / 'fresh_extract').exists():
-						shutil.rmtree(work_root / 'fresh_extract', ignore_errors=True)
-				except Exception:
-					pass
-				
+				# Extract folders are kept until the final package is written, so a retry can resume from here
 				# Mark step 3 as complete
 				self.step_completed[3] = True
-				self.root.after(0, self._update_nav)
+				self._ui_call(self._update_nav)
 				
-				# Automatically check for missing textures and move to step 5
+				# Automatically check for missing textures and move to step 5 (same job, so Cancel still reaches it)
 				self._set_status("Repath complete! Checking for missing files...")
-				self.root.after(100, lambda: threading.Thread(target=self._auto_check_and_fix_missing, daemon=True).start())
+				self._auto_check_and_fix_missing()
 			else:
 				self._set_status("Repath step failed or skipped.")
 		except Exception as e:
 			self._set_status(f"Error: {e}")
 
+	def _repath_all_wads(self):
+		"""Multi-WAD mode of _run_repath_current: every WAD is repathed, fixed and packed on its own worker, then one zip pass writes them all."""
+		try:
+			jobs = [job for job in self._wad_jobs if job.error is None]
+			# the repathed output depends on the chosen BIN and prefix too
+			repath_inputs = {
+				'main_bin': self._form['main_bin'],
+				'prefix': self._form['prefix'],
+			}
+			# all WADs share one prefix; a resumed run keeps the (possibly random) one it repathed with
+			resumed = [job.markers.get('repath', **repath_inputs) for job in jobs]
+			prefix = next((done['prefix'] for done in resumed if done), None)
+			if prefix is None:
+				prefix = self._resolve_prefix()
+			self._used_prefix = prefix
+			
+			def repath(job):
+				done = job.markers.get('repath', **repath_inputs)
+				if done is not None and Path(done['output']).exists():
+					job.repathed_dir = Path(done['output'])
+				else:
+					if not self._repath_fresh(job.tree(), champ=job.champion, prefix=prefix, bin_pool=bin_pool):
+						raise RuntimeError("repath failed")
+					job.repathed_dir = self._work_root() / f'repathed_{job.champion}'
+					job.markers.mark('repath', {'output': str(job.repathed_dir), 'prefix': prefix}, **repath_inputs)
+				job.missing_count = self._fix_missing_textures(job.repathed_dir, self._work_root() / f'missing_files_report_{job.champion}.json')
+				job.writer = self._build_wad_writer(job.repathed_dir)
+			
+			# BIN hash tables are loaded once and shared by the workers' repath, repair, CAC merge and pyntex
+			self._set_status("Loading hash tables...")
+			WizardApp._HashStorage.read_all_hashes(self._hash_dir())
+			# one BIN process pool for every WAD: the per-WAD threads would each hold the GIL for
+			# their parse and write, or start a full pool of their own
+			bin_pool = None
+			workers = self._repath_workers(default=os.cpu_count() or 1)
+			if workers > 1:
+				from concurrent.futures import ProcessPoolExecutor
+				try:
+					bin_pool = (ProcessPoolExecutor(max_workers=workers), workers)
+				except OSError as e:
+					print(f"[DEBUG] BIN process pool unavailable ({e}), repathing the WADs in this process")
+			try:
+				self._set_status(f"Repathing {len(jobs)} WADs in parallel...")
+				self._run_wad_jobs("Repathing WADs", repath, jobs)
+			finally:
+				if bin_pool is not None:
+					bin_pool[0].shutdown(cancel_futures=True)
+				WizardApp._HashStorage.free_all_hashes()
+			
+			packed = [job for job in jobs if job.writer is not None]
+			failed = [f"{job.wad_name}: {job.error}" for job in self._wad_jobs if job.error is not None]
+			if not packed:
+				self._set_status(f"Repath failed for every WAD ({'; '.join(failed)})")
+				self._ui_call(lambda: self.retry_btn.configure(state=tk.NORMAL))
+				return
+			
+			# One pass over the original fantome replaces every repathed WAD member
+			self._set_status(f"Packaging final .fantome with {len(packed)} repathed WADs...")
+			fantome = Path(self._form['fantome'])
+			final_fantome = fantome.with_name(f"{fantome.stem}_repathed{fantome.suffix}")
+			self._write_fantome(fantome, final_fantome, {job.member: job.writer for job in packed}, self._champion)
+			for job in packed:
+				job.writer = None
+			self._finish_run(final_fantome, sum(job.missing_count for job in packed))
+			if failed:
+				# WADs that failed are kept as they were in the original fantome
+				self._set_status(f"✓ DONE with issues: {final_fantome.name} has {len(packed)} repathed WADs, kept original {'; '.join(failed)}")
+		except Exception as e:
+			self._set_status(f"Error during multi-WAD repath: {e}")
+			self._ui_call(lambda: self.retry_btn.configure(state=tk.NORMAL))
+
+	@_timed_stage('repair')
 	def _repair_bin_file(self, bin_path: Path):
 		# Inline minimal FrogFixes: StaticMaterial and HealthBar fixes
 		# Load BIN hash tables from AppData
 		hashes_dir = self._hash_dir()
 		WizardApp._HashStorage.read_all_hashes(hashes_dir)
+		try:
+			BIN = pyRitoFile.bin.BIN
+			BINField = pyRitoFile.bin.BINField
+			BINType = pyRitoFile.bin.BINType
 		
-		BIN = pyRitoFile.bin.BIN
-		BINField = pyRitoFile.bin.BINField
-		BINType = pyRitoFile.bin.BINType
-		
-		# Create bin_hashes dict: raw_name -> hex_hash (like CACHED_BIN_HASHES)
-		# The hashtables are hex -> raw, so we need to invert them
-		# Also store with capitalized first letter (CommunityDragon hashes are lowercase)
-		H = {}
-		for fname in ['hashes.binentries.txt', 'hashes.binhashes.txt', 'hashes.bintypes.txt', 'hashes.binfields.txt']:
-			if fname in WizardApp._HashStorage.hashtables:
-				for hex_hash, raw_name in WizardApp._HashStorage.hashtables[fname].items():
-					H[raw_name] = hex_hash
-					# Also add capitalized version for compatibility
-					if raw_name and raw_name[0].islower():
-						H[raw_name[0].upper() + raw_name[1:]] = hex_hash
-		b = BIN().read(str(bin_path))
-		# StaticMaterial fixes
-		for entry in b.entries:
-			if entry.type == H['StaticMaterialDef']:
-				for field in entry.data:
-					if field.hash == H['SamplerValues'] and isinstance(field.data, list):
-						for sampler_def in field.data or []:
-							if not hasattr(sampler_def, 'data') or sampler_def.data is None:
-								continue
-							sampler_name_entries = []
-							texture_name_entries = []
-							texture_path_entries = []
-							for sampler_value in sampler_def.data:
-								if sampler_value.hash == H['SamplerName']:
-									sampler_name_entries.append(sampler_value)
-								elif sampler_value.hash == H['TextureName']:
-									texture_name_entries.append(sampler_value)
-								elif sampler_value.hash == H['TexturePath']:
-									texture_path_entries.append(sampler_value)
-							# SamplerName -> TextureName
-							for sampler_value in sampler_name_entries:
-								sampler_value.hash = H['TextureName']
-							# TextureName -> TexturePath if no TexturePath yet and looks like a path
-							if texture_name_entries and not texture_path_entries:
-								for tn in texture_name_entries:
-									if isinstance(tn.data, str):
-										data_str = tn.data.lower()
-										if any(ext in data_str for ext in ['.dds', '.tga', '.png', 'assets/', 'characters/']):
-											tn.hash = H['TexturePath']
-		# HealthBar fixes
-		HEALTHBAR_NUMBER = 12
-		for entry in b.entries:
-			if entry.type == H['SkinCharacterDataProperties']:
-				has_hb = False
-				for s_prop in entry.data:
-					if getattr(s_prop, 'hash_type', None) == H['CharacterHealthBarDataRecord']:
-						has_hb = True
-						has_unit = False
-						for inside in s_prop.data or []:
-							if inside.hash == H['UnitHealthBarStyle']:
-								has_unit = True
-								if inside.data != HEALTHBAR_NUMBER:
-									inside.data = HEALTHBAR_NUMBER
-						if not has_unit:
-							new_field = BINField()
-							new_field.hash = H['UnitHealthBarStyle']
-							new_field.type = BINType.U8
-							new_field.data = HEALTHBAR_NUMBER
-							s_prop.data.append(new_field)
-				if not has_hb:
-					uh = BINField()
-					uh.hash = H['UnitHealthBarStyle']
-					uh.type = BINType.U8
-					uh.data = HEALTHBAR_NUMBER
-					hb = BINField()
-					hb.hash = H['HealthBarData']
-					hb.type = BINType.Embed
-					hb.hash_type = H['CharacterHealthBarDataRecord']
-					hb.data = [uh]
-					entry.data.append(hb)
-		# write back
-		b.write(str(bin_path))
-		WizardApp._HashStorage.free_all_hashes()
+			# Create bin_hashes dict: raw_name -> hex_hash (like CACHED_BIN_HASHES)
+			# The hashtables are hex -> raw, so we need to invert them
+			# Also store with capitalized first letter (CommunityDragon hashes are lowercase)
+			H = {}
+			for fname in ['hashes.binentries.txt', 'hashes.binhashes.txt', 'hashes.bintypes.txt', 'hashes.binfields.txt']:
+				if fname in WizardApp._HashStorage.hashtables:
+					for hex_hash, raw_name in WizardApp._HashStorage.hashtables[fname].items():
+						H[raw_name] = hex_hash
+						# Also add capitalized version for compatibility
+						if raw_name and raw_name[0].islower():
+							H[raw_name[0].upper() + raw_name[1:]] = hex_hash
+			b = self._bin_cache.get(bin_path, writable=True)
+			WizardApp._StageTimer.count(read=os.path.getsize(bin_path), files=1)
+			# StaticMaterial fixes
+			for entry in b.entries:
+				if entry.type == H['StaticMaterialDef']:
+					for field in entry.data:
+						if field.hash == H['SamplerValues'] and isinstance(field.data, list):
+							for sampler_def in field.data or []:
+								if not hasattr(sampler_def, 'data') or sampler_def.data is None:
+									continue
+								sampler_name_entries = []
+								texture_name_entries = []
+								texture_path_entries = []
+								for sampler_value in sampler_def.data:
+									if sampler_value.hash == H['SamplerName']:
+										sampler_name_entries.append(sampler_value)
+									elif sampler_value.hash == H['TextureName']:
+										texture_name_entries.append(sampler_value)
+									elif sampler_value.hash == H['TexturePath']:
+										texture_path_entries.append(sampler_value)
+								# SamplerName -> TextureName
+								for sampler_value in sampler_name_entries:
+									sampler_value.hash = H['TextureName']
+								# TextureName -> TexturePath if no TexturePath yet and looks like a path
+								if texture_name_entries and not texture_path_entries:
+									for tn in texture_name_entries:
+										if isinstance(tn.data, str):
+											data_str = tn.data.lower()
+											if any(ext in data_str for ext in ['.dds', '.tga', '.png', 'assets/', 'characters/']):
+												tn.hash = H['TexturePath']
+			# HealthBar fixes
+			HEALTHBAR_NUMBER = 12
+			for entry in b.entries:
+				if entry.type == H['SkinCharacterDataProperties']:
+					has_hb = False
+					for s_prop in entry.data:
+						if getattr(s_prop, 'hash_type', None) == H['CharacterHealthBarDataRecord']:
+							has_hb = True
+							has_unit = False
+							for inside in s_prop.data or []:
+								if inside.hash == H['UnitHealthBarStyle']:
+									has_unit = True
+									if inside.data != HEALTHBAR_NUMBER:
+										inside.data = HEALTHBAR_NUMBER
+							if not has_unit:
+								new_field = BINField()
+								new_field.hash = H['UnitHealthBarStyle']
+								new_field.type = BINType.U8
+								new_field.data = HEALTHBAR_NUMBER
+								s_prop.data.append(new_field)
+					if not has_hb:
+						uh = BINField()
+						uh.hash = H['UnitHealthBarStyle']
+						uh.type = BINType.U8
+						uh.data = HEALTHBAR_NUMBER
+						hb = BINField()
+						hb.hash = H['HealthBarData']
+						hb.type = BINType.Embed
+						hb.hash_type = H['CharacterHealthBarDataRecord']
+						hb.data = [uh]
+						entry.data.append(hb)
+			# write back
+			self._bin_cache.write(b, bin_path)
+			WizardApp._StageTimer.count(written=os.path.getsize(bin_path))
+		finally:
+			WizardApp._HashStorage.free_all_hashes()
 	
-	def _merge_cac_entries_from_fresh(self, main_bin_path: Path, fresh_unpack: Path):
-		"""Merge ALL CAC (ContextualActionData) entries from fresh folder BINs into main skin bin"""
+	@_timed_stage('cac_merge')
+	def _merge_cac_entries_from_fresh(self, main_bin_path: Path, tree: '_OverlayTree'):
+		"""Merge ALL CAC (ContextualActionData) entries from the overlay tree's BINs into main skin bin"""
+		# Load hashes
+		hashes_dir = self._hash_dir()
+		WizardApp._HashStorage.read_all_hashes(hashes_dir)
 		try:
-			# Load hashes
-			hashes_dir = self._hash_dir()
-			WizardApp._HashStorage.read_all_hashes(hashes_dir)
-			
 			BIN = pyRitoFile.bin.BIN
 			H = {}
 			for fname in ['hashes.binentries.txt', 'hashes.binhashes.txt', 'hashes.bintypes.txt', 'hashes.binfields.txt']:
@@ -2210,7 +4024,7 @@ class WizardApp:
 							H[raw_name[0].upper() + raw_name[1:]] = hex_hash
 			
 			# Read main bin
-			main_bin = BIN().read(str(main_bin_path))
+			main_bin = self._bin_cache.get(main_bin_path, writable=True)
 			
 			# Get existing CAC entry hashes from main bin
 			existing_cac_hashes = set()
@@ -2224,14 +4038,15 @@ class WizardApp:
 			
 			def scan_fresh_bin(bin_path: Path):
 				try:
-					bin_obj = BIN().read(str(bin_path))
+					bin_obj = self._bin_cache.get(bin_path)
+					WizardApp._StageTimer.count(read=os.path.getsize(bin_path), files=1)
 					
 					# Collect all CAC entries and their links
 					for entry in bin_obj.entries:
 						if entry.type == H.get('ContextualActionData') or entry.type == H.get('contextualactiondata'):
 							# Only add if not already in main bin
 							if entry.hash not in existing_cac_hashes:
-								found_cac_entries.append(entry)
+								found_cac_entries.append(entry.copy())
 								existing_cac_hashes.add(entry.hash)  # Prevent duplicates
 								# Also collect CAC links from this bin
 								for link in bin_obj.links:
@@ -2241,19 +4056,18 @@ class WizardApp:
 					pass  # Skip problematic BINs
 			
 			# Scan root of fresh folder
-			fresh_root_bins = list(fresh_unpack.glob('*.bin'))
-			for bin_file in fresh_root_bins:
-				scan_fresh_bin(bin_file)
+			for full, rel in tree.walk():
+				if '/' not in rel and rel.lower().endswith('.bin'):
+					scan_fresh_bin(Path(full))
 			
 			# Scan data folder (but not data/characters)
-			data_folder = fresh_unpack / 'data'
-			if data_folder.exists():
-				for bin_file in data_folder.rglob('*.bin'):
-					bin_path_str = str(bin_file).replace('\\', '/').lower()
-					# Skip data/characters subfolder
-					if '/data/characters/' in bin_path_str:
-						continue
-					scan_fresh_bin(bin_file)
+			for full, rel in tree.walk('data'):
+				if not rel.lower().endswith('.bin'):
+					continue
+				# Skip data/characters subfolder
+				if rel.lower().startswith('data/characters/'):
+					continue
+				scan_fresh_bin(Path(full))
 			
 			# Merge all found CAC entries into main bin
 			if found_cac_entries:
@@ -2266,53 +4080,60 @@ class WizardApp:
 						main_bin.links.append(link)
 				
 				# Write main bin with merged CAC entries
-				main_bin.write(str(main_bin_path))
+				self._bin_cache.write(main_bin, main_bin_path)
 				self._set_status(f"Merged {len(found_cac_entries)} CAC entries into main skin bin")
-			
-			WizardApp._HashStorage.free_all_hashes()
 		except Exception as e:
 			print(f"[DEBUG] Error in _merge_cac_entries_from_fresh: {e}")
 			import traceback
 			traceback.print_exc()
-			if 'hashes_dir' in locals():
-				WizardApp._HashStorage.free_all_hashes()
+		finally:
+			WizardApp._HashStorage.free_all_hashes()
 
 	def _pack_wad(self, raw_dir: Path, wad_file: Path) -> None:
 		# Local pack using pyRitoFile.wad (mirrors LtMAO.wad_tool.pack)
+		with open(wad_file, 'wb') as f:
+			self._build_wad_writer(raw_dir).write(f)
+
+	@_timed_stage('pack')
+	def _build_wad_writer(self, raw_dir: Path):
+		"""Compress every file under raw_dir into a WADWriter; the layout is computed in memory so it can stream into any file object."""
 		sys.path.insert(0, str(self._project_root()))
 		import pyRitoFile
 		raw_dir = Path(raw_dir)
-		wad_file = Path(wad_file)
-		chunk_datas = []
-		chunk_hashes = []
-		for root, dirs, files in os.walk(raw_dir):
-			for file in files:
-				if file == 'hashed_files.json':
-					continue
-				fpath = str(Path(root) / file)
-				relative_path = Path(fpath).relative_to(raw_dir).as_posix()
-				chunk_datas.append(fpath)
-				basename = Path(file).name
-				name_wo_ext = basename.split('.')[0]
-				relative_path_lower = relative_path.lower()
-				
-				# VO files should keep their original paths - never hash them
-				if 'assets/sounds/wwise2016/vo/' in relative_path_lower:
-					chunk_hashes.append(relative_path)
-				# if basename looks hashed and located at root, keep as hash
-				elif pyRitoFile.wad.WADHasher.is_hash(name_wo_ext) and relative_path == basename:
-					chunk_hashes.append(name_wo_ext)
-				else:
-					chunk_hashes.append(relative_path)
-		wad = pyRitoFile.wad.WAD()
-		wad.chunks = [pyRitoFile.wad.WADChunk.default() for _ in range(len(chunk_hashes))]
-		wad.write(str(wad_file))
-		with pyRitoFile.stream.BytesStream.updater(str(wad_file)) as bs:
-			for idx, chunk in enumerate(wad.chunks):
-				with open(chunk_datas[idx], 'rb') as f:
-					data = f.read()
-				chunk.write_data(bs, idx, chunk_hashes[idx], data, previous_chunks=wad.chunks[:idx])
-				chunk.free_data()
+		writer = pyRitoFile.wad.WADWriter()
+		walked = [(root, file) for root, dirs, files in os.walk(raw_dir) for file in files if file != 'hashed_files.json']
+		packed = 0
+		self._report_progress("Packing WAD", 0, len(walked))
+		for index, (root, file) in enumerate(walked, 1):
+			WizardApp._CancelToken.check()
+			fpath = str(Path(root) / file)
+			relative_path = Path(fpath).relative_to(raw_dir).as_posix()
+			basename = Path(file).name
+			name_wo_ext = basename.split('.')[0]
+			relative_path_lower = relative_path.lower()
+			
+			# VO files should keep their original paths - never hash them
+			if 'assets/sounds/wwise2016/vo/' in relative_path_lower:
+				chunk_hash = relative_path
+			# if basename looks hashed and located at root, keep as hash
+			elif pyRitoFile.wad.WADHasher.is_hash(name_wo_ext) and relative_path == basename:
+				chunk_hash = name_wo_ext
+			else:
+				chunk_hash = relative_path
+			with open(fpath, 'rb') as f:
+				chunk = writer.add_chunk(chunk_hash, f.read())
+			WizardApp._StageTimer.count(read=chunk.decompressed_size, files=1)
+			packed += chunk.decompressed_size
+			self._report_progress("Packing WAD", index, len(walked), packed)
+		return writer
+
+	@_timed_stage('zip')
+	def _write_wad_member(self, zout: zipfile.ZipFile, member: str, writer) -> None:
+		"""Stream a packed WAD straight into the output zip without a temp file."""
+		size = writer.layout()
+		with zout.open(member, 'w', force_zip64=size > zipfile.ZIP64_LIMIT) as dst:
+			writer.write(dst)
+		WizardApp._StageTimer.count(written=size, files=1)
 
 	# ─────────────────────────────────────────────────────────────────────────────
 	# Hash Management
@@ -2342,54 +4163,26 @@ class WizardApp:
 			self.hash_status.set(f"✓ All hash files present ({hash_dir})")
 	
 	def _download_hashes(self):
-		"""Download all hash files from CommunityDragon"""
+		"""Sync all hash files from CommunityDragon (or the HASH_BASE_URL_ENV_VAR mirror)"""
 		def download_thread():
 			try:
-				import requests
-				self.hash_status.set("Downloading hash files from CommunityDragon...")
+				base_url = os.environ.get(HASH_BASE_URL_ENV_VAR) or None
+				self._progress.set(self.hash_status, f"Syncing hash files from {base_url or 'CommunityDragon'}...")
+				sync = WizardApp._HashSync(self._hash_dir(), base_url=base_url, progress=self._report_progress)
+				summary = sync.sync()
+				# the tables changed on disk, drop the compiled one kept in memory
+				self._wad_hashtable = None
 				
-				hash_urls = {
-					'hashes.binentries.txt': 'https://raw.githubusercontent.com/CommunityDragon/Data/master/hashes/lol/hashes.binentries.txt',
-					'hashes.binfields.txt': 'https://raw.githubusercontent.com/CommunityDragon/Data/master/hashes/lol/hashes.binfields.txt',
-					'hashes.binhashes.txt': 'https://raw.githubusercontent.com/CommunityDragon/Data/master/hashes/lol/hashes.binhashes.txt',
-					'hashes.bintypes.txt': 'https://raw.githubusercontent.com/CommunityDragon/Data/master/hashes/lol/hashes.bintypes.txt',
-					'hashes.lcu.txt': 'https://raw.githubusercontent.com/CommunityDragon/Data/master/hashes/lol/hashes.lcu.txt',
-				}
-				
-				hash_dir = self._hash_dir()
-				downloaded = 0
-				
-				# Download simple files
-				for filename, url in hash_urls.items():
-					self.hash_status.set(f"Downloading {filename}...")
-					response = requests.get(url, timeout=30)
-					response.raise_for_status()
-					with open(hash_dir / filename, 'wb') as f:
-						f.write(response.content)
-					downloaded += 1
-				
-				# Download hashes.game.txt (split into .0 and .1)
-				self.hash_status.set("Downloading hashes.game.txt (part 1/2)...")
-				part0_url = 'https://raw.githubusercontent.com/CommunityDragon/Data/master/hashes/lol/hashes.game.txt.0'
-				part0 = requests.get(part0_url, timeout=30)
-				part0.raise_for_status()
-				
-				self.hash_status.set("Downloading hashes.game.txt (part 2/2)...")
-				part1_url = 'https://raw.githubusercontent.com/CommunityDragon/Data/master/hashes/lol/hashes.game.txt.1'
-				part1 = requests.get(part1_url, timeout=30)
-				part1.raise_for_status()
-				
-				# Combine and save
-				with open(hash_dir / 'hashes.game.txt', 'wb') as f:
-					f.write(part0.content)
-					f.write(part1.content)
-				downloaded += 1
-				
-				self.hash_status.set(f"✓ Successfully downloaded {downloaded} hash files!")
-			except requests.RequestException as e:
-				self.hash_status.set(f"❌ Download failed: {e}")
+				downloaded, unchanged, failed = summary['downloaded'], summary['unchanged'], summary['failed']
+				if failed:
+					fname, error = next(iter(failed.items()))
+					self._progress.set(self.hash_status, f"❌ Download failed for {len(failed)} file(s) ({fname}: {error})")
+				elif downloaded:
+					self._progress.set(self.hash_status, f"✓ Downloaded {len(downloaded)} hash files, {len(unchanged)} already up to date")
+				else:
+					self._progress.set(self.hash_status, f"✓ All {len(unchanged)} hash files already up to date")
 			except Exception as e:
-				self.hash_status.set(f"❌ Error: {e}")
+				self._progress.set(self.hash_status, f"❌ Error: {e}")
 		
 		threading.Thread(target=download_thread, daemon=True).start()
 	
@@ -2422,7 +4215,7 @@ class WizardApp:
 				# Use the stored repathed directory path
 				repathed_dir = getattr(self, '_repathed_dir', None)
 				if not repathed_dir or not repathed_dir.exists():
-					messagebox.showwarning(APP_TITLE, "No repathed folder found. Please run repath first.")
+					self._ui_call(messagebox.showwarning, APP_TITLE, "No repathed folder found. Please run repath first.")
 					return
 				
 				self._set_status("Checking for missing files in repathed folder...")
@@ -2459,14 +4252,15 @@ class WizardApp:
 				msg += f"Detailed report saved to:\n{json_file}"
 				
 				self._set_status(f"Check complete: {total_missing} missing, {len(junk_files)} junk files. See report.")
-				messagebox.showinfo("Missing Files Report", msg)
+				self._ui_call(messagebox.showinfo, "Missing Files Report", msg)
 				
 			except Exception as e:
 				self._set_status(f"Check failed: {e}")
-				messagebox.showerror(APP_TITLE, f"Error checking missing files: {e}")
+				self._ui_call(messagebox.showerror, APP_TITLE, f"Error checking missing files: {e}")
 		
 		threading.Thread(target=check_thread, daemon=True).start()
 	
+	@_timed_stage('pyntex')
 	def _pyntex_check_dir(self, path: Path):
 		"""Inline pyntex logic to check directory for missing files"""
 		res = {}
@@ -2486,24 +4280,25 @@ class WizardApp:
 		# Load hashes
 		hashes_dir = self._hash_dir()
 		WizardApp._HashStorage.read_all_hashes(hashes_dir)
+		try:
+			# Get prefix for repathing matching (if available)
+			prefix = getattr(self, '_used_prefix', None)
 		
-		# Get prefix for repathing matching (if available)
-		prefix = getattr(self, '_used_prefix', None)
-		
-		# Parse BIN files
-		for full_file_index, full_file in enumerate(full_files):
-			if full_file.endswith('.bin'):
-				try:
-					bin_obj = pyRitoFile.bin.BIN().read(full_file)
-					bin_obj.un_hash(WizardApp._HashStorage.hashtables)
-					result = self._pyntex_parse_bin(bin_obj, existing_files=existing_files, prefix=prefix)
-					if len(result) > 0:
-						res[short_files[full_file_index]] = result
-					existing_files[short_files[full_file_index]] = False
-				except Exception:
-					pass
-		
-		WizardApp._HashStorage.free_all_hashes()
+			# Parse BIN files
+			for full_file_index, full_file in enumerate(full_files):
+				if full_file.endswith('.bin'):
+					try:
+						bin_obj = self._bin_cache.get(full_file, writable=True)
+						WizardApp._StageTimer.count(read=os.path.getsize(full_file), files=1)
+						bin_obj.un_hash(WizardApp._HashStorage.hashtables)
+						result = self._pyntex_parse_bin(bin_obj, existing_files=existing_files, prefix=prefix)
+						if len(result) > 0:
+							res[short_files[full_file_index]] = result
+						existing_files[short_files[full_file_index]] = False
+					except Exception:
+						pass
+		finally:
+			WizardApp._HashStorage.free_all_hashes()
 		
 		if 'hashed_files.json' in existing_files:
 			existing_files['hashed_files.json'] = False
@@ -2640,18 +4435,13 @@ class WizardApp:
 	
 	def _pyntex_unify_path(self, path: str):
 		"""Unify path for comparison (handle hashed paths)"""
-		# if the path is straight up hex
-		if pyRitoFile.wad.WADHasher.is_hash(path):
-			return path
-		# if the path is hashed file 
-		basename = path.split('.')[0]
-		if pyRitoFile.wad.WADHasher.is_hash(basename):
-			return basename
-		# if the path is pure raw
-		return pyRitoFile.wad.WADHasher.raw_to_hex(path)
+		return WizardApp._PathHasher.unify_raw(path)
 	
 	def _retry_step4(self):
 		"""Restart the entire process - reset to step 0"""
+		# Stop a run that is still going; the next run waits for it and resumes from its completed stages
+		self._jobs.cancel()
+		
 		# Reset ALL step completions including step 0
 		self.step_completed[0] = False
 		self.step_completed[1] = False
@@ -2673,6 +4463,7 @@ class WizardApp:
 			delattr(self, '_repathed_dir')
 		if hasattr(self, '_fantome_member_path'):
 			delattr(self, '_fantome_member_path')
+		self._wad_jobs = []
 		
 		# Go back to step 0 (file selection)
 		self._show_step(0)
@@ -2687,56 +4478,60 @@ class WizardApp:
 				self._set_status("Error: repathed folder not found")
 				return
 			
-			self._set_status("Checking for missing texture files...")
-			
-			# Run pyntex check
-			result = self._pyntex_check_dir(repathed_dir)
-			
-			# Collect all missing files (only .dds and .tex)
-			missing_textures = []
-			print(f"[DEBUG] Processing pyntex results, total keys: {len(result)}")
-			for key, bin_results in result.items():
-				# Skip the 'junk_files' key - it's a list of strings, not entry dicts
-				if key == 'junk_files':
-					continue
-				if isinstance(bin_results, list):
-					for entry in bin_results:
-						# Ensure entry is a dict before calling .get()
-						if isinstance(entry, dict):
-							missing_in_entry = entry.get('missing_files', [])
-							print(f"[DEBUG] Entry has {len(missing_in_entry)} missing files")
-							for missing_file in missing_in_entry:
-								# Only process .dds and .tex files
-								if missing_file.lower().endswith(('.dds', '.tex')):
-									if missing_file not in missing_textures:
-										missing_textures.append(missing_file)
-										print(f"[DEBUG] Added missing texture: {missing_file}")
-			
-			print(f"[DEBUG] Total missing textures collected: {len(missing_textures)}")
-			
-			# Save detailed report
-			json_file = self._work_root() / 'missing_files_report.json'
-			with open(json_file, 'w', encoding='utf-8') as f:
-				json.dump(result, f, indent=4, ensure_ascii=False)
-			print(f"[DEBUG] Saved report to: {json_file}")
-			
-			# Create placeholders for missing textures
-			if len(missing_textures) > 0:
-				self._set_status(f"Found {len(missing_textures)} missing textures. Creating placeholders...")
-				print(f"[DEBUG] Calling _create_placeholder_textures with {len(missing_textures)} files")
-				self._create_placeholder_textures(repathed_dir, missing_textures)
-				self._set_status(f"Created {len(missing_textures)} placeholder textures.")
-			else:
-				self._set_status("✓ No missing texture files found!")
-				print("[DEBUG] No missing textures found!")
+			missing_count = self._fix_missing_textures(repathed_dir, self._work_root() / 'missing_files_report.json')
 			
 			# Automatically package final fantome
 			self._set_status("Packaging final .fantome with all fixes...")
-			self._create_final_fantome(repathed_dir, len(missing_textures))
+			self._create_final_fantome(repathed_dir, missing_count)
 			
 		except Exception as e:
 			self._set_status(f"Error: {e}")
 	
+	def _fix_missing_textures(self, repathed_dir: Path, json_file: Path) -> int:
+		"""pyntex check of repathed_dir, report written to json_file, placeholders for missing textures; returns how many were missing"""
+		self._set_status("Checking for missing texture files...")
+		
+		# Run pyntex check
+		result = self._pyntex_check_dir(repathed_dir)
+		
+		# Collect all missing files (only .dds and .tex)
+		missing_textures = []
+		print(f"[DEBUG] Processing pyntex results, total keys: {len(result)}")
+		for key, bin_results in result.items():
+			# Skip the 'junk_files' key - it's a list of strings, not entry dicts
+			if key == 'junk_files':
+				continue
+			if isinstance(bin_results, list):
+				for entry in bin_results:
+					# Ensure entry is a dict before calling .get()
+					if isinstance(entry, dict):
+						missing_in_entry = entry.get('missing_files', [])
+						print(f"[DEBUG] Entry has {len(missing_in_entry)} missing files")
+						for missing_file in missing_in_entry:
+							# Only process .dds and .tex files
+							if missing_file.lower().endswith(('.dds', '.tex')):
+								if missing_file not in missing_textures:
+									missing_textures.append(missing_file)
+									print(f"[DEBUG] Added missing texture: {missing_file}")
+		
+		print(f"[DEBUG] Total missing textures collected: {len(missing_textures)}")
+		
+		# Save detailed report
+		with open(json_file, 'w', encoding='utf-8') as f:
+			json.dump(result, f, indent=4, ensure_ascii=False)
+		print(f"[DEBUG] Saved report to: {json_file}")
+		
+		# Create placeholders for missing textures
+		if len(missing_textures) > 0:
+			self._set_status(f"Found {len(missing_textures)} missing textures. Creating placeholders...")
+			print(f"[DEBUG] Calling _create_placeholder_textures with {len(missing_textures)} files")
+			self._create_placeholder_textures(repathed_dir, missing_textures)
+			self._set_status(f"Created {len(missing_textures)} placeholder textures.")
+		else:
+			self._set_status("✓ No missing texture files found!")
+			print("[DEBUG] No missing textures found!")
+		return len(missing_textures)
+	
 	def _create_placeholder_textures(self, repathed_dir: Path, missing_files: list):
 		"""Create placeholder invis.dds/invis.tex for missing texture files"""
 		print(f"[DEBUG] _create_placeholder_textures called with {len(missing_files)} files")
@@ -2859,14 +4654,13 @@ class WizardApp:
 				return
 			wad_name = f"{champ}.wad.client"
 			
-			# Pack repathed_dir -> new wad
-			final_wad_path = work_root / f"final_{wad_name}"
+			# Pack repathed_dir -> new wad (kept in memory, streamed into the zip below)
 			self._set_status("Packing WAD from repathed folder...")
-			self._pack_wad(repathed_dir, final_wad_path)
+			wad_writer = self._build_wad_writer(repathed_dir)
 			
 			# Check if using fantome or mod folder mode
-			fantome_path = self.fantome_path.get().strip()
-			mod_folder_path = self.mod_folder_path.get().strip()
+			fantome_path = self._form['fantome']
+			mod_folder_path = self._form['mod_folder']
 			
 			if mod_folder_path:
 				# MOD FOLDER MODE: Create new fantome from scratch
@@ -2876,7 +4670,7 @@ class WizardApp:
 				import zipfile as _zip
 				with _zip.ZipFile(final_fantome, 'w', compression=_zip.ZIP_DEFLATED) as zout:
 					# Add the repathed WAD
-					zout.write(final_wad_path, f"WAD/{wad_name}")
+					self._write_wad_member(zout, f"WAD/{wad_name}", wad_writer)
 					
 					# Create and add info.json
 					info_json = self._create_info_json(champ, is_new=True)
@@ -2892,58 +4686,82 @@ class WizardApp:
 				
 				# Build final fantome
 				final_fantome = fantome.with_name(f"{fantome.stem}_repathed{fantome.suffix}")
-				self._set_status(f"Creating final fantome: {final_fantome.name}")
-				
-				import zipfile as _zip
-				with _zip.ZipFile(fantome, 'r') as zin, _zip.ZipFile(final_fantome, 'w', compression=_zip.ZIP_DEFLATED) as zout:
-					has_info_json = False
-					for item in zin.infolist():
-						data = zin.read(item.filename)
-						# Case-insensitive comparison for WAD paths
-						item_path_normalized = item.filename.replace('\\', '/').lower()
-						member_path_normalized = member.replace('\\', '/').lower()
-						
-						# Check if this is info.json
-						if item_path_normalized in ['meta/info.json', 'info.json']:
-							has_info_json = True
-							# Update info.json with repathed suffix
-							info_json = self._update_info_json(data.decode('utf-8'))
-							zout.writestr(item.filename, info_json)
-						elif item_path_normalized == member_path_normalized:
-							# replace with final wad
-							with open(final_wad_path, 'rb') as f:
-								data = f.read()
-							zout.writestr(item.filename, data)
-						else:
-							zout.writestr(item, data)
-					
-					# If original fantome didn't have info.json, create one
-					if not has_info_json:
-						info_json = self._create_info_json(champ, is_new=False)
-						zout.writestr("META/info.json", info_json)
-			
-			# Cleanup final wad
-			if final_wad_path.exists():
-				os.remove(final_wad_path)
-			
-			# Mark step 3 as complete
-			self.step_completed[3] = True
-			self.root.after(0, self._update_nav)
-			
-			# Enable retry button now that process is complete
-			self.root.after(0, lambda: self.retry_btn.configure(state=tk.NORMAL))
+				self._write_fantome(fantome, final_fantome, {member: wad_writer}, champ)
 			
-			# Final status
-			if missing_count > 0:
-				self._set_status(f"✓ DONE! Created {final_fantome.name} with {missing_count} placeholder textures.")
-			else:
-				self._set_status(f"✓ DONE! Created {final_fantome.name} - no missing textures found.")
+			self._finish_run(final_fantome, missing_count)
 			
 		except Exception as e:
 			self._set_status(f"Error during packaging: {e}")
 			# Enable retry button even on error so user can retry
-			self.root.after(0, lambda: self.retry_btn.configure(state=tk.NORMAL))
-
+			self._ui_call(lambda: self.retry_btn.configure(state=tk.NORMAL))
+	
+	def _write_fantome(self, fantome: Path, final_fantome: Path, wad_writers: Dict, champ: str):
+		"""Copy fantome to final_fantome in one zip pass, streaming wad_writers[member] in place of each repathed WAD member."""
+		self._set_status(f"Creating final fantome: {final_fantome.name}")
+		replaced = {member.replace('\\', '/').lower(): writer for member, writer in wad_writers.items()}
+		
+		import zipfile as _zip
+		with _zip.ZipFile(fantome, 'r') as zin, _zip.ZipFile(final_fantome, 'w', compression=_zip.ZIP_DEFLATED) as zout:
+			has_info_json = False
+			items = zin.infolist()
+			for index, item in enumerate(items):
+				self._report_progress(f"Writing {final_fantome.name}", index, len(items))
+				WizardApp._CancelToken.check()
+				# Case-insensitive comparison for WAD paths
+				item_path_normalized = item.filename.replace('\\', '/').lower()
+				
+				# Check if this is info.json
+				if item_path_normalized in ['meta/info.json', 'info.json']:
+					has_info_json = True
+					# Update info.json with repathed suffix
+					info_json = self._update_info_json(zin.read(item.filename).decode('utf-8'))
+					zout.writestr(item.filename, info_json)
+				elif item_path_normalized in replaced:
+					# replace with final wad
+					self._write_wad_member(zout, item.filename, replaced[item_path_normalized])
+				else:
+					zout.writestr(item, zin.read(item.filename))
+			
+			# If original fantome didn't have info.json, create one
+			if not has_info_json:
+				info_json = self._create_info_json(champ, is_new=False)
+				zout.writestr("META/info.json", info_json)
+			self._report_progress(f"Writing {final_fantome.name}", len(items), len(items))
+	
+	def _finish_run(self, final_fantome: Path, missing_count: int):
+		"""Timing report, cache and work folder cleanup once final_fantome is written."""
+		work_root = self._work_root()
+		self._timer.write_report(self._timing_report_path())
+		self._bin_cache.clear()
+		WizardApp._PathHasher.clear()
+		WizardApp._HashStorage.reset()
+		self._wad_hashtable = None
+		
+		# Run finished: nothing left to resume, clean up temporary extraction folders
+		try:
+			if self._markers is not None:
+				self._markers.clear()
+			if (work_root / 'mod_extract').exists():
+				shutil.rmtree(work_root / 'mod_extract', ignore_errors=True)
+			if (work_root / 'fresh_extract').exists():
+				shutil.rmtree(work_root / 'fresh_extract', ignore_errors=True)
+			if (work_root / 'multi').exists():
+				shutil.rmtree(work_root / 'multi', ignore_errors=True)
+		except Exception:
+			pass
+		
+		# Mark step 3 as complete
+		self.step_completed[3] = True
+		self._ui_call(self._update_nav)
+		
+		# Enable retry button now that process is complete
+		self._ui_call(lambda: self.retry_btn.configure(state=tk.NORMAL))
+		
+		# Final status
+		if missing_count > 0:
+			self._set_status(f"✓ DONE! Created {final_fantome.name} with {missing_count} placeholder textures.")
+		else:
+			self._set_status(f"✓ DONE! Created {final_fantome.name} - no missing textures found.")
 
 def main():
 	print("="*60)
@@ -2975,6 +4793,9 @@ def main():
 
 
 if __name__ == "__main__":
+	# BIN process pool workers start from the frozen exe too
+	import multiprocessing
+	multiprocessing.freeze_support()
 	main()
 
 
@@ -1,2 +1,18 @@
+from importlib import import_module
 from . import structs, stream, helper
-from . import skl, skn, anm, so, mapgeo, bin, bnk, wpk, tex, wad
\ No newline at end of file
+
+# format modules are imported on first use (pyRitoFile.wad, from pyRitoFile import bin, ...)
+# so importing the package does not pull in numpy, pyzstd and xxhash
+_lazy_modules = ('skl', 'skn', 'anm', 'so', 'mapgeo', 'bin', 'bnk', 'wpk', 'tex', 'wad')
+__all__ = ['structs', 'stream', 'helper', *_lazy_modules]
+
+
+def __getattr__(name):
+    if name in _lazy_modules:
+        # import_module also binds the submodule on the package, so this runs once per module
+        return import_module(f'.{name}', __name__)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -3,6 +3,12 @@ from .stream import BytesStream
 from .structs import Quaternion, Vector
 from .helper import Elf
 
+# not safe because external modules
+try:
+    import numpy as np
+except:
+    np = None
+
 class ANMHepler:
     @staticmethod
     def decompress_quat(bytes):
@@ -65,6 +71,58 @@ class ANMHepler:
             (max.z - min.z) / 65535.0 * (bytes[4] | bytes[5] << 8) + min.z
         )
         
+    @staticmethod
+    def decompress_quats(words):
+        # decompress_quat over a (n, 3) u16 array at once, returns (n, 4) xyzw
+        bits = words[:, 0].astype(np.uint64) | (words[:, 1].astype(np.uint64) << 16) | (words[:, 2].astype(np.uint64) << 32)
+        max_index = (bits >> 45) & 3
+        one_div_sqrt2 = 0.70710678118
+        sqrt2_div_32767 = 0.00004315969
+        a = ((bits >> 30) & 32767).astype(np.float64) * sqrt2_div_32767 - one_div_sqrt2
+        b = ((bits >> 15) & 32767).astype(np.float64) * sqrt2_div_32767 - one_div_sqrt2
+        c = (bits & 32767).astype(np.float64) * sqrt2_div_32767 - one_div_sqrt2
+        d = np.sqrt(np.maximum(0.0, 1.0 - (a * a + b * b + c * c)))
+        quats = np.empty((len(words), 4), dtype=np.float64)
+        quats[:, 0] = np.where(max_index == 0, d, a)
+        quats[:, 1] = np.where(max_index == 0, a, np.where(max_index == 1, d, b))
+        quats[:, 2] = np.where(max_index <= 1, b, np.where(max_index == 2, d, c))
+        quats[:, 3] = np.where(max_index <= 2, c, d)
+        return quats
+
+    @staticmethod
+    def decompress_vec3s(min, max, words):
+        # decompress_vec3 over a (n, 3) u16 array at once, returns (n, 3)
+        vecs = np.empty((len(words), 3), dtype=np.float64)
+        vecs[:, 0] = (max.x - min.x) / 65535.0 * words[:, 0] + min.x
+        vecs[:, 1] = (max.y - min.y) / 65535.0 * words[:, 1] + min.y
+        vecs[:, 2] = (max.z - min.z) / 65535.0 * words[:, 2] + min.z
+        return vecs
+
+    @staticmethod
+    def decompress_frames(data, frame_count, max_time, fps, translate_min, translate_max, scale_min, scale_max):
+        # every 10 byte r3d2canm frame of data at once: (track index, time, transform type, values)
+        # values rows are xyzw for rotations and xyz + unused w for translations and scales
+        words = np.frombuffer(data, dtype='<u2', count=frame_count * 5).reshape(frame_count, 5)
+        track_ids = words[:, 1] & 16383
+        times = words[:, 0] / 65535.0 * max_time * fps
+        transform_types = words[:, 1] >> 14
+        if np.any(transform_types == 3):
+            raise Exception(
+                f'pyRitoFile: Error: Read ANM: Unknown compressed transform type: 3.'
+            )
+        values = np.zeros((frame_count, 4), dtype=np.float64)
+        transforms = words[:, 2:]
+        for transform_type, decompress in (
+            (0, lambda transforms: ANMHepler.decompress_quats(transforms)),
+            (1, lambda transforms: ANMHepler.decompress_vec3s(translate_min, translate_max, transforms)),
+            (2, lambda transforms: ANMHepler.decompress_vec3s(scale_min, scale_max, transforms)),
+        ):
+            mask = transform_types == transform_type
+            if np.any(mask):
+                decompressed = decompress(transforms[mask])
+                values[mask, :decompressed.shape[1]] = decompressed
+        return track_ids, times, transform_types, values
+
     @staticmethod
     def interpolate_integer_frames(anm):
         def interpolate(frame, curve, func):
@@ -73,13 +131,13 @@ class ANMHepler:
             left = None
             for time in reversed(times):
                 if time <= frame and curve[time] != None:
-                    left = frame
+                    left = time
                     break
             # loop from left, get right
             right = None
             for time in times:
                 if time >= frame and curve[time] != None:
-                    right = frame
+                    right = time
                     break
             # set if frame outside range
             if left == None:
@@ -154,6 +212,138 @@ class ANMHepler:
         quat_bank = [Quaternion(*[float(value) for value in quat_key.split()]) for quat_key in list(quat_bank.keys())]
         return vec_bank, quat_bank, frames
 
+    @staticmethod
+    def quantize(values, digits):
+        # float(f'{value:.{digits}g}') over a whole array: round to digits significant digits
+        values = np.asarray(values, dtype=np.float64)
+        quantized = values.copy()
+        nonzero = np.flatnonzero(np.isfinite(values) & (values != 0))
+        x = values.flat[nonzero]
+        power = digits - 1 - np.floor(np.log10(np.abs(x))).astype(np.int64)
+        # powers of ten up to 1e22 are exact, so a correctly rounded * or / gives the same float as parsing the string
+        scale = 10.0 ** np.minimum(np.abs(power), 22)
+        # each side only on its own subset: the other operation would overflow on huge values
+        up = power >= 0
+        down = ~up
+        scaled = np.empty_like(x)
+        scaled[up] = x[up] * scale[up]
+        scaled[down] = x[down] / scale[down]
+        rounded = np.round(scaled)
+        result = np.empty_like(x)
+        result[up] = rounded[up] / scale[up]
+        result[down] = rounded[down] * scale[down]
+        quantized.flat[nonzero] = result
+        # near halfway (round half even vs the exact decimal), a log10 off by one or an inexact scale:
+        # leave those few to the string formatting
+        unsure = (
+            (np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) < 1e-6)
+            | (np.abs(rounded) < 10.0 ** (digits - 1)) | (np.abs(rounded) > 10.0 ** digits)
+            | (np.abs(power) > 22)
+        )
+        for i in nonzero[unsure].tolist():
+            quantized.flat[i] = float(f'{values.flat[i]:.{digits}g}')
+        # every nan formats to 'nan'
+        quantized[np.isnan(quantized)] = np.nan
+        return quantized
+
+    @staticmethod
+    def bank(values):
+        # unique rows in order of first appearance, and the bank index of every row
+        # rows are compared bit for bit, so 0.0 and -0.0 stay apart like their formatted keys
+        bits = np.ascontiguousarray(values).view(np.uint64)
+        _, first, inverse = np.unique(bits, axis=0, return_index=True, return_inverse=True)
+        order = np.argsort(first)
+        rank = np.empty(len(order), dtype=np.int64)
+        rank[order] = np.arange(len(order))
+        return values[first[order]], rank[inverse.reshape(-1)]
+
+    @staticmethod
+    def interpolate_integer_frames_array(anm):
+        # interpolate_integer_frames with every missing frame of a curve lerped/slerped at once
+        # between its searchsorted neighbours
+        def interpolate(times, values, frames, func):
+            times = np.array(times, dtype=np.float64)
+            values = np.array(values, dtype=np.float64)
+            frames = np.array(frames, dtype=np.float64)
+            right = np.searchsorted(times, frames, side='left')
+            left = np.searchsorted(times, frames, side='right') - 1
+            # set if frame outside range
+            result = np.where((left < 0)[:, None], values[np.minimum(right, len(times) - 1)], values[np.maximum(left, 0)])
+            inside = np.flatnonzero((left >= 0) & (right < len(times)))
+            if len(inside) > 0:
+                l, r = left[inside], right[inside]
+                weight = (frames[inside] - times[l]) / (times[r] - times[l])
+                result[inside] = func(values[l], values[r], weight)
+            return result.tolist()
+
+        def lerp(vec1, vec2, weight):
+            return vec1 + (vec2 - vec1) * weight[:, None]
+
+        def slerp(quat1, quat2, weight):
+            epsilon = 1e-6
+            cos_omega = quat1[:, 0] * quat2[:, 0] + quat1[:, 1] * quat2[:, 1] + quat1[:, 2] * quat2[:, 2] + quat1[:, 3] * quat2[:, 3]
+            flip = cos_omega < 0.0
+            cos_omega = np.where(flip, -cos_omega, cos_omega)
+            close = cos_omega > (1.0 - epsilon)
+            omega = np.arccos(np.where(close, 0.0, cos_omega))
+            inv_sin_omega = 1 / np.where(close, 1.0, np.sin(omega))
+            s1 = np.where(close, 1.0 - weight, np.sin((1.0 - weight) * omega) * inv_sin_omega)
+            s2 = np.where(close, weight, np.sin(weight * omega) * inv_sin_omega)
+            s2 = np.where(flip, -s2, s2)
+            return s1[:, None] * quat1 + s2[:, None] * quat2
+
+        for track in anm.tracks:
+            # sort time
+            track.poses = dict(sorted(track.poses.items()))
+            for name, func, new in (
+                ('translate', lerp, lambda value: Vector(*value)),
+                ('scale', lerp, lambda value: Vector(*value)),
+                ('rotate', slerp, lambda value: Quaternion(*value)),
+            ):
+                times = []
+                values = []
+                for time, pose in track.poses.items():
+                    value = getattr(pose, name)
+                    if value != None:
+                        times.append(time)
+                        values.append(tuple(value))
+                # integer frame, only interpolate if need
+                frames = [frame for frame in range(anm.duration) if frame not in track.poses or getattr(track.poses[frame], name) == None]
+                if len(frames) == 0:
+                    continue
+                for frame, value in zip(frames, interpolate(times, values, frames, func)):
+                    pose = track.poses.get(frame)
+                    if pose == None:
+                        track.poses[frame] = pose = ANMPose()
+                    setattr(pose, name, new(value))
+
+    @staticmethod
+    def build_frames_array(anm):
+        # build_frames with the .4g/.7g keys quantized and deduplicated as arrays
+        track_count = len(anm.tracks)
+        translates = []
+        scales = []
+        rotates = []
+        for track in anm.tracks:
+            for f in range(anm.duration):
+                pose = track.poses[f]
+                translates.append((pose.translate.x, pose.translate.y, pose.translate.z))
+                scales.append((pose.scale.x, pose.scale.y, pose.scale.z))
+                rotates.append((pose.rotate.x, pose.rotate.y, pose.rotate.z, pose.rotate.w))
+        # translate and scale share the vector bank, in the order build_frames meets them
+        vecs = np.stack((np.array(translates, dtype=np.float64).reshape(-1, 3), np.array(scales, dtype=np.float64).reshape(-1, 3)), axis=1).reshape(-1, 3)
+        vec_bank, vec_indices = ANMHepler.bank(ANMHepler.quantize(vecs, 4))
+        quat_bank, quat_indices = ANMHepler.bank(ANMHepler.quantize(np.array(rotates, dtype=np.float64).reshape(-1, 4), 7))
+        # frames[f * track_count + t] = (translate_index, scale_index, rotate_index)
+        frames = np.empty((anm.duration, track_count, 3), dtype=np.int64)
+        vec_indices = vec_indices.reshape(track_count, anm.duration, 2)
+        frames[:, :, 0] = vec_indices[:, :, 0].T
+        frames[:, :, 1] = vec_indices[:, :, 1].T
+        frames[:, :, 2] = quat_indices.reshape(track_count, anm.duration).T
+        vec_bank = [Vector(*vec) for vec in vec_bank.tolist()]
+        quat_bank = [Quaternion(*quat) for quat in quat_bank.tolist()]
+        return vec_bank, quat_bank, frames.reshape(-1, 3)
+
 class ANMErrorMetric:
     __slots__ = (
         'margin', 'discontinuity_threshold'
@@ -259,41 +449,64 @@ class ANM:
                     track.poses = {}
                 # read frames
                 bs.seek(frames_offset + 12)
-                for i in range(frame_count):
-                    compressed_time, bits = bs.read_u16(2)
-                    compressed_transform = bs.read(6)
-                    # parse track
-                    joint_hash = joint_hashes[bits & 16383]
-                    match_track = None
+                if np != None:
+                    # decode every frame with array ops, then only place them into the tracks here
+                    track_ids, times, transform_types, values = ANMHepler.decompress_frames(
+                        bs.read(frame_count * 10), frame_count, max_time, self.fps,
+                        translate_min, translate_max, scale_min, scale_max)
+                    # a joint hash belongs to the first track that has it
+                    track_of_hash = {}
                     for track in self.tracks:
-                        if track.joint_hash == joint_hash:
-                            match_track = track
-                            break
-                    if match_track == None:
-                        # this frame has wrong joint hash?
-                        continue
-                    # parse pose
-                    time = (compressed_time / 65535.0 * max_time) * self.fps
-                    if time in match_track.poses:
-                        pose = match_track.poses[time]
-                    else:
-                        pose = ANMPose()
-                        match_track.poses[time] = pose
-                    # decompress pose data
-                    transform_type = bits >> 14
-                    if transform_type == 0:
-                        pose.rotate = ANMHepler.decompress_quat(
-                            compressed_transform)
-                    elif transform_type == 1:
-                        pose.translate = ANMHepler.decompress_vec3(
-                            translate_min, translate_max, compressed_transform)
-                    elif transform_type == 2:
-                        pose.scale = ANMHepler.decompress_vec3(
-                            scale_min, scale_max, compressed_transform)
-                    else:
-                        raise Exception(
-                            f'pyRitoFile: Error: Read ANM: Unknown compressed transform type: {transform_type}.'
-                        )
+                        track_of_hash.setdefault(track.joint_hash, track)
+                    index_tracks = [track_of_hash[joint_hash] for joint_hash in joint_hashes]
+                    for track_id, time, transform_type, value in zip(track_ids.tolist(), times.tolist(), transform_types.tolist(), values.tolist()):
+                        match_track = index_tracks[track_id]
+                        pose = match_track.poses.get(time)
+                        if pose == None:
+                            pose = ANMPose()
+                            match_track.poses[time] = pose
+                        if transform_type == 0:
+                            pose.rotate = Quaternion(*value)
+                        elif transform_type == 1:
+                            pose.translate = Vector(value[0], value[1], value[2])
+                        else:
+                            pose.scale = Vector(value[0], value[1], value[2])
+                else:
+                    for i in range(frame_count):
+                        compressed_time, bits = bs.read_u16(2)
+                        compressed_transform = bs.read(6)
+                        # parse track
+                        joint_hash = joint_hashes[bits & 16383]
+                        match_track = None
+                        for track in self.tracks:
+                            if track.joint_hash == joint_hash:
+                                match_track = track
+                                break
+                        if match_track == None:
+                            # this frame has wrong joint hash?
+                            continue
+                        # parse pose
+                        time = (compressed_time / 65535.0 * max_time) * self.fps
+                        if time in match_track.poses:
+                            pose = match_track.poses[time]
+                        else:
+                            pose = ANMPose()
+                            match_track.poses[time] = pose
+                        # decompress pose data
+                        transform_type = bits >> 14
+                        if transform_type == 0:
+                            pose.rotate = ANMHepler.decompress_quat(
+                                compressed_transform)
+                        elif transform_type == 1:
+                            pose.translate = ANMHepler.decompress_vec3(
+                                translate_min, translate_max, compressed_transform)
+                        elif transform_type == 2:
+                            pose.scale = ANMHepler.decompress_vec3(
+                                scale_min, scale_max, compressed_transform)
+                        else:
+                            raise Exception(
+                                f'pyRitoFile: Error: Read ANM: Unknown compressed transform type: {transform_type}.'
+                            )
             elif self.signature == 'r3d2anmd':
                 if self.version == 5:
                     # v5
@@ -334,8 +547,12 @@ class ANM:
                     vec_bank = bs.read_vec3(vec_count)
                     # read quats
                     bs.seek(quats_offset + 12)
-                    quat_bank = [ANMHepler.decompress_quat(
-                        bs.read(6)) for i in range(quat_count)]
+                    if np != None:
+                        quats = ANMHepler.decompress_quats(np.frombuffer(bs.read(quat_count * 6), dtype='<u2').reshape(quat_count, 3))
+                        quat_bank = [Quaternion(*quat) for quat in quats.tolist()]
+                    else:
+                        quat_bank = [ANMHepler.decompress_quat(
+                            bs.read(6)) for i in range(quat_count)]
                     # prepare tracks
                     self.tracks = [ANMTrack() for i in range(track_count)]
                     for track_id, track in enumerate(self.tracks):
@@ -460,8 +677,12 @@ class ANM:
     def write(self, path, raw=False):
         with BytesStream.writer(path, raw) as bs:
             self.duration = int(self.duration)
-            ANMHepler.interpolate_integer_frames(self)
-            vec_bank, quat_bank, frames = ANMHepler.build_frames(self)
+            if np != None:
+                ANMHepler.interpolate_integer_frames_array(self)
+                vec_bank, quat_bank, frames = ANMHepler.build_frames_array(self)
+            else:
+                ANMHepler.interpolate_integer_frames(self)
+                vec_bank, quat_bank, frames = ANMHepler.build_frames(self)
             vec_count = len(vec_bank)
             if vec_count > 65535:
                 raise Exception(
@@ -508,8 +729,11 @@ class ANM:
             bs.write_u32(*[track.joint_hash for track in self.tracks])
             # frame
             frames_offset = bs.tell()
-            for translate_index, rotate_index, scale_index in frames:
-                bs.write_u16(translate_index, rotate_index, scale_index)
+            if np != None and isinstance(frames, np.ndarray):
+                bs.write(frames.astype('<u2').tobytes())
+            else:
+                for translate_index, rotate_index, scale_index in frames:
+                    bs.write_u16(translate_index, rotate_index, scale_index)
             # write offsets
             bs.seek(12) 
             bs.write_u32(bs.end()) # file_size
@@ -2,6 +2,7 @@ from .stream import BytesStream
 from .helper import FNV1a
 from .wad import WADHasher
 from enum import Enum
+from struct import Struct, pack_into
 
 class BINType(Enum):
     # basic
@@ -69,6 +70,19 @@ class BINHasher:
     @staticmethod
     def hash_to_hex(hash):
         return f'{hash:08x}'
+
+    @staticmethod
+    def hash_to_str(hash):
+        # string form of a hash in either mode: int hashes are formatted, hex and names pass through
+        return f'{hash:08x}' if isinstance(hash, int) else hash
+
+    @staticmethod
+    def int_hashtables(hashtables):
+        # hashtables keyed by int, for BINs read with int_hashes=True
+        return {
+            table_name: {int(hex, 16): raw for hex, raw in table.items()}
+            for table_name, table in hashtables.items()
+        }
     
     @staticmethod
     def is_hash(raw):
@@ -80,6 +94,8 @@ class BINHasher:
 
     @staticmethod
     def raw_or_hex_to_hash(raw_or_hex):
+        if isinstance(raw_or_hex, int):
+            return raw_or_hex
         try:
             return int(raw_or_hex, 16)
         except:
@@ -92,7 +108,7 @@ class BINHasher:
         elif value_type in (BINType.LIST, BINType.LIST2):
             value.data = [BINHasher.un_hash_value(hashtables, v, value_type) for v in value.data]
         elif value_type in (BINType.EMBED, BINType.POINTER):
-            if value.hash_type != '00000000':
+            if value.hash_type not in ('00000000', 0):
                 value.hash_type = BINHasher.hex_to_raw(hashtables, value.hash_type)
                 for f in value.data:
                     BINHasher.un_hash_field(hashtables, f)
@@ -106,7 +122,7 @@ class BINHasher:
             field.data = [BINHasher.un_hash_value(hashtables, v, field.value_type)
                             for v in field.data]
         elif field.type in (BINType.EMBED, BINType.POINTER):
-            if field.hash_type != '00000000':
+            if field.hash_type not in ('00000000', 0):
                 field.hash_type = BINHasher.hex_to_raw(hashtables, field.hash_type)
                 for f in field.data:
                     BINHasher.un_hash_field(hashtables, f)
@@ -126,7 +142,7 @@ class BINHasher:
                             for v in field.data]
         elif patch.type in (BINType.EMBED, BINType.POINTER):
             field = patch.data
-            if field.hash_type != '00000000':
+            if field.hash_type not in ('00000000', 0):
                 field.hash_type = BINHasher.hex_to_raw(hashtables, field.hash_type)
                 for f in field.data:
                     BINHasher.un_hash_field(hashtables, f)
@@ -153,16 +169,27 @@ class BINReader:
         BINType.MTX44:      lambda bs: bs.read_mtx4()[0],
         BINType.RGBA:       lambda bs: bs.read_u8(4),
         BINType.STRING:     lambda bs: bs.read_s_sized16(encoding='utf-8')[0],
-        BINType.HASH:       lambda bs: BINHasher.hash_to_hex(bs.read_u32()[0]),
-        BINType.FILE:       lambda bs: WADHasher.hash_to_hex(bs.read_u64()[0]),
+        BINType.HASH:       lambda bs: BINReader.read_hash(bs),
+        BINType.FILE:       lambda bs: BINReader.read_file_hash(bs),
         BINType.LIST:       lambda bs: BINReader.read_list_or_list2(bs, BINField(type=BINType.LIST)),
         BINType.LIST2:      lambda bs: BINReader.read_list_or_list2(bs, BINField(type=BINType.LIST2)),
         BINType.POINTER:    lambda bs: BINReader.read_pointer_or_embed(bs, BINField(type=BINType.POINTER)),
         BINType.EMBED:      lambda bs: BINReader.read_pointer_or_embed(bs, BINField(type=BINType.EMBED)),
-        BINType.LINK:       lambda bs: BINHasher.hash_to_hex(bs.read_u32()[0]),
+        BINType.LINK:       lambda bs: BINReader.read_hash(bs),
         BINType.FLAG:       lambda bs: bs.read_u8()[0],
     }
 
+    @staticmethod
+    def read_hash(bs):
+        # int_hashes keeps the u32 as read, otherwise it is formatted to hex
+        hash, = bs.read_u32()
+        return hash if bs.int_hashes else BINHasher.hash_to_hex(hash)
+
+    @staticmethod
+    def read_file_hash(bs):
+        hash, = bs.read_u64()
+        return hash if bs.int_hashes else WADHasher.hash_to_hex(hash)
+
     @staticmethod
     def read_value(bs, value_type):
         return BINReader.read_value_dict[value_type](bs)
@@ -185,8 +212,8 @@ class BINReader:
         
     @staticmethod
     def read_pointer_or_embed(bs, field):
-        field.hash_type = BINHasher.hash_to_hex(bs.read_u32()[0])
-        if field.hash_type != '00000000':
+        field.hash_type = BINReader.read_hash(bs)
+        if field.hash_type not in ('00000000', 0):
             bs.pad(4)  # size
             count, = bs.read_u16()
             field.data = [
@@ -232,147 +259,242 @@ class BINReader:
     @staticmethod
     def read_field(bs):
         field = BINField(
-            hash=BINHasher.hash_to_hex(bs.read_u32()[0]),
+            hash=BINReader.read_hash(bs),
             type=BINType.fix(bs, bs.read_u8()[0])
         )
         return BINReader.read_field_dict[field.type](bs, field)
 
 
 class BINWriter:
-    write_value_dict = {
-        BINType.NONE:           lambda: (None, 0),
-        BINType.BOOL:           lambda bs, value: (bs.write_b(value), 1),
-        BINType.I8:             lambda bs, value: (bs.write_i8(value), 1),
-        BINType.U8:             lambda bs, value: (bs.write_u8(value), 1),
-        BINType.I16:            lambda bs, value: (bs.write_i16(value), 2),
-        BINType.U16:            lambda bs, value: (bs.write_u16(value), 2),
-        BINType.I32:            lambda bs, value: (bs.write_i32(value), 4),
-        BINType.U32:            lambda bs, value: (bs.write_u32(value), 4),
-        BINType.I64:            lambda bs, value: (bs.write_i64(value), 8),
-        BINType.U64:            lambda bs, value: (bs.write_u64(value), 8),
-        BINType.F32:            lambda bs, value: (bs.write_f32(value), 4),
-        BINType.VEC2:           lambda bs, value: (bs.write_vec2(value), 8),
-        BINType.VEC3:           lambda bs, value: (bs.write_vec3(value), 12),
-        BINType.VEC4:           lambda bs, value: (bs.write_vec4(value), 16),
-        BINType.MTX44:          lambda bs, value: (bs.write_mtx4(value), 64),
-        BINType.RGBA:           lambda bs, value: (bs.write_u8(*value), 4),
-        BINType.STRING:         lambda bs, value: (bs.write_s_sized16(value, encoding='utf-8'), len(value.encode('utf-8'))+2),
-        BINType.HASH:           lambda bs, value: (bs.write_u32(BINHasher.raw_or_hex_to_hash(value)), 4),
-        BINType.FILE:           lambda bs, value: (bs.write_u64(WADHasher.raw_or_hex_to_hash(value)), 8),
-        BINType.LIST:           lambda bs, value: BINWriter.write_list_or_list2(bs, value),
-        BINType.LIST2:          lambda bs, value: BINWriter.write_list_or_list2(bs, value),
-        BINType.POINTER:        lambda bs, value: BINWriter.write_pointer_or_embed(bs, value),
-        BINType.EMBED:          lambda bs, value: BINWriter.write_pointer_or_embed(bs, value),
-        BINType.LINK:           lambda bs, value: (bs.write_u32(BINHasher.raw_or_hex_to_hash(value)), 4),
-        BINType.FLAG:           lambda bs, value: (bs.write_u8(value), 1),
+    # two passes: size_* works out every size bottom-up, pack_* then emits the whole file
+    # front to back into one preallocated bytearray, so no size is patched after the fact.
+    # sizes holds the size fields of lists, maps, embeds and entries in the order pack_* reaches them.
+
+    # fixed size types: (values per item, struct code, conversion before packing)
+    fixed_formats = {
+        BINType.BOOL:       (1, '?', None),
+        BINType.I8:         (1, 'b', None),
+        BINType.U8:         (1, 'B', None),
+        BINType.I16:        (1, 'h', None),
+        BINType.U16:        (1, 'H', None),
+        BINType.I32:        (1, 'i', None),
+        BINType.U32:        (1, 'I', None),
+        BINType.I64:        (1, 'q', None),
+        BINType.U64:        (1, 'Q', None),
+        BINType.F32:        (1, 'f', None),
+        BINType.VEC2:       (2, 'f', None),
+        BINType.VEC3:       (3, 'f', None),
+        BINType.VEC4:       (4, 'f', None),
+        BINType.MTX44:      (16, 'f', None),
+        BINType.RGBA:       (4, 'B', None),
+        BINType.HASH:       (1, 'I', BINHasher.raw_or_hex_to_hash),
+        BINType.FILE:       (1, 'Q', WADHasher.raw_or_hex_to_hash),
+        BINType.LINK:       (1, 'I', BINHasher.raw_or_hex_to_hash),
+        BINType.FLAG:       (1, 'B', None),
     }
+    fixed_structs = {
+        value_type: Struct(f'<{count}{code}') for value_type, (count, code, convert) in fixed_formats.items()
+    }
+    fixed_sizes = {
+        value_type: struct.size for value_type, struct in fixed_structs.items()
+    }
+    fixed_sizes[BINType.NONE] = 0
+
+    # phase one: sizes
 
     @staticmethod
-    def write_value(bs, value, value_type, header_size):
-        size = BINWriter.write_value_dict[value_type](bs, value)[1]
-        return size+5 if header_size else size
-    
+    def size_value(value, value_type, sizes):
+        size = BINWriter.fixed_sizes.get(value_type)
+        if size != None:
+            return size
+        return BINWriter.size_value_dict[value_type](value, sizes)
+
     @staticmethod
-    def write_basic(bs, field):
-        return None, BINWriter.write_value(bs, field.data, field.type, header_size=False)
+    def size_list_or_list2(field, sizes):
+        slot = len(sizes)
+        sizes.append(0)
+        fixed_size = BINWriter.fixed_sizes.get(field.value_type)
+        if fixed_size != None:
+            content_size = 4 + fixed_size * len(field.data)
+        else:
+            size_value = BINWriter.size_value_dict[field.value_type]
+            content_size = 4 + sum(size_value(value, sizes) for value in field.data)
+        sizes[slot] = content_size
+        return 1 + 4 + content_size
 
     @staticmethod
-    def write_list_or_list2(bs, field):
-        size = 0
-        bs.write_u8(field.value_type.value)
+    def size_pointer_or_embed(field, sizes):
+        if field.hash_type in ('00000000', 0):
+            return 4
+        slot = len(sizes)
+        sizes.append(0)
+        content_size = 2 + sum(5 + BINWriter.size_field(value, sizes) for value in field.data)
+        sizes[slot] = content_size
+        return 4 + 4 + content_size
 
-        return_offset = bs.tell()
-        bs.write_u32(0)  # values size
-        size += 1 + 4
+    @staticmethod
+    def size_option(field, sizes):
+        if field.data == None:
+            return 1 + 1
+        return 1 + 1 + BINWriter.size_value(field.data, field.value_type, sizes)
 
+    @staticmethod
+    def size_map(field, sizes):
+        slot = len(sizes)
+        sizes.append(0)
+        size_value = BINWriter.size_value
         content_size = 4
-        bs.write_u32(len(field.data))
-        for value in field.data:
-            content_size += BINWriter.write_value(bs,
-                                                    value, field.value_type, header_size=False)
-        bs.size_offsets.append((return_offset, content_size))
+        for key, value in field.data.items():
+            content_size += size_value(key, field.key_type, sizes) + size_value(value, field.value_type, sizes)
+        sizes[slot] = content_size
+        return 1 + 1 + 4 + content_size
+
+    size_value_dict = {
+        BINType.STRING:     lambda value, sizes: 2 + len(value.encode('utf-8')),
+        BINType.LIST:       lambda value, sizes: BINWriter.size_list_or_list2(value, sizes),
+        BINType.LIST2:      lambda value, sizes: BINWriter.size_list_or_list2(value, sizes),
+        BINType.POINTER:    lambda value, sizes: BINWriter.size_pointer_or_embed(value, sizes),
+        BINType.EMBED:      lambda value, sizes: BINWriter.size_pointer_or_embed(value, sizes),
+    }
+
+    size_field_dict = {
+        field_type:         lambda field, sizes: BINWriter.size_value(field.data, field.type, sizes)
+        for field_type in (*fixed_formats, BINType.NONE, BINType.STRING)
+    }
+    size_field_dict.update({
+        BINType.LIST:       lambda field, sizes: BINWriter.size_list_or_list2(field, sizes),
+        BINType.LIST2:      lambda field, sizes: BINWriter.size_list_or_list2(field, sizes),
+        BINType.POINTER:    lambda field, sizes: BINWriter.size_pointer_or_embed(field, sizes),
+        BINType.EMBED:      lambda field, sizes: BINWriter.size_pointer_or_embed(field, sizes),
+        BINType.OPTION:     lambda field, sizes: BINWriter.size_option(field, sizes),
+        BINType.MAP:        lambda field, sizes: BINWriter.size_map(field, sizes)
+    })
+
+    @staticmethod
+    def size_field(field, sizes):
+        # without the 5 byte hash + type header
+        return BINWriter.size_field_dict[field.type](field, sizes)
+
+    @staticmethod
+    def size_entry(entry, sizes):
+        slot = len(sizes)
+        sizes.append(0)
+        entry_size = 4 + 2 + sum(5 + BINWriter.size_field(field, sizes) for field in entry.data)
+        sizes[slot] = entry_size
+        return 4 + entry_size
 
-        size += content_size
-        return None, size
+    # phase two: emit
 
     @staticmethod
-    def write_pointer_or_embed(bs, field):
-        size = 0
-        if field.hash_type == '00000000':
-            bs.write_u32(0)
-            size += 4
+    def pack_fixed(buf, offset, values, value_type):
+        # any number of fixed size values with a single pack_into
+        count, code, convert = BINWriter.fixed_formats[value_type]
+        if count > 1:
+            flat = [f for value in values for f in value]
+        elif convert != None:
+            flat = [convert(value) for value in values]
         else:
-            bs.write_u32(BINHasher.raw_or_hex_to_hash(field.hash_type))
-            size += 4
+            flat = values
+        pack_into(f'<{len(flat)}{code}', buf, offset, *flat)
+        return offset + BINWriter.fixed_sizes[value_type] * len(values)
 
-            return_offset = bs.tell()
-            bs.write_u32(0)  # size
-            size += 4
+    @staticmethod
+    def pack_value(buf, offset, value, value_type, sizes):
+        struct = BINWriter.fixed_structs.get(value_type)
+        if struct != None:
+            count, code, convert = BINWriter.fixed_formats[value_type]
+            if count > 1:
+                struct.pack_into(buf, offset, *value)
+            else:
+                struct.pack_into(buf, offset, convert(value) if convert != None else value)
+            return offset + struct.size
+        return BINWriter.pack_value_dict[value_type](buf, offset, value, sizes)
+
+    @staticmethod
+    def pack_string(buf, offset, value):
+        v = value.encode('utf-8')
+        pack_into('<H', buf, offset, len(v))
+        offset += 2
+        buf[offset:offset+len(v)] = v
+        return offset + len(v)
 
-            content_size = 2
-            bs.write_u16(len(field.data))
+    @staticmethod
+    def pack_list_or_list2(buf, offset, field, sizes):
+        pack_into('<BII', buf, offset, field.value_type.value, next(sizes), len(field.data))
+        offset += 1 + 4 + 4
+        if field.value_type in BINWriter.fixed_formats:
+            if len(field.data) > 0:
+                offset = BINWriter.pack_fixed(buf, offset, field.data, field.value_type)
+        else:
+            pack_value = BINWriter.pack_value_dict[field.value_type]
             for value in field.data:
-                content_size += BINWriter.write_field(
-                    bs, value, header_size=True)
-            bs.size_offsets.append((return_offset, content_size))
+                offset = pack_value(buf, offset, value, sizes)
+        return offset
 
-            size += content_size
-        return None, size
-    
     @staticmethod
-    def write_option(bs, field):
-        size = 0
-        bs.write_u8(field.value_type.value)
+    def pack_pointer_or_embed(buf, offset, field, sizes):
+        if field.hash_type in ('00000000', 0):
+            pack_into('<I', buf, offset, 0)
+            return offset + 4
+        pack_into('<IIH', buf, offset, BINHasher.raw_or_hex_to_hash(field.hash_type), next(sizes), len(field.data))
+        offset += 4 + 4 + 2
+        for value in field.data:
+            offset = BINWriter.pack_field(buf, offset, value, sizes)
+        return offset
+
+    @staticmethod
+    def pack_option(buf, offset, field, sizes):
         count = 0 if field.data == None else 1
-        bs.write_u8(count)
-        size += 1 + 1
+        pack_into('<BB', buf, offset, field.value_type.value, count)
+        offset += 1 + 1
         if count != 0:
-            size += BINWriter.write_value(bs, field.data, field.value_type, header_size=False)
-        return None, size
-    
-    @staticmethod
-    def write_map(bs, field):
-        size = 0
-        bs.write_u8(
-            field.key_type.value,
-            field.value_type.value
-        )
-
-        return_offset = bs.tell()
-        bs.write_u32(0)  # size
-        size += 1+1+4
+            offset = BINWriter.pack_value(buf, offset, field.data, field.value_type, sizes)
+        return offset
 
-        content_size = 4
-        bs.write_u32(len(field.data))
+    @staticmethod
+    def pack_map(buf, offset, field, sizes):
+        pack_into('<BBII', buf, offset, field.key_type.value, field.value_type.value, next(sizes), len(field.data))
+        offset += 1 + 1 + 4 + 4
+        pack_value = BINWriter.pack_value
         for key, value in field.data.items():
-            content_size += BINWriter.write_value(bs,
-                                                    key, field.key_type, header_size=False)
-            content_size += BINWriter.write_value(bs,
-                                                    value, field.value_type, header_size=False)
-        bs.size_offsets.append((return_offset, content_size))
-
-        size += content_size
-        return None, size
-    
-    write_field_dict = {
-        field_type:         lambda bs, field: BINWriter.write_basic(bs, field) 
-        for field_type in write_value_dict
+            offset = pack_value(buf, offset, key, field.key_type, sizes)
+            offset = pack_value(buf, offset, value, field.value_type, sizes)
+        return offset
+
+    pack_value_dict = {
+        BINType.NONE:       lambda buf, offset, value, sizes: offset,
+        BINType.STRING:     lambda buf, offset, value, sizes: BINWriter.pack_string(buf, offset, value),
+        BINType.LIST:       lambda buf, offset, value, sizes: BINWriter.pack_list_or_list2(buf, offset, value, sizes),
+        BINType.LIST2:      lambda buf, offset, value, sizes: BINWriter.pack_list_or_list2(buf, offset, value, sizes),
+        BINType.POINTER:    lambda buf, offset, value, sizes: BINWriter.pack_pointer_or_embed(buf, offset, value, sizes),
+        BINType.EMBED:      lambda buf, offset, value, sizes: BINWriter.pack_pointer_or_embed(buf, offset, value, sizes),
     }
-    write_field_dict.update({
-        BINType.LIST:       lambda bs, field: BINWriter.write_list_or_list2(bs, field),
-        BINType.LIST2:      lambda bs, field: BINWriter.write_list_or_list2(bs, field),
-        BINType.POINTER:    lambda bs, field: BINWriter.write_pointer_or_embed(bs, field),
-        BINType.EMBED:      lambda bs, field: BINWriter.write_pointer_or_embed(bs, field),
-        BINType.OPTION:     lambda bs, field: BINWriter.write_option(bs, field),
-        BINType.MAP:        lambda bs, field: BINWriter.write_map(bs, field)
+
+    pack_field_dict = {
+        field_type:         lambda buf, offset, field, sizes: BINWriter.pack_value(buf, offset, field.data, field.type, sizes)
+        for field_type in (*fixed_formats, BINType.NONE, BINType.STRING)
+    }
+    pack_field_dict.update({
+        BINType.LIST:       lambda buf, offset, field, sizes: BINWriter.pack_list_or_list2(buf, offset, field, sizes),
+        BINType.LIST2:      lambda buf, offset, field, sizes: BINWriter.pack_list_or_list2(buf, offset, field, sizes),
+        BINType.POINTER:    lambda buf, offset, field, sizes: BINWriter.pack_pointer_or_embed(buf, offset, field, sizes),
+        BINType.EMBED:      lambda buf, offset, field, sizes: BINWriter.pack_pointer_or_embed(buf, offset, field, sizes),
+        BINType.OPTION:     lambda buf, offset, field, sizes: BINWriter.pack_option(buf, offset, field, sizes),
+        BINType.MAP:        lambda buf, offset, field, sizes: BINWriter.pack_map(buf, offset, field, sizes)
     })
 
     @staticmethod
-    def write_field(bs, field, header_size):
-        bs.write_u32(BINHasher.raw_or_hex_to_hash(field.hash))
-        bs.write_u8(field.type.value)
-        size = BINWriter.write_field_dict[field.type](bs, field)[1]
-        return size+5 if header_size else size
+    def pack_field(buf, offset, field, sizes):
+        pack_into('<IB', buf, offset, BINHasher.raw_or_hex_to_hash(field.hash), field.type.value)
+        return BINWriter.pack_field_dict[field.type](buf, offset + 5, field, sizes)
+
+    @staticmethod
+    def pack_entry(buf, offset, entry, sizes):
+        pack_into('<IIH', buf, offset, next(sizes), BINHasher.raw_or_hex_to_hash(entry.hash), len(entry.data))
+        offset += 4 + 4 + 2
+        for field in entry.data:
+            offset = BINWriter.pack_field(buf, offset, field, sizes)
+        return offset
 
 
 class BINField:
@@ -386,6 +508,14 @@ class BINField:
         self.value_type = value_type
         self.data = data
 
+    @property
+    def hash_str(self):
+        return BINHasher.hash_to_str(self.hash)
+
+    @property
+    def hash_type_str(self):
+        return BINHasher.hash_to_str(self.hash_type)
+
     def __json__(self):
         dic = {key: getattr(self, key) for key in self.__slots__}
         if self.type == BINType.LIST or self.type == BINType.LIST2:
@@ -408,6 +538,20 @@ class BINField:
             if compare_func(item):
                 res.append(item)
         return res
+
+    @staticmethod
+    def copy_value(value):
+        if isinstance(value, BINField):
+            return value.copy()
+        elif isinstance(value, list):
+            return [BINField.copy_value(v) for v in value]
+        elif isinstance(value, dict):
+            return {key: BINField.copy_value(v) for key, v in value.items()}
+        return value
+
+    def copy(self):
+        # structural copy: nested fields are copied, leaf values are shared
+        return BINField(self.hash, self.type, self.hash_type, self.key_type, self.value_type, BINField.copy_value(self.data))
     
 
 class BINPatch:
@@ -419,9 +563,16 @@ class BINPatch:
         self.type = type
         self.data = data
 
+    @property
+    def hash_str(self):
+        return BINHasher.hash_to_str(self.hash)
+
     def __json__(self):
         return {key: getattr(self, key) for key in self.__slots__}
 
+    def copy(self):
+        return BINPatch(self.hash, self.path, self.type, BINField.copy_value(self.data))
+
 
 class BINEntry:
     __slots__ = ('hash', 'type', 'data')
@@ -431,6 +582,14 @@ class BINEntry:
         self.type = type
         self.data = data
 
+    @property
+    def hash_str(self):
+        return BINHasher.hash_to_str(self.hash)
+
+    @property
+    def type_str(self):
+        return BINHasher.hash_to_str(self.type)
+
     def __json__(self):
         return {key: getattr(self, key) for key in self.__slots__}
 
@@ -441,6 +600,9 @@ class BINEntry:
                 res.append(item)
         return res
 
+    def copy(self):
+        return BINEntry(self.hash, self.type, [field.copy() for field in self.data])
+
 class BIN:
     __slots__ = (
         'signature', 'version', 'is_patch',
@@ -458,8 +620,10 @@ class BIN:
     def __json__(self):
         return {key: getattr(self, key) for key in self.__slots__}
 
-    def read(self, path, raw=False):
+    def read(self, path, raw=False, int_hashes=False):
+        # int_hashes: hashes stay ints as read, see BINHasher.hash_to_str / int_hashtables for names
         with BytesStream.reader(path, raw) as bs:
+            bs.int_hashes = int_hashes
             # header
             self.signature, = bs.read_s(4, encoding='utf-8')
             if self.signature not in ('PROP', 'PTCH'):
@@ -489,9 +653,9 @@ class BIN:
                 # read as new bin
                 self.entries = [BINEntry() for i in range(entry_count)]
                 for entry_id, entry in enumerate(self.entries):
-                    entry.type = BINHasher.hash_to_hex(entry_types[entry_id])
+                    entry.type = entry_types[entry_id] if int_hashes else BINHasher.hash_to_hex(entry_types[entry_id])
                     bs.pad(4)  # size
-                    entry.hash = BINHasher.hash_to_hex(bs.read_u32()[0])
+                    entry.hash = BINReader.read_hash(bs)
                     field_count, = bs.read_u16()
                     entry.data = [BINReader.read_field(
                         bs) for i in range(field_count)]
@@ -501,9 +665,9 @@ class BIN:
                 bs.legacy_read = True
                 self.entries = [BINEntry() for i in range(entry_count)]
                 for entry_id, entry in enumerate(self.entries):
-                    entry.type = BINHasher.hash_to_hex(entry_types[entry_id])
+                    entry.type = entry_types[entry_id] if int_hashes else BINHasher.hash_to_hex(entry_types[entry_id])
                     bs.pad(4)  # size
-                    entry.hash = BINHasher.hash_to_hex(bs.read_u32()[0])
+                    entry.hash = BINReader.read_hash(bs)
                     field_count, = bs.read_u16()
                     entry.data = [BINReader.read_field(
                         bs) for i in range(field_count)]
@@ -515,7 +679,7 @@ class BIN:
                 patch_count, = bs.read_u32()
                 self.patches = [BINPatch() for i in range(patch_count)]
                 for patch in self.patches:
-                    patch.hash = BINHasher.hash_to_hex(bs.read_u32()[0])
+                    patch.hash = BINReader.read_hash(bs)
                     bs.pad(4)  # size
                     patch.type = BINType.fix(bs, bs.read_u8()[0])
                     patch.path, = bs.read_s_sized16(encoding='utf-8')
@@ -524,55 +688,73 @@ class BIN:
             return self
         
     def write(self, path, raw=False):
-        with BytesStream.writer(path, raw) as bs:
-            # header
-            if self.is_patch:
-                bs.write_s('PTCH', encoding='utf-8')
-                bs.write_u32(1, 0)  # patch header
-            bs.write_s('PROP', encoding='utf-8')
-            bs.write_u32(3)  # version
-            # links
-            bs.write_u32(len(self.links))
-            for link in self.links:
-                bs.write_s_sized16(link, encoding='utf-8')
-            # entry_types + entries
-            bs.write_u32(len(self.entries))
-            for entry in self.entries:
-                bs.write_u32(BINHasher.raw_or_hex_to_hash(entry.type))
-            bs.size_offsets = []  # this help to write sizes
-            for entry in self.entries:
-                return_offset = bs.tell()
-
-                bs.write_u32(0)  # size
-                entry_size = 4+2
-
-                bs.write_u32(BINHasher.raw_or_hex_to_hash(entry.hash))
-                bs.write_u16(len(entry.data))
-                for field in entry.data:
-                    entry_size += BINWriter.write_field(
-                        bs, field, header_size=True)
-                bs.size_offsets.append((return_offset, entry_size))
-            # patches
-            if self.is_patch:
-                bs.write_u32(len(self.patches))
-                for patch in self.patches:
-                    bs.write_u32(BINHasher.raw_or_hex_to_hash(patch.hash))
-
-                    return_offset = bs.tell()
-                    bs.write_u32(0)  # size
-                    patch_size = 1 + 2 + len(patch.path)
-
-                    bs.write_u8(patch.type.value)
-                    bs.write_s_sized16(patch.path, encoding='utf-8')
-                    patch_size += BINWriter.write_value(
-                        bs, patch.data, patch.type, header_size=False)
-                    bs.size_offsets.append(
-                        (return_offset, patch_size))
-            # jump around and write size
-            for offset, size in bs.size_offsets:
-                bs.seek(offset)
-                bs.write_u32(size)
-            return bs.raw() if raw else None
+        # phase one: every size, bottom-up
+        sizes = []
+        links = [link.encode('utf-8') for link in self.links]
+        total = (12 if self.is_patch else 0) + 4 + 4
+        total += 4 + sum(2 + len(link) for link in links)
+        total += 4 + 4 * len(self.entries)
+        for entry in self.entries:
+            total += BINWriter.size_entry(entry, sizes)
+        if self.is_patch:
+            patch_paths = [patch.path.encode('utf-8') for patch in self.patches]
+            total += 4
+            for patch, patch_path in zip(self.patches, patch_paths):
+                slot = len(sizes)
+                sizes.append(0)
+                patch_size = 1 + 2 + len(patch_path) + BINWriter.size_value(patch.data, patch.type, sizes)
+                sizes[slot] = patch_size
+                total += 4 + 4 + patch_size
+        # phase two: one forward pass
+        buf = bytearray(total)
+        sizes = iter(sizes)
+        offset = 0
+        # header
+        if self.is_patch:
+            buf[0:12] = b'PTCH\x01\x00\x00\x00\x00\x00\x00\x00'  # patch header
+            offset = 12
+        buf[offset:offset+8] = b'PROP\x03\x00\x00\x00'  # version 3
+        offset += 8
+        # links
+        pack_into('<I', buf, offset, len(links))
+        offset += 4
+        for link in links:
+            pack_into('<H', buf, offset, len(link))
+            buf[offset+2:offset+2+len(link)] = link
+            offset += 2 + len(link)
+        # entry_types + entries
+        pack_into('<I', buf, offset, len(self.entries))
+        offset += 4
+        if len(self.entries) > 0:
+            offset = BINWriter.pack_fixed(buf, offset, [entry.type for entry in self.entries], BINType.HASH)
+        for entry in self.entries:
+            offset = BINWriter.pack_entry(buf, offset, entry, sizes)
+        # patches
+        if self.is_patch:
+            pack_into('<I', buf, offset, len(self.patches))
+            offset += 4
+            for patch, patch_path in zip(self.patches, patch_paths):
+                pack_into('<IIBH', buf, offset, BINHasher.raw_or_hex_to_hash(patch.hash), next(sizes), patch.type.value, len(patch_path))
+                offset += 4 + 4 + 1 + 2
+                buf[offset:offset+len(patch_path)] = patch_path
+                offset += len(patch_path)
+                offset = BINWriter.pack_value(buf, offset, patch.data, patch.type, sizes)
+        if offset != total:
+            raise Exception(
+                f'pyRitoFile: Error: Write BIN {path}: Wrote {offset} bytes, sized {total} bytes.')
+        if raw:
+            return bytes(buf)
+        with open(path, 'wb') as f:
+            f.write(buf)
+
+    def copy(self):
+        # cheap clone for copy-on-write users: much faster than re-reading or deepcopy
+        return BIN(
+            self.signature, self.version, self.is_patch,
+            list(self.links) if self.links != None else None,
+            [entry.copy() for entry in self.entries] if self.entries != None else None,
+            [patch.copy() for patch in self.patches] if self.patches != None else None
+        )
 
     def un_hash(self, hashtables=None):
         if hashtables == None:
@@ -1,5 +1,6 @@
 from .stream import BytesStream
 from enum import Enum
+import os
 
 class BNKHelper:
     @staticmethod
@@ -343,7 +344,26 @@ class BNK:
 
             return self
         
+    def iter_wems(self, path, raw=False):
+        # yield (wem, memoryview of wem data) from a bnk that was read
+        if self.didx == None or self.data == None:
+            return
+        start_offset = self.data.start_offset
+        yield from zip(self.didx.wems, BytesStream.mapped_slices(
+            path, [(start_offset + wem.offset, wem.size) for wem in self.didx.wems], raw))
+
+    def extract_wems(self, path, out_dir, raw=False):
+        os.makedirs(out_dir, exist_ok=True)
+        wem_paths = []
+        for wem, data in self.iter_wems(path, raw):
+            wem_path = os.path.join(out_dir, f'{wem.id}.wem')
+            with open(wem_path, 'wb') as f:
+                f.write(data)
+            wem_paths.append(wem_path)
+        return wem_paths
+
     def write(self, path, wem_datas, raw=False):
+        # wem_datas: bytes-like or file-like object for each wem (exactly one each), can be an iterator
         with BytesStream.writer(path, raw) as bs:
             # write bkhd
             # signature, size, version, id, unknown 24 bytes
@@ -353,27 +373,28 @@ class BNK:
 
             # write didx
             # signature, size
-            wem_data_offsets = []
             bs.write_s('DIDX')
             bs.write_u32(len(self.didx.wems)*12)
-            # write wem infos
-            for i, wem in enumerate(self.didx.wems):
-                wem_data_offsets.append(bs.tell()+4)
-                wem.size = len(wem_datas[i])
-                bs.write_u32(wem.id, 0, wem.size)
+            # wem infos - offset and size write later
+            didx_offset = bs.tell()
+            bs.write(bytes(len(self.didx.wems)*12))
 
             # write data
-            # signature, size
+            # signature, size - size write later
             bs.write_s('DATA')
-            bs.write_u32(sum(wem.size for wem in self.didx.wems))
-            # wem data - need to minus start offset
+            data_size_offset = bs.tell()
+            bs.write_u32(0)
+            # wem data - offset is relative to start offset
             start_offset = bs.tell()
-            for i, wem_data in enumerate(wem_datas):
-                data_offset = bs.tell()
-                bs.seek(wem_data_offsets[i])
-                bs.write_u32(data_offset-start_offset)
-                bs.seek(data_offset)
-                bs.write(wem_data)
+            for wem, wem_data in zip(self.didx.wems, wem_datas, strict=True):
+                wem.offset = bs.tell() - start_offset
+                wem.size = bs.write_source(wem_data)
+            data_size = bs.tell() - start_offset
+            # data size, wem infos
+            bs.seek(data_size_offset)
+            bs.write_u32(data_size)
+            bs.seek(didx_offset)
+            for wem in self.didx.wems:
+                bs.write_u32(wem.id, wem.offset, wem.size)
                 
             return bs.raw() if raw else None
-
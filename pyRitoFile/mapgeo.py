@@ -2,6 +2,12 @@ from .stream import BytesStream
 from .structs import Vector
 from enum import Enum, IntFlag
 
+# not safe because external modules
+try:
+    import numpy as np
+except:
+    np = None
+
 class MAPGEOPlanarReflector:
     __slots__ = (
         'transform', 'plane', 'normal'
@@ -160,6 +166,48 @@ class MAPGEOVertex:
     def __json__(self):
         return {key.__json__(): self.value[key] for key in self.value}
 
+class MAPGEOVertexArray:
+    # array mode vertices of a model: one structured array per vertex buffer (views of the file data,
+    # shared by every model using the buffer); MAPGEOVertex objects are only made when indexed
+    __slots__ = ('arrays', 'descriptions')
+
+    def __init__(self, arrays=None, descriptions=None):
+        self.arrays = arrays
+        self.descriptions = descriptions
+
+    def __len__(self):
+        return len(self.arrays[0]) if len(self.arrays) > 0 else 0
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        vertex = MAPGEOVertex(value={})
+        for array, vertex_description in zip(self.arrays, self.descriptions):
+            record = array[index]
+            for element in vertex_description.elements:
+                _, _, unpacked_item_size, unpacked_type = MAPGEOHelper.MGVertexFormatToPyValues[element.format]
+                item = record[element.name.name]
+                if unpacked_item_size == 1:
+                    vertex.value[element.name] = unpacked_type(item)
+                else:
+                    items = item.tolist()
+                    vertex.value[element.name] = unpacked_type(*items) if unpacked_type is not tuple else unpacked_type(items)
+        return vertex
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def field(self, name):
+        # the whole column of one MAPGEOVertexElementName, None if no buffer has it
+        for array, vertex_description in zip(self.arrays, self.descriptions):
+            if any(element.name == name for element in vertex_description.elements):
+                return array[name.name]
+        return None
+
+    def __json__(self):
+        return {'arrays': [array.dtype.descr for array in self.arrays], 'count': len(self)}
+
 class MAPGEOModel:
     __slots__ = (
         'name',
@@ -267,6 +315,18 @@ class MAPGEOVertexDescription:
     def __json__(self):
         return {key: getattr(self, key) for key in self.__slots__}
 
+    def dtype(self):
+        # one vertex of this description as a structured dtype, for array mode
+        fields = []
+        for element in self.elements:
+            python_format, _, unpacked_item_size, _ = MAPGEOHelper.MGVertexFormatToPyValues[element.format]
+            numpy_format = MAPGEOHelper.PyFormatToNumpy[python_format[-1]]
+            if unpacked_item_size == 1:
+                fields.append((element.name.name, numpy_format))
+            else:
+                fields.append((element.name.name, numpy_format, (unpacked_item_size,)))
+        return np.dtype(fields)
+
 class MAPGEOHelper:
     MGVertexFormatToPyValues = {
         # mapgeo vertex format: (python struct format, bytes size, python items size, type of items)
@@ -281,6 +341,11 @@ class MAPGEOHelper:
         MAPGEOVertexElementFormat.XYZ_Packed161616: ('4e', 8, 4, Vector), # yes its 8 bytes not 6, +2 for padding
         MAPGEOVertexElementFormat.XYZW_Packed16161616: ('4e', 8, 4, Vector)  
     }
+    PyFormatToNumpy = {
+        'f': '<f4',
+        'B': 'u1',
+        'e': '<f2',
+    }
 
 class MAPGEO:
     __slots__ = (
@@ -300,8 +365,17 @@ class MAPGEO:
     def __json__(self):
         return {key: getattr(self, key) for key in self.__slots__}
     
-    def read(self, path, raw=False):
-        with BytesStream.reader(path, raw) as bs:
+    def read(self, path, raw=False, array=False):
+        # array: vertex and index buffers become numpy views over the file data, one per buffer,
+        # instead of a MAPGEOVertex per vertex; model.vertices is then a MAPGEOVertexArray
+        data = None
+        if array:
+            if raw:
+                data = path
+            else:
+                with open(path, 'rb') as f:
+                    data = f.read()
+        with BytesStream.reader(data if array else path, raw or array) as bs:
             self.signature, = bs.read_s(4)
             if self.signature != 'OEGM':
                 raise Exception(
@@ -369,7 +443,11 @@ class MAPGEO:
                 if self.version >= 13:
                     bs.pad(1)  # layer
                 index_buffer_size, = bs.read_u32() # size = byte count
-                index_buffers[i] = bs.read_u16(index_buffer_size // 2)
+                if array:
+                    index_buffers[i] = np.frombuffer(data, dtype='<u2', count=index_buffer_size // 2, offset=bs.tell())
+                    bs.pad(index_buffer_size // 2 * 2)
+                else:
+                    index_buffers[i] = bs.read_u16(index_buffer_size // 2)
 
             # read models
             unpacked_vertex_buffers = [None]*vertex_buffer_count # for skip reading same vertex buffer
@@ -386,43 +464,54 @@ class MAPGEO:
                 model.vertex_count, model.vertex_buffer_count, model.vertex_description_id = bs.read_u32(3)
                 # read vertex buffer into unpacked vbs
                 model.vertex_buffer_ids = bs.read_i32(model.vertex_buffer_count)
-                for i, vertex_buffer_id in enumerate(model.vertex_buffer_ids):
-                    vertex_description = self.vertex_descriptions[model.vertex_description_id+i]
-                    # skip unpacked vertex buffers
-                    if unpacked_vertex_buffers[vertex_buffer_id] != None:
-                        continue
-                    unpacked_vertex_buffers[vertex_buffer_id] = []
-                    # vertex python format & size through vertex descriptions of single vertex (yes only 1)
-                    vertex_python_format = ''
-                    vertex_byte_size = 0
-                    for element in vertex_description.elements:
-                        python_format, byte_size, _, _ = MAPGEOHelper.MGVertexFormatToPyValues[element.format]
-                        vertex_python_format += python_format
-                        vertex_byte_size += byte_size
-                    # save the current offset (we are in middle of model reading)
-                    # jump to vertex buffers place through saved vertex buffer offset
-                    return_offset = bs.tell()
-                    bs.seek(vertex_buffer_offsets[vertex_buffer_id])
-                    # read whole vertex buffers with vertex format & size
-                    # every vertex use same format so just multiply with vertex count
-                    unpacked_vertex_buffers[vertex_buffer_id] = bs.read_fmt(
-                        fmt = vertex_python_format*model.vertex_count,
-                        fmt_size = vertex_byte_size*model.vertex_count
+                if array:
+                    vertex_descriptions = self.vertex_descriptions[model.vertex_description_id:model.vertex_description_id+model.vertex_buffer_count]
+                    for vertex_buffer_id, vertex_description in zip(model.vertex_buffer_ids, vertex_descriptions):
+                        if unpacked_vertex_buffers[vertex_buffer_id] is None:
+                            unpacked_vertex_buffers[vertex_buffer_id] = np.frombuffer(
+                                data, dtype=vertex_description.dtype(), count=model.vertex_count, offset=vertex_buffer_offsets[vertex_buffer_id])
+                    model.vertices = MAPGEOVertexArray(
+                        [unpacked_vertex_buffers[vertex_buffer_id] for vertex_buffer_id in model.vertex_buffer_ids],
+                        vertex_descriptions
                     )
-                    # return to model reading after read vertices
-                    bs.seek(return_offset)
-                # now with unpacked vbs, set values for vertex
-                model.vertices = [MAPGEOVertex(value={}) for i in range(model.vertex_count)]
-                for i, vertex_buffer_id in enumerate(model.vertex_buffer_ids):
-                    vertex_description = self.vertex_descriptions[model.vertex_description_id+i]
-                    unpacked_vb = unpacked_vertex_buffers[vertex_buffer_id]
-                    current_index = 0
-                    for vertex in model.vertices:
+                else:
+                    for i, vertex_buffer_id in enumerate(model.vertex_buffer_ids):
+                        vertex_description = self.vertex_descriptions[model.vertex_description_id+i]
+                        # skip unpacked vertex buffers
+                        if unpacked_vertex_buffers[vertex_buffer_id] != None:
+                            continue
+                        unpacked_vertex_buffers[vertex_buffer_id] = []
+                        # vertex python format & size through vertex descriptions of single vertex (yes only 1)
+                        vertex_python_format = ''
+                        vertex_byte_size = 0
                         for element in vertex_description.elements:
-                            _, _, unpacked_item_size, unpacked_type = MAPGEOHelper.MGVertexFormatToPyValues[element.format]
-                            unpacked_item_value = unpacked_vb[current_index:current_index+unpacked_item_size]
-                            vertex.value[element.name] = unpacked_type(*unpacked_item_value) if unpacked_type is not tuple else unpacked_type(unpacked_item_value)
-                            current_index += unpacked_item_size
+                            python_format, byte_size, _, _ = MAPGEOHelper.MGVertexFormatToPyValues[element.format]
+                            vertex_python_format += python_format
+                            vertex_byte_size += byte_size
+                        # save the current offset (we are in middle of model reading)
+                        # jump to vertex buffers place through saved vertex buffer offset
+                        return_offset = bs.tell()
+                        bs.seek(vertex_buffer_offsets[vertex_buffer_id])
+                        # read whole vertex buffers with vertex format & size
+                        # every vertex use same format so just multiply with vertex count
+                        unpacked_vertex_buffers[vertex_buffer_id] = bs.read_fmt(
+                            fmt = vertex_python_format*model.vertex_count,
+                            fmt_size = vertex_byte_size*model.vertex_count
+                        )
+                        # return to model reading after read vertices
+                        bs.seek(return_offset)
+                    # now with unpacked vbs, set values for vertex
+                    model.vertices = [MAPGEOVertex(value={}) for i in range(model.vertex_count)]
+                    for i, vertex_buffer_id in enumerate(model.vertex_buffer_ids):
+                        vertex_description = self.vertex_descriptions[model.vertex_description_id+i]
+                        unpacked_vb = unpacked_vertex_buffers[vertex_buffer_id]
+                        current_index = 0
+                        for vertex in model.vertices:
+                            for element in vertex_description.elements:
+                                _, _, unpacked_item_size, unpacked_type = MAPGEOHelper.MGVertexFormatToPyValues[element.format]
+                                unpacked_item_value = unpacked_vb[current_index:current_index+unpacked_item_size]
+                                vertex.value[element.name] = unpacked_type(*unpacked_item_value) if unpacked_type is not tuple else unpacked_type(unpacked_item_value)
+                                current_index += unpacked_item_size
 
                 # model indices
                 model.index_count, model.index_buffer_id = bs.read_u32(2)
@@ -2,6 +2,12 @@ from .stream import BytesStream
 from .helper import FNV1a
 from enum import Enum
 
+# not safe because external modules
+try:
+    import numpy as np
+except:
+    np = None
+
 def bin_hash(name):
     return f'{FNV1a(name):08x}'
 
@@ -14,6 +20,21 @@ class SKNVertexType(Enum):
     def __json__(self):
         return self.name
 
+    def dtype(self):
+        # one vertex of this type as a structured dtype, for array mode
+        fields = [
+            ('position', '<f4', (3,)),
+            ('influences', 'u1', (4,)),
+            ('weights', '<f4', (4,)),
+            ('normal', '<f4', (3,)),
+            ('uv', '<f4', (2,)),
+        ]
+        if self in (SKNVertexType.COLOR, SKNVertexType.TANGENT):
+            fields.append(('color', 'u1', (4,)))
+            if self == SKNVertexType.TANGENT:
+                fields.append(('tangent', '<f4', (4,)))
+        return np.dtype(fields)
+
 
 class SKNVertex:
     __slots__ = (
@@ -74,7 +95,9 @@ class SKN:
     def __json__(self):
         return {key: getattr(self, key) for key in self.__slots__}
 
-    def read(self, path, raw=False):
+    def read(self, path, raw=False, array=False):
+        # array: vertices are one numpy structured array (see SKNVertexType.dtype)
+        # and indices a numpy u16 array, instead of SKNVertex objects and a list
         with BytesStream.reader(path, raw) as bs:
             self.signature, = bs.read_u32()
             if self.signature != 0x00112233:
@@ -128,15 +151,26 @@ class SKN:
                 raise Exception(f'pyRitoFile: Error: Read SKN {path}: Bad indices data: {index_count}')
 
             # read unique indices
-            indices = bs.read_u16(index_count)
-            self.indices = []
-            for i in range(0, index_count, 3):
-                if indices[i] == indices[i+1] or indices[i+1] == indices[i+2] or indices[i+2] == indices[i]:
-                    continue
-                self.indices.extend(
-                    (indices[i], indices[i+1], indices[i+2]))
+            if np != None:
+                # drop degenerate triangles over the whole index buffer at once
+                triangles = np.frombuffer(bs.read(index_count * 2), dtype='<u2').reshape(-1, 3)
+                keep = (triangles[:, 0] != triangles[:, 1]) & (triangles[:, 1] != triangles[:, 2]) & (triangles[:, 2] != triangles[:, 0])
+                triangles = triangles[keep].ravel()
+                self.indices = triangles.copy() if array else triangles.tolist()
+            else:
+                indices = bs.read_u16(index_count)
+                self.indices = []
+                for i in range(0, index_count, 3):
+                    if indices[i] == indices[i+1] or indices[i+1] == indices[i+2] or indices[i+2] == indices[i]:
+                        continue
+                    self.indices.extend(
+                        (indices[i], indices[i+1], indices[i+2]))
 
             # read vertices
+            if array:
+                dtype = (self.vertex_type or SKNVertexType.BASIC).dtype()
+                self.vertices = np.frombuffer(bytearray(bs.read(vertex_count * dtype.itemsize)), dtype=dtype)
+                return self
             self.vertices = [SKNVertex() for i in range(vertex_count)]
             for vertex in self.vertices:
                 vertex.position, = bs.read_vec3()
@@ -176,7 +210,15 @@ class SKN:
                 bs.write_vec3(self.bounding_sphere[0])
                 bs.write_f32(self.bounding_sphere[1])
              # indices vertices
-            bs.write_u16(*self.indices)
+            if np != None and isinstance(self.indices, np.ndarray):
+                bs.write(self.indices.astype('<u2', copy=False).tobytes())
+            else:
+                bs.write_u16(*self.indices)
+            if np != None and isinstance(self.vertices, np.ndarray):
+                # array mode: the vertex block is the array's own bytes
+                dtype = (self.vertex_type or SKNVertexType.BASIC).dtype()
+                bs.write(self.vertices.astype(dtype, copy=False).tobytes())
+                return bs.raw() if raw else None
             for vertex in self.vertices:
                 bs.write_vec3(vertex.position)
                 bs.write_u8(*vertex.influences)
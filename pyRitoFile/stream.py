@@ -1,5 +1,7 @@
 from io import BytesIO, StringIO
 from struct import Struct
+from shutil import copyfileobj
+import mmap
 from .structs import Vector, Quaternion, Matrix4
 
 class StringStream:
@@ -28,6 +30,29 @@ class BytesStream:
     def updater(path, raw=False):
         return BytesStream(BytesIO(path)) if raw else BytesStream(open(path, 'rb+'))
         
+    @staticmethod
+    def mapped_slices(path, spans, raw=False):
+        # yield memoryview of each (offset, size) span without copying
+        # file is mapped in memory, so views are only valid while iterating
+        if raw:
+            view = memoryview(path)
+            for offset, size in spans:
+                yield view[offset:offset+size]
+            return
+        with open(path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mm)
+        try:
+            for offset, size in spans:
+                yield view[offset:offset+size]
+        finally:
+            view.release()
+            try:
+                mm.close()
+            except BufferError:
+                # a slice is still alive, the map is freed with it
+                pass
+
     def __init__(self, f):
         self.stream = f
 
@@ -143,11 +168,7 @@ class BytesStream:
         return s,
 
     def read_c_sep_0(self, length):
-        s = ''
-        for i in range(length):
-            s += chr(self.stream.read(1)[0])
-            self.pad(1)
-        return s,
+        return self.stream.read(length * 2)[::2].decode('latin-1'),
 
     # write
 
@@ -157,6 +178,15 @@ class BytesStream:
     def write(self, values):
         self.stream.write(values)
 
+    def write_source(self, source, chunk_size=1024*1024):
+        # copy bytes-like or file-like source, return its size
+        if hasattr(source, 'read'):
+            start = self.stream.tell()
+            copyfileobj(source, self.stream, chunk_size)
+            return self.stream.tell() - start
+        self.stream.write(source)
+        return memoryview(source).nbytes
+
     def write_b(self, *values):
         self.stream.write(Struct(f'<{len(values)}?').pack(*values))
 
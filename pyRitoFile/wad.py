@@ -1,5 +1,7 @@
 from .stream import BytesStream
+from io import BytesIO
 from enum import Enum
+from functools import lru_cache
 import gzip
 
 # not safe because external modules
@@ -8,6 +10,10 @@ try:
     from xxhash import xxh64, xxh3_64
 except:
     print('Warning: pyRitoFile.wad failed to import pyzstd, xxhash.')
+try:
+    import numpy as np
+except:
+    np = None
 
 class WADExtensioner:
     signature_to_extension = {
@@ -68,6 +74,33 @@ class WADExtensioner:
         for _, extension in WADExtensioner.signature_to_extension.items():
             if path.endswith(extension):
                 return extension
+
+    @staticmethod
+    def get_extensions(paths):
+        # get_extension for many paths: which extensions can match only depends on the text
+        # after the last dot, so the candidates are worked out once per distinct suffix
+        candidates = {}
+        res = []
+        for path in paths:
+            suffix = path[path.rfind('.') + 1:]
+            checks = candidates.get(suffix)
+            if checks == None:
+                checks = []
+                for ending, extension in (('.wad.client', 'wad'), *((extension, extension) for extension in WADExtensioner.signature_to_extension.values())):
+                    if '.' not in ending:
+                        if suffix.endswith(ending):
+                            checks.append((None, extension))
+                            break
+                    elif ending.rsplit('.', 1)[1] == suffix:
+                        checks.append((ending, extension))
+                candidates[suffix] = checks
+            for ending, extension in checks:
+                if ending == None or path.endswith(ending):
+                    res.append(extension)
+                    break
+            else:
+                res.append(None)
+        return res
             
 
 class WADHasher:
@@ -75,6 +108,12 @@ class WADHasher:
         'hashes.game.txt',
         'hashes.lcu.txt',
     )
+    if np != None:
+        _NIBBLES = np.full(256, 0xFF, dtype=np.uint8)
+        _NIBBLES[np.frombuffer(b'0123456789', dtype=np.uint8)] = np.arange(10)
+        _NIBBLES[np.frombuffer(b'abcdef', dtype=np.uint8)] = np.arange(10, 16)
+        _NIBBLES[np.frombuffer(b'ABCDEF', dtype=np.uint8)] = np.arange(10, 16)
+
     @staticmethod
     def hex_to_raw(hashtables, hex):
         for table_name in reversed(WADHasher.HASHTABLE_NAMES):
@@ -83,12 +122,43 @@ class WADHasher:
         return hex
     
     @staticmethod
+    @lru_cache(maxsize=1 << 16)
     def raw_to_hex(raw):
+        # memoized: the same path is hashed from every BIN that mentions it
         return f'{xxh64(raw.lower()).intdigest():016x}'
 
+    @staticmethod
+    def raws_to_hexes(raws):
+        raw_to_hex = WADHasher.raw_to_hex
+        return [raw_to_hex(raw) for raw in raws]
+
+    @staticmethod
+    def hexes_to_hashes(hexes):
+        # vectorized int(hex, 16) over 16 digit hex strings, valid marks the ones that parsed
+        lengths = np.fromiter(map(len, hexes), dtype=np.int64, count=len(hexes))
+        codes = np.array(hexes, dtype='<U16').view(np.uint32).reshape(len(hexes), 16)
+        nibbles = WADHasher._NIBBLES[np.minimum(codes, 255)]
+        valid = (lengths == 16) & (nibbles != 0xFF).all(axis=1)
+        shifts = np.arange(60, -4, -4, dtype=np.uint64)
+        hashes = np.bitwise_or.reduce(nibbles.astype(np.uint64) << shifts, axis=1)
+        return hashes, valid
+
     @staticmethod
     def hash_to_hex(hash):
         return f'{hash:016x}'
+
+    @staticmethod
+    def hash_to_str(hash):
+        # string form of a hash in either mode: int hashes are formatted, hex and names pass through
+        return f'{hash:016x}' if isinstance(hash, int) else hash
+
+    @staticmethod
+    def int_hashtables(hashtables):
+        # hashtables keyed by int, for WADs read with int_hashes=True
+        return {
+            table_name: {int(hex, 16): raw for hex, raw in table.items()}
+            for table_name, table in hashtables.items()
+        }
     
     @staticmethod
     def is_hash(raw):
@@ -100,11 +170,66 @@ class WADHasher:
 
     @staticmethod
     def raw_or_hex_to_hash(raw_or_hex):
+        if isinstance(raw_or_hex, int):
+            return raw_or_hex
         try:
             return int(raw_or_hex, 16)
         except:
             return xxh64(raw_or_hex.lower()).intdigest()
-        
+
+
+class WADHashTable:
+    # hashtables compiled for WAD.un_hash: sorted u64 keys and the raw paths they resolve to
+    __slots__ = ('keys', 'values')
+
+    def __init__(self, keys=None, values=None):
+        self.keys = keys if keys is not None else np.zeros(0, dtype=np.uint64)
+        self.values = values if values is not None else np.zeros(0, dtype=object)
+
+    def __len__(self):
+        return len(self.keys)
+
+    @staticmethod
+    def compile(hashtables):
+        # later tables win, the same priority as WADHasher.hex_to_raw
+        merged = {}
+        for table_name in WADHasher.HASHTABLE_NAMES:
+            if table_name in hashtables:
+                merged.update(hashtables[table_name])
+        hashes, valid = WADHasher.hexes_to_hashes(list(merged))
+        values = np.array(list(merged.values()), dtype=object)
+        hashes, values = hashes[valid], values[valid]
+        order = np.argsort(hashes, kind='stable')
+        return WADHashTable(hashes[order], values[order])
+
+    def find(self, hashes):
+        # index into values for every hash, -1 where the hash is unknown
+        if len(self.keys) == 0:
+            return np.full(len(hashes), -1, dtype=np.int64)
+        ids = np.searchsorted(self.keys, hashes)
+        ids[ids == len(self.keys)] = 0
+        return np.where(self.keys[ids] == hashes, ids, -1)
+
+    def save(self, path, tag=''):
+        # binary cache: keys as u64, values as one utf-8 blob split by newlines (paths never contain one)
+        blob = '\n'.join(self.values.tolist()).encode('utf-8')
+        with open(path, 'wb') as f:
+            np.savez(f, keys=self.keys, values=np.frombuffer(blob, dtype=np.uint8), tag=np.array(tag))
+
+    @staticmethod
+    def load(path, tag=None):
+        # None when the cache was saved with another tag
+        with np.load(path, allow_pickle=False) as data:
+            if tag != None and str(data['tag']) != tag:
+                return None
+            keys = data['keys']
+            blob = data['values'].tobytes().decode('utf-8')
+        values = blob.split('\n') if len(keys) > 0 else []
+        if len(values) != len(keys):
+            raise Exception(
+                f'pyRitoFile: Error: Load WADHashTable {path}: {len(keys)} keys but {len(values)} values.')
+        return WADHashTable(keys, np.array(values, dtype=object))
+
 
 class WADCompressionType(Enum):
     Raw = 0
@@ -139,6 +264,10 @@ class WADChunk:
         self.data = data
         self.extension = extension
 
+    @property
+    def hash_str(self):
+        return WADHasher.hash_to_str(self.hash)
+
     def __json__(self):
         return {key: getattr(self, key) for key in self.__slots__ if key != 'data'}
 
@@ -246,7 +375,8 @@ class WAD:
     def __json__(self):
         return {key: getattr(self, key) for key in self.__slots__ if key != 'IO'}
 
-    def read(self, path, raw=False):
+    def read(self, path, raw=False, int_hashes=False):
+        # int_hashes: chunk hashes stay ints as read, see WADChunk.hash_str for the hex
         with BytesStream.reader(path, raw) as bs:
             # read header
             self.signature, = bs.read_s(2)
@@ -274,7 +404,9 @@ class WAD:
             self.chunks = [WADChunk() for i in range(chunk_count)]
             for chunk_id, chunk in enumerate(self.chunks):
                 chunk.id = chunk_id
-                chunk.hash = WADHasher.hash_to_hex(bs.read_u64()[0])
+                chunk.hash, = bs.read_u64()
+                if not int_hashes:
+                    chunk.hash = WADHasher.hash_to_hex(chunk.hash)
                 chunk.offset, chunk.compressed_size, chunk.decompressed_size, = bs.read_u32(
                     3)
                 chunk.compression_type = WADCompressionType(
@@ -311,11 +443,35 @@ class WAD:
     def un_hash(self, hashtables=None):
         if hashtables == None:
             return
+        if isinstance(hashtables, WADHashTable):
+            return self.un_hash_compiled(hashtables)
         for chunk in self.chunks:
             chunk.hash = WADHasher.hex_to_raw(hashtables, chunk.hash)
-            if '.' in chunk.hash and chunk.extension == None:
+            if chunk.extension == None and isinstance(chunk.hash, str) and '.' in chunk.hash:
                 chunk.extension = WADExtensioner.get_extension(chunk.hash)
-        self.chunks = sorted(self.chunks, key=lambda chunk: chunk.hash)
+        # unresolved int hashes sort as their hex, the same order as the string mode
+        self.chunks = sorted(self.chunks, key=lambda chunk: chunk.hash_str)
+
+    def un_hash_compiled(self, table):
+        # one searchsorted over every chunk hash instead of a dict probe per chunk
+        chunks = self.chunks
+        names = [chunk.hash for chunk in chunks]
+        if all(type(name) == int for name in names):
+            # read with int_hashes, nothing to parse
+            hashes = np.array(names, dtype=np.uint64)
+            valid = np.ones(len(names), dtype=bool)
+        else:
+            hashes, valid = WADHasher.hexes_to_hashes([WADHasher.hash_to_str(name) for name in names])
+        ids = np.full(len(chunks), -1, dtype=np.int64)
+        ids[valid] = table.find(hashes[valid])
+        hits = np.flatnonzero(ids >= 0)
+        raws = table.values[ids[hits]].tolist()
+        for chunk_id, raw in zip(hits.tolist(), raws):
+            chunks[chunk_id].hash = raw
+        pending = [chunk for chunk in chunks if chunk.extension == None and isinstance(chunk.hash, str) and '.' in chunk.hash]
+        for chunk, extension in zip(pending, WADExtensioner.get_extensions([chunk.hash for chunk in pending])):
+            chunk.extension = extension
+        self.chunks = sorted(chunks, key=lambda chunk: chunk.hash_str)
 
     def get_items(self, compare_func):
         res = []
@@ -323,3 +479,75 @@ class WAD:
             if compare_func(item):
                 res.append(item)
         return res
+
+
+class WADWriter:
+    __slots__ = ('chunks', 'datas')
+
+    def __init__(self, chunks=None, datas=None):
+        self.chunks = chunks if chunks != None else []
+        self.datas = datas if datas != None else []
+
+    def add_chunk(self, chunk_hash, chunk_data, extension=None):
+        # compress data and lay out this chunk after the previous ones
+        chunk = WADChunk.default(id=len(self.chunks), hash=chunk_hash)
+        chunk.extension = extension
+        if extension in ('bnk', 'wpk'):
+            data = chunk_data
+            chunk.compression_type = WADCompressionType.Raw
+        else:
+            data = pyzstd.compress(chunk_data)
+            chunk.compression_type = WADCompressionType.Zstd
+        chunk.compressed_size = len(data)
+        chunk.decompressed_size = len(chunk_data)
+        chunk.checksum = xxh3_64(data).intdigest()
+        self.chunks.append(chunk)
+        self.datas.append(data)
+        return chunk
+
+    def layout(self):
+        # hack: the first chunk start at 272 (because we write version 3.3)
+        offset = 272 + len(self.chunks) * 32
+        seen = {}
+        for chunk, data in zip(self.chunks, self.datas):
+            key = (chunk.checksum, chunk.compressed_size, chunk.decompressed_size)
+            duped_chunk = seen.get(key)
+            if duped_chunk != None:
+                # same data already laid out, point to it instead of writing again
+                duped_chunk.duplicated = True
+                chunk.duplicated = True
+                chunk.offset = duped_chunk.offset
+            else:
+                seen[key] = chunk
+                chunk.offset = offset
+                offset += len(data)
+        return offset
+
+    def write(self, f):
+        # f can be any writable file object, it is never seeked
+        size = self.layout()
+        with BytesStream(BytesIO()) as toc:
+            toc.write_s('RW')  # signature
+            toc.write_u8(3, 3)  # version
+            toc.write(b'\x00' * 256)  # pad 256 bytes
+            toc.write_u64(0)  # wad checksum
+            toc.write_u32(len(self.chunks))
+            for chunk in self.chunks:
+                toc.write_u64(WADHasher.raw_or_hex_to_hash(chunk.hash))
+                toc.write_u32(
+                    chunk.offset,
+                    chunk.compressed_size,
+                    chunk.decompressed_size
+                )
+                toc.write_u8(chunk.compression_type.value)
+                toc.write_b(chunk.duplicated)
+                toc.write_u16(0)
+                toc.write_u64(chunk.checksum)
+            f.write(toc.raw())
+        # append data in toc order, duplicated chunks point back to already written data
+        offset = 272 + len(self.chunks) * 32
+        for chunk, data in zip(self.chunks, self.datas):
+            if chunk.offset == offset:
+                f.write(data)
+                offset += len(data)
+        return size
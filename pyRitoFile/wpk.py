@@ -1,4 +1,5 @@
 from .stream import BytesStream
+import os
 
 
 class WPKWem:
@@ -35,14 +36,8 @@ class WPK:
             self.version, = bs.read_u32()
             # read wems offset in wpk
             wem_count, = bs.read_u32()
-            self.wems = [WPKWem() for i in range(wem_count)]
-            for wem in self.wems:
-                wem.offset, = bs.read_u32()
-            # remove any wem that has offset 0 
-            for wem in self.wems:
-                if wem.offset == 0:
-                    self.wems.remove(wem)
-            wem_count = len(self.wems)
+            # skip any wem that has offset 0
+            self.wems = [WPKWem(offset=offset) for offset in bs.read_u32(wem_count) if offset != 0]
             # now actually read wem info 
             for wem in self.wems:
                 bs.seek(wem.offset)
@@ -53,40 +48,48 @@ class WPK:
             
             return self
 
+    def iter_wems(self, path, raw=False):
+        # yield (wem, memoryview of wem data) from a wpk that was read
+        yield from zip(self.wems, BytesStream.mapped_slices(
+            path, [(wem.offset, wem.size) for wem in self.wems], raw))
+
+    def extract_wems(self, path, out_dir, raw=False):
+        os.makedirs(out_dir, exist_ok=True)
+        wem_paths = []
+        for wem, data in self.iter_wems(path, raw):
+            wem_path = os.path.join(out_dir, f'{wem.id}.wem')
+            with open(wem_path, 'wb') as f:
+                f.write(data)
+            wem_paths.append(wem_path)
+        return wem_paths
+
     def write(self, path, wem_datas, raw=False):
+        # wem_datas: bytes-like or file-like object for each wem (exactly one each), can be an iterator
         with BytesStream.writer(path, raw) as bs:
             # magic, version
             bs.write_s('r3d2')
             bs.write_u32(1)
-            # wems offsets - write later
+            # wems offsets, wem infos are right after
             wem_count = len(self.wems)
             bs.write_u32(wem_count)
-            for i, wem in enumerate(self.wems):
-                bs.pad(4)
-            # wem infos
+            wem_ids = [str(wem.id) + '.wem' for wem in self.wems]
             wem_offsets = []
-            wem_data_offsets = []
-            for i, wem in enumerate(self.wems):
-                wem_offsets.append(bs.tell())
-                wem.size = len(wem_datas[i])
-                wem_data_offsets.append(bs.tell())
-                bs.pad(4)
-                bs.write_u32(wem.size)
-                wem_id = str(wem.id) + '.wem'
-                bs.write_u32(len(wem_id))
+            wem_offset = 12 + wem_count * 4
+            for wem_id in wem_ids:
+                wem_offsets.append(wem_offset)
+                wem_offset += 12 + len(wem_id) * 2
+            bs.write_u32(*wem_offsets)
+            # wem infos - data offset and size write later
+            for wem_id in wem_ids:
+                bs.write_u32(0, 0, len(wem_id))
                 bs.write_c_sep_0(wem_id)
             # wem datas
-            for i, wem_data in enumerate(wem_datas):
-                data_offset = bs.tell()
-                bs.seek(wem_data_offsets[i])
-                bs.write_u32(data_offset)
-                bs.seek(data_offset)
-                bs.write(wem_data)
-            # wem offsets
-            bs.seek(12)
-            for wem_offset in wem_offsets:
-                bs.write_u32(wem_offset)
+            for wem, wem_data in zip(self.wems, wem_datas, strict=True):
+                wem.offset = bs.tell()
+                wem.size = bs.write_source(wem_data)
+            # data offsets and sizes
+            for i, wem in enumerate(self.wems):
+                bs.seek(wem_offsets[i])
+                bs.write_u32(wem.offset, wem.size)
 
             return bs.raw() if raw else None 
-
-        